@@ -261,7 +261,11 @@ TUNINGS = [
     { "name": "Open G (D G D G B D)",              "strings": ["D", "G", "D", "G", "B", "D"] },
     { "name": "Open D (D A D F# A D)",             "strings": ["D", "A", "D", "F#", "A", "D"] },
     { "name": "Open C (C G C G C E)",              "strings": ["C", "G", "C", "G", "C", "E"] },
-    { "name": "Baritone B (B E A D F# B)",         "strings": ["B", "E", "A", "D", "F#", "B"] }
+    { "name": "Baritone B (B E A D F# B)",         "strings": ["B", "E", "A", "D", "F#", "B"] },
+    { "name": "7‑String (B E A D G B E)",          "strings": ["B", "E", "A", "D", "G", "B", "E"] },
+    { "name": "7‑String Drop A (A E A D G B E)",   "strings": ["A", "E", "A", "D", "G", "B", "E"] },
+    { "name": "8‑String (F# B E A D G B E)",       "strings": ["F#", "B", "E", "A", "D", "G", "B", "E"] },
+    { "name": "8‑String Drop E (E B E A D G B E)", "strings": ["E", "B", "E", "A", "D", "G", "B", "E"] }
 ]
 
 NUM_FRETS = 24
@@ -3,11 +3,7 @@
 import tkinter as tk
 from tkinter import ttk
 from config import NOTES, SCALES, TUNINGS
-import json
-from pathlib import Path
-
-with open(Path(__file__).parent / "chords.json", "r") as f:
-    CHORDS = json.load(f)["chords"]
+from theory import RAW_CHORDS as CHORDS   # cached chords.json, aliases unresolved
 
 class ControlPanel(tk.Frame):
     def __init__(self, master, state, on_change, defer_init=False):
@@ -1,5 +1,6 @@
 import sys, os
 import json
+import socket
 import argparse
 from pathlib import Path
 import tkinter as tk
@@ -14,6 +15,13 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 
+# Load theory.py safely (registered so controls/fretboard share this copy)
+theory_path = Path(__file__).parent / "theory.py"
+spec = importlib.util.spec_from_file_location("theory", theory_path)
+theory = importlib.util.module_from_spec(spec)
+sys.modules["theory"] = theory
+spec.loader.exec_module(theory)
+
 # Core config and app logic
 from config import COLORS, TUNINGS, NOTES, NOTE_TO_COLOR
 from utils import get_contrast_text_color
@@ -21,19 +29,61 @@ from state import AppState
 from controls import ControlPanel
 from fretboard import Fretboard
 
-# Load chord data from JSON (if needed externally)
-with open(Path(__file__).parent / "chords.json", "r") as f:
-    CHORDS = json.load(f)["chords"]
-
-# Load theory.py safely
-theory_path = Path(__file__).parent / "theory.py"
-spec = importlib.util.spec_from_file_location("theory", theory_path)
-theory = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(theory)
-
 SCALES = theory.SCALES
 CHORDS = theory.CHORDS
 
+# ── Live updates from GORD ───────────────────────────────────────────
+LISTEN_POLL_MS = 40
+
+def _listen(root, path, apply_notes):
+    """
+    Bind the datagram socket GORD's fredt_link talks to and poll it from the
+    Tk loop. Only the newest "show" in each batch is drawn.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        try: os.unlink(path)
+        except FileNotFoundError: pass
+        sock.bind(path)
+    except OSError as e:
+        print(f"⚠️  FREDT: cannot listen on {path}: {e}")
+        return
+    sock.setblocking(False)
+
+    def poll():
+        latest = None
+        while True:
+            try:
+                data = sock.recv(65536)
+            except (BlockingIOError, OSError):
+                break
+            try:
+                msg = json.loads(data.decode("utf-8"))
+            except Exception:
+                continue
+            if msg.get("cmd") == "show":
+                latest = msg
+        if latest is not None:
+            apply_notes(latest.get("root"), latest.get("notes") or [])
+            if latest.get("raise"):
+                root.deiconify()
+                root.lift()
+                root.focus_force()
+        root.after(LISTEN_POLL_MS, poll)
+
+    def close():
+        try: sock.close()
+        except Exception: pass
+        try: os.unlink(path)
+        except OSError: pass
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", close)
+    root.after(LISTEN_POLL_MS, poll)
+
+
 def main():
     root = tk.Tk()
 
@@ -56,6 +106,7 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--root", default="")
     parser.add_argument("--notes", default="")   # comma-separated: C,Eb,G
+    parser.add_argument("--listen", default="")  # socket path: stay up, take updates from GORD
     args = parser.parse_args()
     incoming_root  = args.root or None
     incoming_notes = [s.strip() for s in args.notes.split(",") if s.strip()]
@@ -141,8 +192,14 @@ def main():
             cell.bind("<Button-1>", lambda e: toggle_status_colors())
 
 
-    # ── Apply CLI args AFTER controls + fretboard exist ─────────────────
-    if incoming_notes:
+    # ── Show a root + note set (CLI args, or pushed live by GORD) ───────
+    def apply_notes(incoming_root, incoming_notes):
+        incoming_notes = [n for n in incoming_notes if n in NOTES]
+        if not incoming_notes:
+            return
+        if incoming_root not in NOTES:
+            incoming_root = incoming_notes[0]
+
         # 1) basic root + note set
         state.selected_notes = set(incoming_notes)
         state.root = NOTES.index(incoming_root)
@@ -151,6 +208,8 @@ def main():
         state.mode  = None          # disable scale / chord colouring
         state.scale = None
         state.chord = None
+        controls.chord_var.set("")  # a previous push may have matched
+        controls.scale_var.set("")
 
         # 2) identify matching chord or scale
         pcs = sorted((NOTES.index(n) - state.root) % 12 for n in incoming_notes)
@@ -183,6 +242,11 @@ def main():
         # 3) final redraw now that EVERY widget exists
         update()
 
+    if incoming_notes:
+        apply_notes(incoming_root, incoming_notes)
+
+    if args.listen:
+        _listen(root, args.listen, apply_notes)
 
 
 
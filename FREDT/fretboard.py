@@ -1,20 +1,50 @@
 # fretboard.py
 
 import tkinter as tk
-from pathlib import Path
-import json
+from functools import lru_cache
 
 from config import NOTES, NOTE_TO_COLOR, TUNINGS, SCALES, NUM_FRETS
 from utils import note_index, shift_note, get_contrast_text_color
 
-# Load chord definitions ------------------------------------------------------
-with open(Path(__file__).parent / "chords.json", "r") as f:
-    CHORDS = json.load(f)["chords"]
+# Chord definitions (chords.json as written, via the theory cache) -------------
+from theory import RAW_CHORDS as CHORDS
+
+
+# ── Geometry (px) ------------------------------------------------------------
+CELL_W, CELL_H = 44, 36
+HEADER_H       = 30
+GAP            = 2
+FONT           = ("Arial", 12, "bold")
+FONT_ROOT      = ("Arial", 12, "bold", "underline")
+NEUTRAL        = ("#111", "#444", False)          # (bg, fg, underline) after clear()
+
+
+@lru_cache(maxsize=None)
+def tuning_table(tuning_idx: int, num_frets: int = NUM_FRETS) -> tuple:
+    """Per tuning, top row first: ((note name, pc) for frets 0..num_frets) per string."""
+    strings = TUNINGS[tuning_idx]["strings"][::-1]
+    return tuple(
+        tuple((shift_note(open_note, f), note_index(shift_note(open_note, f)))
+              for f in range(num_frets + 1))
+        for open_note in strings
+    )
+
+
+@lru_cache(maxsize=None)
+def _note_style(note: str) -> tuple:
+    bg = NOTE_TO_COLOR[note]
+    return bg, get_contrast_text_color(bg)
 
 
 class Fretboard(tk.Frame):
-    """Reusable 6‑string fretboard widget that *self‑heals* when certain
-    attributes (mode / scale / chord) are missing from the shared AppState.
+    """Reusable fretboard widget (any string count, any fret count) that
+    *self‑heals* when certain attributes (mode / scale / chord) are missing
+    from the shared AppState.
+
+    Drawn on one Canvas: a rectangle + text item per cell, fed from a
+    cached per-tuning note table. Repaints only touch the items whose
+    colour/underline/label changed since the last paint; the items are
+    rebuilt only when a tuning changes the string count.
 
     The colouring rules are unified:
         • **Scale mode**   – every scale tone coloured, root underlined.
@@ -25,97 +55,117 @@ class Fretboard(tk.Frame):
     """
 
     # ---------------------------------------------------------------------
-    def __init__(self, master, state):
+    def __init__(self, master, state, num_frets=NUM_FRETS):
         super().__init__(master, bg="#000")
         self.state = state
-        self.fret_cells: list[list[tk.Label]] = []  # [string][fret]
+        self.num_frets = num_frets
+        self.canvas = tk.Canvas(self, bg="#000", highlightthickness=0, bd=0)
+        self.canvas.pack()
+        self.cells: list[list[tuple[int, int]]] = []   # [string][fret] → (rect id, text id)
+        self._shown: list[list[tuple]] = []            # [string][fret] → (bg, fg, underline)
+        self._labels: list[list[str]] = []             # [string][fret] → note text shown
+        self._tuning = None
         self._build_grid()
 
     # ------------------------------------------------------------------ UI ---
     def _build_grid(self):
-        """Build the header + 6 × (NUM_FRETS + 1) label matrix."""
-        # Clear any previous children (makes resetting simpler)
-        for w in self.winfo_children():
-            w.destroy()
-        self.fret_cells.clear()
-
-        # ── Fret‑number header row -------------------------------------
-        marker_frets = {0, 3, 5, 7, 9, 12, 15, 17, 19, 21, 24}
-        for f in range(NUM_FRETS + 1):
-            fg = "#fff" if f in marker_frets else "#888"
-            tk.Label(
-                self, text=str(f), width=4, height=2,
-                font=("Arial", 12, "bold"), bg="#111", fg=fg,
-                relief="flat"
-            ).grid(row=0, column=f, padx=1, pady=1, sticky="nsew")
-
-        # ── Six‑string rows --------------------------------------------
-        strings = TUNINGS[self.state.tuning]["strings"][::-1]  # low→high
-        for s_idx, _ in enumerate(strings):
-            row: list[tk.Label] = []
-            for fret in range(NUM_FRETS + 1):
-                lbl = tk.Label(
-                    self, width=4, height=2,
-                    font=("Arial", 12, "bold"),
-                    relief="ridge", bd=1,
-                    bg="#111", fg="#aaa"
-                )
-                lbl.grid(row=s_idx + 1, column=fret, padx=1, pady=1, sticky="nsew")
-                row.append(lbl)
-            self.fret_cells.append(row)
+        """(Re)build the header + strings × (num_frets + 1) cell items."""
+        c = self.canvas
+        c.delete("all")
+        self.cells.clear()
+        self._shown.clear()
+        self._labels.clear()
+        self._tuning = self.state.tuning
+        table = tuning_table(self._tuning, self.num_frets)
+
+        cols = self.num_frets + 1
+        c.config(width=cols * (CELL_W + GAP), height=HEADER_H + len(table) * (CELL_H + GAP))
+
+        # ── Fret‑number header row (dots at 3 5 7 9 12 …) ---------------
+        for f in range(cols):
+            x0 = f * (CELL_W + GAP)
+            fg = "#fff" if f % 12 in (0, 3, 5, 7, 9) else "#888"
+            c.create_rectangle(x0, 0, x0 + CELL_W, HEADER_H - GAP, fill="#111", outline="")
+            c.create_text(x0 + CELL_W / 2, (HEADER_H - GAP) / 2, text=str(f), font=FONT, fill=fg)
+
+        # ── String rows ---------------------------------------------------
+        bg, fg, _ = NEUTRAL
+        for s_idx, row_notes in enumerate(table):
+            y0 = HEADER_H + s_idx * (CELL_H + GAP)
+            row = []
+            for f, (note, _pc) in enumerate(row_notes):
+                x0 = f * (CELL_W + GAP)
+                rect = c.create_rectangle(x0, y0, x0 + CELL_W, y0 + CELL_H, fill=bg, outline="#333")
+                text = c.create_text(x0 + CELL_W / 2, y0 + CELL_H / 2, text=note, font=FONT, fill=fg)
+                row.append((rect, text))
+            self.cells.append(row)
+            self._shown.append([NEUTRAL] * len(row))
+            self._labels.append([note for note, _pc in row_notes])
+
+    def _retune(self):
+        """Adopt state.tuning: same grid shape → relabel changed cells only; else rebuild."""
+        table = tuning_table(self.state.tuning, self.num_frets)
+        if len(table) != len(self.cells) or any(len(r) != len(c) for r, c in zip(table, self.cells)):
+            self._build_grid()
+            return
+        self._tuning = self.state.tuning
+        for s_idx, row_notes in enumerate(table):
+            for fret, (note, _pc) in enumerate(row_notes):
+                if self._labels[s_idx][fret] != note:
+                    self.canvas.itemconfigure(self.cells[s_idx][fret][1], text=note)
+                    self._labels[s_idx][fret] = note
 
     # ------------------------------------------------------------ PAINTING ---
-    def update_display(self):
-        """Re‑compute colours anytime state changes, **safely** even if the
-        hosting app’s ``AppState`` lacks mode/scale/chord attributes."""
-        self.clear()
-
-        # ── Pull attributes defensively --------------------------------
+    def _target_pcs(self):
+        """(pcs to highlight, root pc) from state, defensively."""
         mode        = getattr(self.state, "mode", None)
         scale_idx   = getattr(self.state, "scale", None)
         chord_idx   = getattr(self.state, "chord", None)
         chord_keys  = getattr(self.state, "chord_keys", [])
         root_pc     = getattr(self.state, "root", None) or 0  # fall back to C
 
-        target_pcs: set[int]
-        chord_pcs:  set[int] = set()
-
-        # -------- Determine which pitch‑classes to highlight ------------
         if mode == "scale" and scale_idx is not None:
             scale_data = list(SCALES.values())[scale_idx]
-            target_pcs = {(root_pc + iv) % 12 for iv in scale_data.get("intervals", [])}
+            return {(root_pc + iv) % 12 for iv in scale_data.get("intervals", [])}, root_pc
 
-        elif mode == "chord" and chord_idx is not None and chord_keys:
+        if mode == "chord" and chord_idx is not None and chord_keys:
             key = chord_keys[chord_idx]
             ivs = CHORDS.get(key, {}).get("intervals", [])
-            chord_pcs = {(root_pc + iv) % 12 for iv in ivs}
-            target_pcs = chord_pcs
-
-        else:  # Raw note‑set (FREDT launched via --notes or Build mode)
-            raw = getattr(self, "notes_to_draw", None) or getattr(self.state, "selected_notes", [])
-            target_pcs = {note_index(n) for n in raw}
-            chord_pcs  = target_pcs  # treat every selected note as a chord‑tone
-
-        # -------- Colour the grid --------------------------------------
-        strings = TUNINGS[self.state.tuning]["strings"][::-1]
-        for s_idx, open_note in enumerate(strings):
-            for fret in range(NUM_FRETS + 1):
-                lbl = self.fret_cells[s_idx][fret]
-                note = shift_note(open_note, fret)
-                pc = note_index(note)
+            return {(root_pc + iv) % 12 for iv in ivs}, root_pc
+
+        # Raw note‑set (FREDT launched via --notes or Build mode)
+        raw = getattr(self, "notes_to_draw", None) or getattr(self.state, "selected_notes", [])
+        return {note_index(n) for n in raw}, root_pc
+
+    def update_display(self):
+        """Re‑compute colours anytime state changes, **safely** even if the
+        hosting app’s ``AppState`` lacks mode/scale/chord attributes."""
+        if self.state.tuning != self._tuning:
+            self._retune()
 
+        target_pcs, root_pc = self._target_pcs()
+        table = tuning_table(self._tuning, self.num_frets)
+        for s_idx, row_notes in enumerate(table):
+            for fret, (note, pc) in enumerate(row_notes):
                 if pc in target_pcs:
-                    bg = NOTE_TO_COLOR[note]
-                    fg = get_contrast_text_color(bg)
-                    style = ("Arial", 12, "bold", "underline") if pc == root_pc else ("Arial", 12, "bold")
-                    lbl.config(text=note, bg=bg, fg=fg, font=style)
+                    bg, fg = _note_style(note)
+                    look = (bg, fg, pc == root_pc)
                 else:
-                    lbl.config(text=note, bg="#000000", fg="#444444", font=("Arial", 12, "bold"))
+                    look = ("#000000", "#444444", False)
+                self._paint(s_idx, fret, look)
+
+    def _paint(self, s_idx, fret, look):
+        if self._shown[s_idx][fret] == look:
+            return
+        rect, text = self.cells[s_idx][fret]
+        bg, fg, underline = look
+        self.canvas.itemconfigure(rect, fill=bg)
+        self.canvas.itemconfigure(text, fill=fg, font=FONT_ROOT if underline else FONT)
+        self._shown[s_idx][fret] = look
 
     # ---------------------------------------------------------------- UTIL ---
     def clear(self):
         """Reset the board to the neutral dark‑grey grid."""
-        for row in self.fret_cells:
-            for lbl in row:
-                note = lbl.cget("text") or ""  # preserve displayed letter if any
-                lbl.config(text=note, bg="#111", fg="#444", font=("Arial", 12, "bold"))
+        for s_idx, row in enumerate(self.cells):
+            for fret in range(len(row)):
+                self._paint(s_idx, fret, NEUTRAL)
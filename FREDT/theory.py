@@ -1,21 +1,22 @@
-import json
+import importlib.util
 from pathlib import Path
 
 # 🔒 Ensure paths are relative to this file's folder
 _base_dir = Path(__file__).parent
-_scales_path = _base_dir / 'scales.json'
-_chords_path = _base_dir / 'chords.json'
 
-# 🎼 Load scales from JSON
-with open(_scales_path, 'r', encoding='utf-8') as f:
-    _scales_json = json.load(f)
-    _raw_scales = _scales_json.get('scales', {})
 
-# 🎸 Load chords and intervals from JSON
-with open(_chords_path, 'r', encoding='utf-8') as f:
-    _chords_json = json.load(f)
-    _raw_chords = _chords_json.get('chords', {})
-    INTERVALS = _chords_json.get('intervals', {})
+def _load_theory_cache():
+    """GORD's shared theory_cache (one folder up), or None when run standalone."""
+    path = _base_dir.parent / 'theory_cache.py'
+    if not path.exists():
+        return None
+    try:
+        spec = importlib.util.spec_from_file_location('theory_cache', path)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        return mod
+    except Exception:
+        return None
 
 
 def _resolve_aliases(raw_data: dict) -> dict:
@@ -34,9 +35,34 @@ def _resolve_aliases(raw_data: dict) -> dict:
     return resolved
 
 
+def _compile(scales_json: dict, chords_json: dict) -> dict:
+    raw_chords = chords_json.get('chords', {})
+    return {
+        'SCALES':     _resolve_aliases(scales_json.get('scales', {})),
+        'CHORDS':     _resolve_aliases(raw_chords),
+        'RAW_CHORDS': raw_chords,
+        'INTERVALS':  chords_json.get('intervals', {}),
+    }
+
+
+# 🎼 Load scales/chords — from the compiled cache when GORD is alongside
+_cache = _load_theory_cache()
+if _cache is not None:
+    _tables = _cache.load(str(_base_dir), _compile, name='fredt_theory',
+                          deps=(str(Path(__file__).resolve()),))
+else:
+    import json
+    with open(_base_dir / 'scales.json', 'r', encoding='utf-8') as f:
+        _scales_json = json.load(f)
+    with open(_base_dir / 'chords.json', 'r', encoding='utf-8') as f:
+        _chords_json = json.load(f)
+    _tables = _compile(_scales_json, _chords_json)
+
 # 🎹 Final lookup tables
-SCALES = _resolve_aliases(_raw_scales)
-CHORDS = _resolve_aliases(_raw_chords)
+SCALES     = _tables['SCALES']
+CHORDS     = _tables['CHORDS']
+RAW_CHORDS = _tables['RAW_CHORDS']     # chords.json as written (aliases unresolved)
+INTERVALS  = _tables['INTERVALS']
 
 
 def get_scale_keys(order: str = 'length_then_alpha') -> list:
@@ -3,28 +3,13 @@ import tkinter as tk
 from tkinter import simpledialog
 from config import COLORS, NOTE_TO_COLOR
 from utils import resource_path
-from chain_runner import ChainRunner
 from sequence_engine import SequenceGenerator
-
-
-# Minimal ArpSnapshot template for now
-def make_empty_snapshot():
-    return {
-        'root': None,
-        'bpm': None,
-        'scale': None,
-        'scale_notes': [],
-        'selected_intervals': [],
-        'extension_octaves': {},
-        'direction_mode': None,
-        'gate_pct': None,
-        'subdivision': None,
-        'name': '',
-        'loop_count': 1
-    }
+from chain_model import ChainModel, make_empty_snapshot
 
 
 class ChainArpsWindow(tk.Toplevel):
+    VISIBLE_ROWS = 16   # pooled row widgets; longer chains scroll through them
+
     def __init__(self, master, state, midi_engine, on_change):
         super().__init__(master)
         self.title("CHAIN ARPS")
@@ -48,12 +33,17 @@ class ChainArpsWindow(tk.Toplevel):
         self.midi_engine = midi_engine
         self.on_change = on_change
 
+        # Rows live in the model; self.rows is a pool of row widgets bound to
+        # model rows [self._top, self._top + self._shown) on every repaint
+        self.model = ChainModel(self.state)
+        self.max_rows = ChainModel.MAX_ROWS
         self.rows = []
-        self.max_rows = 16
-
-        # Init chain_arps_list if not already populated
-        while len(self.state.chain_arps_list) < 8:
-            self.state.chain_arps_list.append(None)
+        self._top = 0                  # first model row on screen
+        self._shown = 0                # pooled rows currently packed (a prefix of self.rows)
+        self._scroll_shown = False
+        self._tickers = {}             # model row → (text, fg) once the runner has ticked it
+        self._painting = False         # repaint sets Tk vars; their traces must not write back
+        self._painted = {}             # widget → options last painted (shadow model)
 
         self._build_ui()
 
@@ -65,22 +55,20 @@ class ChainArpsWindow(tk.Toplevel):
         self.main_frame = tk.Frame(self, bg=COLORS['bg'])
         self.main_frame.pack(fill='both', expand=True, padx=12, pady=12)
 
-        # Rows container
+        # Rows container: pooled rows + a scrollbar once the chain outgrows the pool
         self.rows_container = tk.Frame(self.main_frame, bg=COLORS['bg'])
         self.rows_container.pack(fill='both', expand=True)
-
-        # --- Initial rows: one per snapshot that is *not* marked hidden ----------
-        visible_snaps = [
-            snap for snap in self.state.chain_arps_list
-            if snap is not None and not snap.get('hidden', False)
-        ]
-
-        # Always show at least one row
-        if not visible_snaps:
-            visible_snaps = [None]
-
-        for _ in visible_snaps:
-            self._add_row()
+        self.rows_frame = tk.Frame(self.rows_container, bg=COLORS['bg'])
+        self.rows_frame.pack(side='left', fill='both', expand=True)
+        self.scrollbar = tk.Scrollbar(self.rows_container, orient='vertical', command=self._on_scroll)
+        self.bind('<MouseWheel>', self._on_wheel)
+        self.bind('<Button-4>', lambda e: self._scroll_to(self._top - 1))
+        self.bind('<Button-5>', lambda e: self._scroll_to(self._top + 1))
+
+        # --- Initial rows: the model shows one per snapshot not marked hidden ---
+        self._repaint_rows()
+        # 🔄 tell the runner & save
+        self._refresh_and_save()
 
 
                     
@@ -173,7 +161,7 @@ class ChainArpsWindow(tk.Toplevel):
                 try:    loops = max(1, int(str(raw).strip()))
                 except: loops = 1
 
-            slots.append({"notes": notes, "loops": loops})
+            slots.append({"notes": notes, "loops": loops, "idx": i})   # idx: row, for event ticks
 
         return slots
 
@@ -215,11 +203,15 @@ class ChainArpsWindow(tk.Toplevel):
 
         
     def _on_name_change(self, idx, name_var):
+        if self._painting or idx is None:
+            return
         # Push latest name into snapshot
-        self.state.chain_arps_list[idx]['name'] = name_var.get()
+        self.model.set_name(idx, name_var.get())
 
 
     def _on_loops_change(self, idx, loops_var):
+        if self._painting or idx is None:
+            return
         val_str = (loops_var.get() or "").strip().lower()
         if val_str in ('x', 'none', ''):
             val, disp = 'X', 'X'         # None/inf in the runner
@@ -230,9 +222,11 @@ class ChainArpsWindow(tk.Toplevel):
                 val = 1
             disp = val
 
-        self.state.chain_arps_list[idx]['loop_count'] = val
-        if idx < len(self.rows):
-            self.rows[idx]['ticker_lbl'].config(text=f"0/{disp}")
+        self.model.set_loops(idx, val)
+        self._tickers.pop(idx, None)      # ticker falls back to f"0/{disp}"
+        row = self._visible_row(idx)
+        if row is not None:
+            self._paint_ticker(row)
 
         # make the runner pick up the new loop count
         self._refresh_and_save()
@@ -272,9 +266,8 @@ class ChainArpsWindow(tk.Toplevel):
             except Exception: pass
             self.state.chain_runner = None
 
-        self.state.chain_runner = ChainRunner(
+        self.state.chain_runner = self.midi_engine.make_chain_runner(
             self.state,
-            self.midi_engine,
             self._update_ticker_for_row,
             self._on_chain_complete,
             global_loops=self.state.chain_global_loops,
@@ -293,65 +286,59 @@ class ChainArpsWindow(tk.Toplevel):
 
             
 
-    # ── ADD / BUILD A ROW ─────────────────────────────────────────────
-    def _add_row(self):
-        if len(self.rows) >= self.max_rows:
-            return
-
-        idx = len(self.rows)
-        if idx >= len(self.state.chain_arps_list):
-            self.state.chain_arps_list.append(None)
-
-        row_frame = tk.Frame(self.rows_container, bg=COLORS['bg'])
-        row_frame.pack(fill='x', pady=2)
+    # ── POOLED ROW WIDGETS ────────────────────────────────────────────
+    def _make_row(self):
+        """One recycled row; its buttons act on whatever model row it shows (row['idx'])."""
+        row = {'idx': None}
+        row_frame = tk.Frame(self.rows_frame, bg=COLORS['bg'])
 
         # --- First line: button frame ---------------------------------
         button_frame = tk.Frame(row_frame, bg=COLORS['bg'])
         button_frame.pack(fill='x')
-        
 
-        name_var = tk.StringVar(value=f"ARP {idx+1}")
+
+        name_var = tk.StringVar(value="")
         tk.Entry(button_frame, textvariable=name_var, width=12,
                  bg='black', fg='white', font=('Fixedsys', 18)).pack(side='left', padx=4)
-        name_var.trace_add("write", lambda *args, idx=idx, nv=name_var: self._on_name_change(idx, nv))
-        
+        name_var.trace_add("write", lambda *args, r=row: self._on_name_change(r['idx'], r['name_var']))
+
 
         # Mute button
         mute_btn = tk.Button(button_frame, text="M", width=2,
                              state='disabled',
                              bg='gray25', fg='white', font=('Fixedsys', 10),
-                             command=lambda rf=row_frame: self._on_mute_toggle(rf))
+                             command=lambda r=row: self._on_mute_toggle(r['idx']))
         mute_btn.pack(side='left', padx=2)
 
         # Solo button
         solo_btn = tk.Button(button_frame, text="S", width=2,
                              state='disabled',
                              bg='gray25', fg='white', font=('Fixedsys', 10),
-                             command=lambda rf=row_frame: self._on_solo_toggle(rf))
+                             command=lambda r=row: self._on_solo_toggle(r['idx']))
         solo_btn.pack(side='left', padx=2)
 
 
         snap_btn = tk.Button(button_frame, text="Pull In", width=8,
-                             command=lambda rf=row_frame: self._on_snap(rf),
+                             command=lambda r=row: self._on_snap(r['idx']),
                              bg=COLORS['button'], fg=COLORS['text'], font=('Fixedsys', 10))
         snap_btn.pack(side='left', padx=2)
 
         new_btn = tk.Button(button_frame, text="Clear", width=6,
-                            command=lambda rf=row_frame: self._on_new(rf),
+                            command=lambda r=row: self._on_new(r['idx']),
                             bg=COLORS['button'], fg=COLORS['text'], font=('Fixedsys', 10))
         new_btn.pack(side='left', padx=2)
 
 
         up_btn = tk.Button(button_frame, text="↑", width=2,
-                           command=lambda rf=row_frame: self._move_row_up(rf),
+                           command=lambda r=row: self._move_row_up(r['idx']),
                            bg=COLORS['button'], fg=COLORS['text'], font=('Fixedsys', 10))
         up_btn.pack(side='left', padx=2)
 
         down_btn = tk.Button(button_frame, text="↓", width=2,
-                             command=lambda rf=row_frame: self._move_row_down(rf),
+                             command=lambda r=row: self._move_row_down(r['idx']),
                              bg=COLORS['button'], fg=COLORS['text'], font=('Fixedsys', 10))
         down_btn.pack(side='left', padx=2)
-         
+
 
         ticker_lbl = tk.Label(button_frame, text="0/1",
                               bg=COLORS['bg'], fg=COLORS['text'],
@@ -361,7 +348,7 @@ class ChainArpsWindow(tk.Toplevel):
         loops_entry = tk.Entry(button_frame, textvariable=loops_var, width=2,
                                bg='black', fg='white', font=('Fixedsys', 18))
         loops_entry.pack(side='right', padx=4)
-        loops_var.trace_add("write", lambda *args, idx=idx, lv=loops_var: self._on_loops_change(idx, lv))
+        loops_var.trace_add("write", lambda *args, r=row: self._on_loops_change(r['idx'], r['loops_var']))
 
 
         # --- Second line: details frame ---------------------------------
@@ -375,7 +362,7 @@ class ChainArpsWindow(tk.Toplevel):
         details_lbl.configure(state='disabled')
 
         # --- Book-keeping ----------------------------------------------
-        self.rows.append({
+        row.update({
             'frame':       row_frame,
             'name_var':    name_var,
             'loops_var':   loops_var,
@@ -383,122 +370,204 @@ class ChainArpsWindow(tk.Toplevel):
             'details_lbl': details_lbl,
             'mute_btn': mute_btn,
             'solo_btn': solo_btn,
-            'idx':         idx
+            'details_sig': None,
         })
+        return row
+
+    def _repaint_rows(self):
+        """Bind the pooled rows to the model rows on screen and repaint what changed."""
+        n = len(self.model)
+        self._top = max(0, min(self._top, n - self.VISIBLE_ROWS))
+        want = min(n, self.VISIBLE_ROWS)
+        while len(self.rows) < want:
+            self.rows.append(self._make_row())
+
+        # on-screen rows are always a prefix of the pool: pack/unpack only at the tail
+        for row in self.rows[self._shown:want]:
+            row['frame'].pack(fill='x', pady=2)
+        for row in self.rows[want:self._shown]:
+            row['frame'].pack_forget()
+            row['idx'] = None
+        self._shown = want
+
+        for k, row in enumerate(self.rows[:want]):
+            row['idx'] = self._top + k
+            self._paint_row(row)
+
+        if n > self.VISIBLE_ROWS:
+            self.scrollbar.set(self._top / n, (self._top + want) / n)
+            if not self._scroll_shown:
+                self.scrollbar.pack(side='right', fill='y', before=self.rows_frame)
+                self._scroll_shown = True
+        elif self._scroll_shown:
+            self.scrollbar.pack_forget()
+            self._scroll_shown = False
+
+    def _visible_row(self, idx):
+        """Pooled row showing model row `idx`, or None if it is scrolled off."""
+        if idx is None:
+            return None
+        k = idx - self._top
+        return self.rows[k] if 0 <= k < self._shown else None
+
+    def _repaint_index(self, idx):
+        row = self._visible_row(idx)
+        if row is not None:
+            self._paint_row(row)
+
+    # ── Scrolling ─────────────────────────────────────────────
+    def _scroll_to(self, top):
+        self._top = top
+        self._repaint_rows()
+
+    def _reveal_row(self, idx):
+        # scroll just enough to bring `idx` on screen, then repaint
+        if idx < self._top:
+            self._top = idx
+        elif idx >= self._top + self.VISIBLE_ROWS:
+            self._top = idx - self.VISIBLE_ROWS + 1
+        self._repaint_rows()
+
+    def _on_scroll(self, *args):
+        # Scrollbar command: ("moveto", fraction) | ("scroll", n, "units"|"pages")
+        n = len(self.model)
+        if args and args[0] == 'moveto':
+            self._scroll_to(int(round(float(args[1]) * n)))
+        elif args and args[0] == 'scroll':
+            step = self.VISIBLE_ROWS if args[2] == 'pages' else 1
+            self._scroll_to(self._top + int(args[1]) * step)
+
+    def _on_wheel(self, event):
+        self._scroll_to(self._top - (1 if event.delta > 0 else -1))
+
+    # ── Painting (shadow model: only changed options reach Tk) ────────
+    def _paint(self, widget, **opts):
+        """widget.config(**opts), limited to options that differ from the last paint."""
+        last = self._painted.setdefault(widget, {})
+        changed = {k: v for k, v in opts.items() if last.get(k) != v}
+        if changed:
+            widget.config(**changed)
+            last.update(changed)
+
+    @staticmethod
+    def _loop_disp(loop_count):
+        return 'X' if loop_count is None or str(loop_count).strip().lower() in ('none', 'x') else loop_count
+
+    def _paint_ticker(self, row):
+        idx = row['idx']
+        snap = self.model.get(idx) or {}
+        text, fg = self._tickers.get(idx) or (f"0/{self._loop_disp(snap.get('loop_count', 1))}",
+                                              self.default_ticker_fg)
+        self._paint(row['ticker_lbl'], text=text, fg=fg)
+
+    def _paint_row(self, row):
+        idx = row['idx']
+        snap = self.model.get(idx) or make_empty_snapshot()
+
+        # Tk vars: set only when they differ (never fights an entry being typed in)
+        self._painting = True
+        try:
+            name = snap.get('name') or f"ARP {idx+1}"     # default label: display only
+            if row['name_var'].get() != name:
+                row['name_var'].set(name)
+            loops = str(self._loop_disp(snap.get('loop_count', 1)))
+            if row['loops_var'].get() != loops:
+                row['loops_var'].set(loops)
+        finally:
+            self._painting = False
+        self._paint_ticker(row)
+
+        # Mute/solo buttons: enabled, coloured from the snapshot
+        self._paint(row['mute_btn'], state='normal', fg='white',
+                    bg='red' if snap.get('muted', False) else 'gray25')
+        self._paint(row['solo_btn'], state='normal', fg='white',
+                    bg='blue' if snap.get('solo', False) else 'gray25')
+
+        # Details line: rewritten only when its content changes
+        notes_list  = snap.get('display_notes') or snap.get('selected_notes') or snap.get('scale_notes') or []
+        total_notes = snap.get('total_notes', 0)
+        root        = snap.get('root')
+        sig = (root, snap.get('scale'), total_notes, tuple(notes_list))
+        if sig == row['details_sig']:
+            return
+        row['details_sig'] = sig
 
+        details_lbl = row['details_lbl']
+        details_lbl.configure(state='normal')
+        details_lbl.delete('1.0', tk.END)
+        details_lbl.insert(tk.END, "Root: ")
+        if root:
+            details_lbl.insert(tk.END, root, root)
+        details_lbl.insert(tk.END, f"  Scale: {snap.get('scale')}  ")
+        details_lbl.insert(tk.END, f"Notes: ({total_notes}) ")
+        for note in notes_list:
+            details_lbl.insert(tk.END, note + ' ', note)
+        for note in notes_list + ([root] if root else []):
+            color = NOTE_TO_COLOR.get(note, COLORS['text'])
+            details_lbl.tag_config(note, foreground=color)
+        details_lbl.tag_configure("center", justify='center')
+        details_lbl.tag_add("center", "1.0", "end")
+        details_lbl.configure(state='disabled')
 
-        # Ensure there’s a snapshot to edit
-        if self.state.chain_arps_list[idx] is None:
-            self.state.chain_arps_list[idx] = make_empty_snapshot()
-        # Row is now visible → never considered hidden
-        self.state.chain_arps_list[idx]['hidden'] = False
-        # If previously muted, unmute it now that row is visible again
-        
-
-
-        self._apply_snapshot_to_row(idx, self.state.chain_arps_list[idx])
+    # ── ADD / REMOVE A ROW ────────────────────────────────────────────
+    def _add_row(self):
+        idx = self.model.add()
+        if idx is None:
+            return
+        self._tickers.pop(idx, None)
+        self._reveal_row(idx)
 
         # 🔄 tell the runner & save
         self._refresh_and_save()
 
 
-
-    
-
     def _remove_row(self):
         """
         Drumding-style hide:
-        – removes the visible row
+        – removes the last row from the model (and the screen)
         – retains the snapshot in chain_arps_list (so it can be restored)
-        – re-indexes the remaining rows, then refreshes the runner
+        – repaints the visible rows, then refreshes the runner
         """
-        if len(self.rows) <= 1:
+        idx = self.model.remove()
+        if idx is None:
             return  # do not remove the last visible row
+        self._tickers.pop(idx, None)
+        self._repaint_rows()
 
-        if not self.rows:
-            return
-
-        # 1) Which logical slot does the last GUI row point to?
-        idx_removed = self.rows[-1]['idx']
-
-        # 2) Remove the GUI row only
-        row = self.rows.pop()
-        row['frame'].destroy()
-
-        # 3) Mute the matching snapshot so ChainRunner ignores it
-        if idx_removed < len(self.state.chain_arps_list):
-            snap = self.state.chain_arps_list[idx_removed]
-            if snap is not None:
-                snap['muted'] = True
-                snap['hidden'] = True 
-
-
-        # 4) Re-number remaining rows so their idx matches the list
-        for new_idx, row in enumerate(self.rows):
-            row['idx'] = new_idx
-
-        # 5) Tell the runner + save
+        # Tell the runner + save
         self._refresh_and_save()
 
-                        
-    def _row_index(self, row_frame):
-        for i, row in enumerate(self.rows):
-            if row['frame'] == row_frame:
-                return i
-        return -1
-
     # ── Move rows up/down ──────────────────────────────────────
 
-    def _move_row_up(self, row_frame):
-        idx = self._row_index(row_frame)
-        if idx > 0:
-            self.rows[idx], self.rows[idx - 1] = self.rows[idx - 1], self.rows[idx]
-            self.rows[idx]['idx'], self.rows[idx - 1]['idx'] = (
-                self.rows[idx - 1]['idx'], self.rows[idx]['idx'])
-
-            self.state.chain_arps_list[idx], self.state.chain_arps_list[idx - 1] = (
-                self.state.chain_arps_list[idx - 1], self.state.chain_arps_list[idx])
-
-            self._repack_rows()
-            # 🔄 tell the runner & save
-            self._refresh_and_save()
-
-
-    def _move_row_down(self, row_frame):
-        idx = self._row_index(row_frame)
-        if idx < len(self.rows) - 1:
-            self.rows[idx], self.rows[idx + 1] = self.rows[idx + 1], self.rows[idx]
-            self.rows[idx]['idx'], self.rows[idx + 1]['idx'] = (
-                self.rows[idx + 1]['idx'], self.rows[idx]['idx'])
-
-            self.state.chain_arps_list[idx], self.state.chain_arps_list[idx + 1] = (
-                self.state.chain_arps_list[idx + 1], self.state.chain_arps_list[idx])
-
-            self._repack_rows()
-            # 🔄 tell the runner & save
-            self._refresh_and_save()
-
+    def _move_row_up(self, idx):
+        self._move_row(idx, idx - 1 if idx is not None else None)
 
-    def _repack_rows(self):
-        for row in self.rows:
-            row['frame'].pack_forget()
-        for row in self.rows:
-            row['frame'].pack(fill='x', pady=2)
+    def _move_row_down(self, idx):
+        self._move_row(idx, idx + 1 if idx is not None else None)
 
-    def _on_snap(self, row_frame):
-        idx = self._row_index(row_frame)
-        if idx < 0:
+    def _move_row(self, src, dst):
+        if src is None or dst is None or not self.model.move(src, dst):
             return
+        # per-row tickers travel with their row
+        a, b = self._tickers.pop(src, None), self._tickers.pop(dst, None)
+        if a is not None: self._tickers[dst] = a
+        if b is not None: self._tickers[src] = b
+        self._reveal_row(dst)
+        # 🔄 tell the runner & save
+        self._refresh_and_save()
 
-        row = self.rows[idx]
+    def _on_snap(self, idx):
+        cur = self.model.get(idx)
+        if cur is None:
+            return
 
         # Snapshot the subdivision as it is *now* (don’t let UI races mutate it mid-capture)
         subdiv = getattr(self.state, 'subdivision', None)
         if subdiv is None:
             subdiv = self.midi_engine.get_subdivision()
 
-        # Parse per-slot loops from the UI
-        raw = (row['loops_var'].get() or "").strip().lower()
+        # Parse per-slot loops (the loops entry writes through to the snapshot)
+        raw = str(cur.get('loop_count', 1) or "").strip().lower()
         if raw in ('x', 'none', ''):
             loop_count = None
         else:
@@ -520,11 +589,13 @@ class ChainArpsWindow(tk.Toplevel):
             'direction_mode':     self.state.direction_mode,
             'gate_pct':           self.state.gate_pct,
             'subdivision':        int(subdiv),
-            'name':               row['name_var'].get(),
+            'name':               cur.get('name') or f"ARP {idx+1}",
             'loop_count':         loop_count,
             'build_mode_enabled': self.state.build_mode_enabled,
             'alt_seq_enabled':    self.state.alt_seq_enabled,
             'include_turnaround': self.state.include_turnaround,
+            'shuffle_seed':       getattr(self.state, 'shuffle_seed', 0),
+            'stride_n':           getattr(self.state, 'stride_n', 2),
             'diatonic_mode':      self.state.diatonic_mode,
         }
 
@@ -544,13 +615,9 @@ class ChainArpsWindow(tk.Toplevel):
         snapshot['sequence']    = flat
         snapshot['total_notes'] = sum(1 for n in flat if n is not None)
 
-        # Save snapshot into the logical slot
-        self.state.chain_arps_list[idx] = snapshot
-
-        # Update the per-row ticker (UI only)
-        row['ticker_lbl'].config(
-            text=f"0/{snapshot['loop_count'] if snapshot['loop_count'] is not None else 'X'}"
-        )
+        # Save snapshot into the logical slot; its ticker restarts at 0/loops
+        self.model.set(idx, snapshot)
+        self._tickers.pop(idx, None)
 
         # Single refresh + arm after snapshot is complete
         if self.on_change:
@@ -560,27 +627,8 @@ class ChainArpsWindow(tk.Toplevel):
                 pass
         self._refresh_and_save()
 
-        # Details line (paint once)
-        details_lbl = row['details_lbl']
-        notes_list  = snapshot.get('display_notes') or snapshot.get('selected_notes') or snapshot.get('scale_notes') or []
-        total_notes = snapshot.get('total_notes', 0)
-        root        = snapshot.get('root')
-
-        details_lbl.configure(state='normal')
-        details_lbl.delete('1.0', tk.END)
-        details_lbl.insert(tk.END, "Root: ")
-        if root:
-            details_lbl.insert(tk.END, root, root)
-        details_lbl.insert(tk.END, f"  Scale: {snapshot.get('scale')}  ")
-        details_lbl.insert(tk.END, f"Notes: ({total_notes}) ")
-        for note in notes_list:
-            details_lbl.insert(tk.END, note + ' ', note)
-        for note in notes_list + ([root] if root else []):
-            color = NOTE_TO_COLOR.get(note, COLORS['text'])
-            details_lbl.tag_config(note, foreground=color)
-        details_lbl.tag_configure("center", justify='center')
-        details_lbl.tag_add("center", "1.0", "end")
-        details_lbl.configure(state='disabled')
+        # Ticker + details line (paint once, if on screen)
+        self._repaint_index(idx)
 
 
 
@@ -609,11 +657,13 @@ class ChainArpsWindow(tk.Toplevel):
 
             # reset active-row highlight
             if self.active_row_idx is not None:
-                for row in self.rows:
-                    if row['idx'] == self.active_row_idx:
-                        row['ticker_lbl'].config(fg=COLORS['text'])
-                        break
+                prev = self.active_row_idx
+                if prev in self._tickers:
+                    self._tickers[prev] = (self._tickers[prev][0], COLORS['text'])
                 self.active_row_idx = None
+                row = self._visible_row(prev)
+                if row is not None:
+                    self._paint_ticker(row)
 
         # update the GLOBAL ticker either way
         if hasattr(self, "global_ticker"):
@@ -624,52 +674,25 @@ class ChainArpsWindow(tk.Toplevel):
         self.on_change()
 
 
-    def _on_mute_toggle(self, row_frame):
-        idx = self._row_index(row_frame)
-        if idx < 0:
+    def _on_mute_toggle(self, idx):
+        if self.model.toggle_mute(idx) is None:
             return
-
-        snap = self.state.chain_arps_list[idx]
-        snap['muted'] = not snap.get('muted', False)
-
-        btn = self.rows[idx]['mute_btn']
-        if snap['muted']:
-            btn.config(bg='red', fg='white')
-        else:
-            btn.config(bg='gray25', fg='white')
-
-        # If unmuting and SOLO is active, clear SOLO (solo and mute are mutually exclusive)
-        if not snap['muted'] and snap.get('solo'):
-            snap['solo'] = False
-            self.rows[idx]['solo_btn'].config(bg='gray25', fg='white')
+        self._repaint_index(idx)
 
         # Refresh slots
         self._refresh_and_save()
 
-    def _on_solo_toggle(self, row_frame):
-        idx = self._row_index(row_frame)
-        if idx < 0:
+    def _on_solo_toggle(self, idx):
+        if self.model.toggle_solo(idx) is None:
             return
-
-        snap = self.state.chain_arps_list[idx]
-        snap['solo'] = not snap.get('solo', False)
-
-        btn = self.rows[idx]['solo_btn']
-        if snap['solo']:
-            btn.config(bg='blue', fg='white')
-            # If SOLO is now on, force MUTE off
-            if snap.get('muted'):
-                snap['muted'] = False
-                self.rows[idx]['mute_btn'].config(bg='gray25', fg='white')
-        else:
-            btn.config(bg='gray25', fg='white')
+        self._repaint_index(idx)
 
         # Refresh slots
         self._refresh_and_save()
 
 
-    def _on_new(self, row_frame):
-        self._confirm_clear_row(row_frame)
+    def _on_new(self, idx):
+        self._confirm_clear_row(idx)
 
     def _on_save_list(self, row_frame):
         print("[SAVE ROW] TODO: Save this list's data to file.")
@@ -678,7 +701,12 @@ class ChainArpsWindow(tk.Toplevel):
         print("[LOAD ROW] TODO: Load data into this list.")
 
     # ── Confirm Clear popup ───────────────────────────────────
-    def _confirm_clear_row(self, row_frame):
+    def _confirm_clear_row(self, idx):
+        # bind the snapshot, not the index: a move/scroll before "Yes" must
+        # still clear the row the user clicked
+        snap = self.model.get(idx)
+        if snap is None:
+            return
         popup = tk.Toplevel(self)
         popup.title("")
         popup.configure(bg=COLORS['bg'])
@@ -699,7 +727,7 @@ class ChainArpsWindow(tk.Toplevel):
 
         yes_btn = tk.Button(
             btn_frame, text="Yes", width=8,
-            command=lambda: (popup.destroy(), self._clear_row(row_frame))
+            command=lambda: (popup.destroy(), self._clear_row(self.model.index_of(snap)))
         )
         yes_btn.pack(side='left', padx=8)
 
@@ -709,77 +737,15 @@ class ChainArpsWindow(tk.Toplevel):
         )
         no_btn.pack(side='left', padx=8)
         
-    def _apply_snapshot_to_row(self, idx, snapshot):
-        row = self.rows[idx]
-
-        row['name_var'].set(snapshot.get('name') or f"ARP {idx+1}")
-        row['loops_var'].set(snapshot.get('loop_count', 1))
-        loop_count = snapshot.get('loop_count', 1)
-        loop_disp = 'X' if loop_count in (None, 'X', 'x') or str(loop_count).strip().lower() in ('none', 'x') else loop_count
-        row['ticker_lbl'].config(text=f"0/{loop_disp}")
-
-        # Enable mute/solo buttons
-        row['mute_btn'].config(state='normal')
-        row['solo_btn'].config(state='normal')
-
-        # Set button state visually
-        if snapshot.get('muted', False):
-            row['mute_btn'].config(bg='red', fg='white')
-        else:
-            row['mute_btn'].config(bg='gray25', fg='white')
-
-        if snapshot.get('solo', False):
-            row['solo_btn'].config(bg='blue', fg='white')
-        else:
-            row['solo_btn'].config(bg='gray25', fg='white')
-
-
-        sub_val = snapshot.get('subdivision')
-        sub_str = f"1/{sub_val}" if sub_val else "None"
-
-        total_notes = snapshot.get('total_notes', 0)
-
-
-
-        notes_list = snapshot.get('display_notes',
-                                  snapshot.get('selected_notes',
-                                               snapshot.get('scale_notes', [])))
-        if notes_list:
-            notes_disp = f"({total_notes}) " + " ".join(notes_list)
-        else:
-            notes_disp = f"({total_notes}) None"
-
-        details_lbl = row['details_lbl']
-        details_lbl.configure(state='normal')
-        details_lbl.delete('1.0', tk.END)
-
-        # Build display line — same as in _on_snap
-        details_lbl.insert(tk.END, "Root: ")
-        root = snapshot.get('root')
-        if root:
-            details_lbl.insert(tk.END, root, root)
-        details_lbl.insert(tk.END, f" Scale: {snapshot.get('scale')}  ")
-        details_lbl.insert(tk.END, f"Notes: ({total_notes}) ")
-
-
-        # Set tags for each note
-        for note in notes_list + ([root] if root else []):
-            color = NOTE_TO_COLOR.get(note, COLORS['text'])
-            details_lbl.tag_config(note, foreground=color)
-            
-        details_lbl.tag_configure("center", justify='center')
-        details_lbl.tag_add("center", "1.0", "end")
-
-
-        details_lbl.configure(state='disabled')
-
-
     def _refresh_and_save(self):
         """
         Commit UI edits -> rebuild runner slots -> update daemon safely.
         If LINKed & running, we DO NOT re-arm the chain immediately.
-        Instead we queue it to be applied at the next loop boundary
-        (handled in _update_ticker_for_row when current_loop == 1).
+        A daemon with chain_edit gets just the changed slots and swaps them
+        in at its next loop boundary. Otherwise we queue a full re-arm for
+        the next loop boundary (handled in _update_ticker_for_row when
+        current_loop == 1; with the daemon event feed that call lands on
+        the daemon's real boundary).
         """
         # 1) notify state/UI
         if self.on_change:
@@ -806,6 +772,12 @@ class ChainArpsWindow(tk.Toplevel):
 
         # If chain runner is live, defer install to loop boundary
         if cr and getattr(cr, "running", False):
+            try:
+                if self.midi_engine.update_chain(slots):
+                    self._pending_chain = None
+                    return            # daemon hot-swaps at its next boundary
+            except Exception:
+                pass
             self._pending_chain = slots
             self._pending_index = cur  # best effort starting index
             return
@@ -817,11 +789,13 @@ class ChainArpsWindow(tk.Toplevel):
             pass
 
 
-    def _clear_row(self, row_frame):
-        idx = self._row_index(row_frame)
-        if idx >= 0:
-            self.state.chain_arps_list[idx] = make_empty_snapshot()
-            self._apply_snapshot_to_row(idx, self.state.chain_arps_list[idx])
+    def _clear_row(self, idx):
+        if self.model.get(idx) is not None:
+            self.model.clear(idx)
+            self._tickers.pop(idx, None)
+            self._repaint_index(idx)
+            # 🔄 tell the runner & save (a cleared row must stop playing)
+            self._refresh_and_save()
             
 
     # ──────────────────────────────────────────────────────────────
@@ -833,21 +807,20 @@ class ChainArpsWindow(tk.Toplevel):
 
         def apply():
             # 1) revert previously highlighted row (if any)
-            if self.active_row_idx is not None and self.active_row_idx != slot_idx:
-                for r in self.rows:
-                    if r['idx'] == self.active_row_idx:
-                        r['ticker_lbl'].config(fg=self.default_ticker_fg)
-                        break
-
-            # 2) paint current row + update its ticker
-            for row in self.rows:
-                if row['idx'] == slot_idx:
-                    row['ticker_lbl'].config(
-                        text=f"{current_loop}/{loop_disp}",
-                        fg=NOTE_TO_COLOR.get('C', 'red') if is_active else COLORS['text']
-                    )
-                    self.active_row_idx = slot_idx
-                    break
+            prev = self.active_row_idx
+            if prev is not None and prev != slot_idx and prev in self._tickers:
+                self._tickers[prev] = (self._tickers[prev][0], self.default_ticker_fg)
+
+            # 2) current row's ticker; only rows on screen reach Tk
+            if self.model.get(slot_idx) is not None:
+                self._tickers[slot_idx] = (
+                    f"{current_loop}/{loop_disp}",
+                    NOTE_TO_COLOR.get('C', 'red') if is_active else COLORS['text'])
+                self.active_row_idx = slot_idx
+            for i in (prev, slot_idx):
+                row = self._visible_row(i)
+                if row is not None:
+                    self._paint_ticker(row)
 
             # 3) update GLOBAL ticker (if runner present)
             cr = getattr(self.state, "chain_runner", None)
@@ -898,8 +871,8 @@ class ChainArpsWindow(tk.Toplevel):
                 self.state.transport_subdivision = self.midi_engine.get_subdivision()
 
                 # (re)create runner
-                self.state.chain_runner = ChainRunner(
-                    self.state, self.midi_engine,
+                self.state.chain_runner = self.midi_engine.make_chain_runner(
+                    self.state,
                     self._update_ticker_for_row, self._on_chain_complete,
                     global_loops=raw
                 )
@@ -0,0 +1,150 @@
+# chain_model.py — Chain Arps rows as plain data (no Tk)
+#
+# state.chain_arps_list holds one snapshot dict per row. Rows [0, len) are
+# shown; snapshots past that are hidden (muted + hidden) and come back when a
+# row is added again. ChainRunner and the daemon slot builder read the list
+# directly, so the model only owns the row count and the edit rules.
+# Every edit is O(1) on the list and bumps `version`; the window repaints
+# whatever rows are on screen afterwards.
+
+
+# Minimal ArpSnapshot template for now
+def make_empty_snapshot():
+    return {
+        'root': None,
+        'bpm': None,
+        'scale': None,
+        'scale_notes': [],
+        'selected_intervals': [],
+        'extension_octaves': {},
+        'direction_mode': None,
+        'gate_pct': None,
+        'subdivision': None,
+        'name': '',
+        'loop_count': 1
+    }
+
+
+class ChainModel:
+    MAX_ROWS = 512    # set-length chains; CHAIN_REF carries ~400 slots per datagram
+    MIN_SLOTS = 8     # chain_arps_list is padded to at least this many entries
+
+    def __init__(self, state):
+        self.state = state
+        self.version = 0
+        snaps = self.snaps
+        while len(snaps) < self.MIN_SLOTS:
+            snaps.append(None)
+        # one row per snapshot that is *not* marked hidden; always at least one
+        shown = sum(1 for s in snaps if s is not None and not s.get('hidden', False))
+        self.length = max(1, min(shown, self.MAX_ROWS))
+        for i in range(self.length):
+            self._reveal(i)
+
+    @property
+    def snaps(self):
+        return self.state.chain_arps_list
+
+    def __len__(self):
+        return self.length
+
+    def get(self, idx):
+        return self.snaps[idx] if idx is not None and 0 <= idx < self.length else None
+
+    def index_of(self, snapshot):
+        """Current row of `snapshot` (by identity), or None if it is no longer shown."""
+        for i in range(self.length):
+            if self.snaps[i] is snapshot:
+                return i
+        return None
+
+    def _reveal(self, idx):
+        snaps = self.snaps
+        while len(snaps) <= idx:
+            snaps.append(None)
+        # Ensure there’s a snapshot to edit; a visible row is never hidden
+        if snaps[idx] is None:
+            snaps[idx] = make_empty_snapshot()
+        snaps[idx]['hidden'] = False
+
+    def _bump(self):
+        self.version += 1
+
+    # ---------- rows ----------
+    def add(self):
+        """Show one more row (restoring its hidden snapshot). New index, or None at MAX_ROWS."""
+        if self.length >= self.MAX_ROWS:
+            return None
+        idx = self.length
+        self._reveal(idx)
+        self.length += 1
+        self._bump()
+        return idx
+
+    def remove(self):
+        """
+        Drumding-style hide of the last row: the snapshot stays in the list
+        (muted + hidden, so ChainRunner ignores it) and can be restored.
+        Removed index, or None when only one row is left.
+        """
+        if self.length <= 1:
+            return None
+        self.length -= 1
+        snap = self.snaps[self.length] if self.length < len(self.snaps) else None
+        if snap is not None:
+            snap['muted'] = True
+            snap['hidden'] = True
+        self._bump()
+        return self.length
+
+    def move(self, src, dst):
+        """Swap rows src and dst. False if either is out of range."""
+        if src == dst or not (0 <= src < self.length and 0 <= dst < self.length):
+            return False
+        snaps = self.snaps
+        snaps[src], snaps[dst] = snaps[dst], snaps[src]
+        self._bump()
+        return True
+
+    # ---------- per-row edits ----------
+    def set(self, idx, snapshot):
+        if 0 <= idx < self.length:
+            self.snaps[idx] = snapshot
+            self._bump()
+
+    def clear(self, idx):
+        self.set(idx, make_empty_snapshot())
+
+    def set_name(self, idx, name):
+        snap = self.get(idx)
+        if snap is not None:
+            snap['name'] = name
+            self._bump()
+
+    def set_loops(self, idx, loop_count):
+        snap = self.get(idx)
+        if snap is not None:
+            snap['loop_count'] = loop_count
+            self._bump()
+
+    def toggle_mute(self, idx):
+        """Flip MUTE; unmuting also drops SOLO (solo and mute are mutually exclusive)."""
+        snap = self.get(idx)
+        if snap is None:
+            return None
+        snap['muted'] = not snap.get('muted', False)
+        if not snap['muted'] and snap.get('solo'):
+            snap['solo'] = False
+        self._bump()
+        return snap['muted']
+
+    def toggle_solo(self, idx):
+        """Flip SOLO; turning it on forces MUTE off."""
+        snap = self.get(idx)
+        if snap is None:
+            return None
+        snap['solo'] = not snap.get('solo', False)
+        if snap['solo'] and snap.get('muted'):
+            snap['muted'] = False
+        self._bump()
+        return snap['solo']
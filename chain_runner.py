@@ -1,5 +1,5 @@
 # chain_runner.py — daemon-friendly, minimal playlist runner
-import threading, time, math
+import threading, time, math, queue
 from sequence_engine import SequenceGenerator
 
 INF = float("inf")
@@ -29,12 +29,69 @@ def _parse_global_loops(s):
         return 1
 
 
+def apply_snapshot(state, snap):
+    """Load a Chain Arps snapshot into AppState (also used to mirror the engine host)."""
+    if 'root' in snap and snap['root'] is not None:
+        state.original_root = snap['root']
+    if 'scale' in snap and snap['scale'] is not None:
+        state.scale = snap['scale']
+    if 'scale_notes' in snap:
+        state.scale_notes = set(snap.get('scale_notes') or [])
+
+    # sets & dict[iv]->set(octs)
+    if 'selected_intervals' in snap:
+        state.selected_intervals = set(snap.get('selected_intervals') or [])
+    if 'extension_octaves' in snap:
+        raw = snap.get('extension_octaves') or {}
+        state.extension_octaves = {int(k): set(v or []) for k, v in raw.items()}
+
+    if 'direction_mode' in snap and snap['direction_mode'] is not None:
+        state.direction_mode = snap['direction_mode']
+    if 'shuffle_seed' in snap and snap['shuffle_seed'] is not None:
+        state.shuffle_seed = int(snap['shuffle_seed'])
+    if 'stride_n' in snap and snap['stride_n'] is not None:
+        state.stride_n = int(snap['stride_n'])
+    if 'gate_pct' in snap and snap['gate_pct'] is not None:
+        g = float(snap['gate_pct'])
+        state.gate = g
+        state.gate_pct = g
+    if 'diatonic_mode' in snap:
+        state.diatonic_mode = bool(snap['diatonic_mode'])
+        
+    if 'subdivision' in snap and snap['subdivision'] is not None:
+        state.subdivision = int(snap['subdivision'])
+    if 'bpm' in snap and snap['bpm'] is not None:
+        state.tempo = float(snap['bpm'])
+
+
+    # Recompute the audible pattern for this snapshot
+    state.last_seq = [n if (n is None) else int(n) for n in (snap.get("sequence") or [])]
+
+
 class ChainRunner:
-    def __init__(self, state, midi_engine, on_tick, on_done, global_loops=""):
+    """
+    Walks the active Chain Arps slots. Loop boundaries are absolute
+    monotonic_ns deadlines: each loop ends exactly one loop length after the
+    previous deadline (not after whenever the thread woke up), so sleep
+    overshoot never accumulates across slots or global loops. A tempo or
+    subdivision change mid-loop rebases the rest of the loop at the new rate.
+    clock/sleep are injectable (virtual-clock checks); sleep defaults to the
+    stop event's wait so stop() wakes the runner at once.
+
+    When the daemon owns the chain and publishes its event feed
+    (MidiEngine.daemon_events), nothing is estimated: every slot/wrap event
+    ticks the UI at the boundary's scheduled time and global passes are
+    counted from the daemon's own pass counter (wraps to its first slot).
+    """
+    POLL_S = 0.02       # longest single wait: tempo changes are seen this quickly
+
+    def __init__(self, state, midi_engine, on_tick, on_done, global_loops="",
+                 clock=None, sleep=None):
         self.state = state
         self.m = midi_engine
         self.on_tick = on_tick          # (slot_idx, current_loop, total_loops, is_active)
         self.on_done = on_done          # callback when global loops complete
+        self.on_apply = None            # fn(snap) after a snapshot is applied (engine host)
         self.global_loops = _parse_global_loops(global_loops)
         self.global_loop_counter = 0
         self._cur_idx = None
@@ -43,6 +100,9 @@ class ChainRunner:
         self._stop = threading.Event()
         self._thr = None
         self.running = False
+        self._now_ns = clock or time.monotonic_ns
+        self._sleep = sleep or self._stop.wait
+        self.deadline_ns = None         # end of the current loop (clock ns)
 
         self.rebuild_active_slots()
 
@@ -98,13 +158,18 @@ class ChainRunner:
         # MidiEngine exposes _chain_active; treat truthy as “daemon owns playback”
         return bool(getattr(self.m, "_chain_active", False))
 
+    def _follows_daemon(self):
+        events = getattr(self.m, "daemon_events", None)
+        return self._daemon_chain_active() and bool(events and events())
+
     def _loop_seconds_for_snapshot(self, snap):
         """
         Duration of one full pass through the slot’s baked sequence under current transport.
         Uses daemon transport (tempo/subdiv) so UI tickers stay in sync while we stay hands-off.
         """
-        seq = snap.get("sequence") or []
-        steps = len(seq)
+        return self._loop_seconds_for_steps(len(snap.get("sequence") or []))
+
+    def _loop_seconds_for_steps(self, steps):
         if steps <= 0:
             return 0.05
         tempo = float(self.m.get_tempo())
@@ -117,37 +182,9 @@ class ChainRunner:
     # ---- internals ---------------------------------------------------
 
     def _apply_snapshot_to_state(self, snap):
-        if 'root' in snap and snap['root'] is not None:
-            self.state.original_root = snap['root']
-        if 'scale' in snap and snap['scale'] is not None:
-            self.state.scale = snap['scale']
-        if 'scale_notes' in snap:
-            self.state.scale_notes = set(snap.get('scale_notes') or [])
-
-        # sets & dict[iv]->set(octs)
-        if 'selected_intervals' in snap:
-            self.state.selected_intervals = set(snap.get('selected_intervals') or [])
-        if 'extension_octaves' in snap:
-            raw = snap.get('extension_octaves') or {}
-            self.state.extension_octaves = {int(k): set(v or []) for k, v in raw.items()}
-
-        if 'direction_mode' in snap and snap['direction_mode'] is not None:
-            self.state.direction_mode = snap['direction_mode']
-        if 'gate_pct' in snap and snap['gate_pct'] is not None:
-            g = float(snap['gate_pct'])
-            self.state.gate = g
-            self.state.gate_pct = g
-        if 'diatonic_mode' in snap:
-            self.state.diatonic_mode = bool(snap['diatonic_mode'])
-            
-        if 'subdivision' in snap and snap['subdivision'] is not None:
-            self.state.subdivision = int(snap['subdivision'])
-        if 'bpm' in snap and snap['bpm'] is not None:
-            self.state.tempo = float(snap['bpm'])
-
-
-        # Recompute the audible pattern for this snapshot
-        self.state.last_seq = [n if (n is None) else int(n) for n in (snap.get("sequence") or [])]
+        apply_snapshot(self.state, snap)
+        if self.on_apply:
+            self.on_apply(snap)
 
         # Push everything to the daemon right now
         self.m._push_all(immediate=True)
@@ -157,16 +194,120 @@ class ChainRunner:
         steps = len(getattr(self.state, "last_seq", []) or [])
         if steps <= 0: 
             return 0.05  # nothing to play, advance quickly
-        tempo = self.m.get_tempo()
-        subdiv = max(1, int(self.m.get_subdivision()))
-        step_sec = (60.0 / max(1e-3, tempo)) * (4.0 / float(subdiv))
-        return steps * step_sec
+        return self._loop_seconds_for_steps(steps)
+
+    def _loop_ns(self, snap):
+        secs = (self._loop_seconds_for_snapshot(snap) if self._daemon_chain_active()
+                else self._loop_seconds())
+        return max(1, int(round(secs * 1e9)))
+
+    def _wait_loop(self, snap, start_ns):
+        """
+        Sleep until start_ns + one loop; returns the deadline actually used.
+        If the loop length changes part-way (tempo/subdiv), the elapsed
+        fraction is kept and the remainder is stretched to the new length.
+        """
+        length = self._loop_ns(snap)
+        end = start_ns + length
+        self.deadline_ns = end
+        while not self._stop.is_set():
+            now = self._now_ns()
+            if now >= end:
+                break
+            self._sleep(min(self.POLL_S, (end - now) / 1e9))
+            new_len = self._loop_ns(snap)
+            if new_len != length:
+                now = self._now_ns()
+                done = min(1.0, max(0.0, (now - start_ns) / length))
+                start_ns = now - int(round(done * new_len))
+                length = new_len
+                end = start_ns + length
+                self.deadline_ns = end
+        return end
+
+    def _wait_until(self, t_ns):
+        while not self._stop.is_set():
+            now = self._now_ns()
+            if now >= t_ns:
+                return
+            self._sleep(min(self.POLL_S, (t_ns - now) / 1e9))
+
+    def _finish(self):
+        # Clean finish: counters show 0 and LINK remains on
+        self.running = False
+        if self.on_tick and self._cur_idx is not None:
+            try:
+                self.on_tick(self._cur_idx, 0, self._cur_total, False)
+            except Exception:
+                pass
+        if self.on_done:
+            self.on_done()
+
+    def _slot_for_row(self, row):
+        for slot in list(self.active_slots):
+            if slot['idx'] == row:
+                return slot
+        return None
+
+    def _run_events(self):
+        # daemon-driven: one tick per slot/wrap event, at the boundary's own time
+        events = queue.Queue()
+        listener = events.put
+        self.m.add_event_listener(listener)
+        try:
+            prev = None     # (gen, slot, pass) of the last loop start
+            while not self._stop.is_set():
+                try:
+                    ev = events.get(timeout=self.POLL_S)
+                except queue.Empty:
+                    continue
+                slot_no = ev.get("slot", -1)
+                if ev.get("kind") not in ("slot", "wrap") or slot_no < 0:
+                    continue
+                # a pass ends when the daemon wraps its chain to the first slot; that
+                # holds across hot edits (gen changes). Feeds without a counter fall
+                # back to the same chain coming round to an earlier slot.
+                gen, pass_no = ev.get("gen"), ev.get("pass")
+                if pass_no is not None:
+                    passed = ev["kind"] == "slot" and prev is not None and pass_no != prev[2]
+                else:
+                    passed = (ev["kind"] == "slot" and prev is not None
+                              and prev[0] == gen and slot_no <= prev[1])
+                prev = (gen, slot_no, pass_no)
+
+                self.deadline_ns = ev["t"]
+                self._wait_until(ev["t"])
+                if self._stop.is_set():
+                    break
+
+                if passed and self.global_loops is not INF:
+                    self.global_loop_counter += 1
+                    if self.global_loop_counter >= self.global_loops:
+                        self._finish()
+                        break
+
+                idx = self.m.chain_row(slot_no, gen)
+                slot = self._slot_for_row(idx) if idx is not None else None
+                if slot is None:
+                    continue
+                loops = slot['loops']
+                total_disp = 'X' if loops is None else loops
+                if self.on_tick:
+                    self.on_tick(idx, ev.get("loop", 1), total_disp, True)
+                self._cur_idx = idx
+                self._cur_total = total_disp
+        finally:
+            self.m.remove_event_listener(listener)
+        self.running = False
 
     def _run(self):
         if not self.active_slots:
             self.running = False
             return
+        if self._follows_daemon():
+            return self._run_events()
 
+        boundary = self._now_ns()           # every later boundary is derived from this one
         while not self._stop.is_set():
             # One pass through all active slots
             for slot in list(self.active_slots):  # snapshot, in case GUI rebuilds
@@ -190,20 +331,8 @@ class ChainRunner:
                     self._cur_idx = idx
                     self._cur_total = total_disp
 
-                    # Sleep exactly one loop; wake often so stop() is responsive
-                    remain = (
-                        self._loop_seconds_for_snapshot(snap)
-                        if self._daemon_chain_active()
-                        else self._loop_seconds()
-                    )
-                    t0 = time.time()
-                    while remain > 0 and not self._stop.is_set():
-                        time.sleep(min(0.02, remain))
-                        # recompute remaining with current tempo/subdiv
-                        if self._daemon_chain_active():
-                            remain = self._loop_seconds_for_snapshot(snap) - (time.time() - t0)
-                        else:
-                            remain = self._loop_seconds() - (time.time() - t0)
+                    # next boundary = this one + one loop, however late we woke
+                    boundary = self._wait_loop(snap, boundary)
 
             if self._stop.is_set():
                 break
@@ -213,16 +342,7 @@ class ChainRunner:
                 continue
             self.global_loop_counter += 1
             if self.global_loop_counter >= self.global_loops:
-                # Clean finish: counters show 0 and LINK remains on
-                self.running = False
-                if self.on_tick and self._cur_idx is not None:
-                    try:
-                        self.on_tick(self._cur_idx, 0, self._cur_total, False)
-                    except Exception:
-                        pass
-                if self.on_done:
-                    self.on_done()
+                self._finish()
                 break
 
         self.running = False
-
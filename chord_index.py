@@ -0,0 +1,151 @@
+# chord_index.py — pitch-class-mask → chord matches, built once
+#
+# The Inspector and find_implied_chord used to walk every chord × 12 roots
+# building Python sets on each refresh. Here every (chord, root) pair is
+# compiled to a 12-bit mask once, and each selection mask maps to the pairs
+# that either sit inside it (chord ⊆ selection) or contain it (selection ⊆
+# chord). Matches keep the old CHORDS-then-root loop order, and each pair
+# remembers the iteration order of the set the old code built, so callers
+# produce byte-identical bucket ordering.
+import hashlib
+import os
+import pickle
+from collections import namedtuple
+
+from theory import CHORDS, POPCOUNT
+from theory_cache import cache_dir as _cache_dir
+
+_FORMAT = 1
+
+ChordMatch = namedtuple("ChordMatch", [
+    "key",         # CHORDS key
+    "root",        # root pc 0-11
+    "mask",        # 12-bit chord mask at this root
+    "size",        # distinct pcs in the chord
+    "length",      # CHORDS[key]["length"] (gate: length <= selection size)
+    "bass_order",  # chord pcs in the order the old per-call set iterated them
+    "disp",        # compact display name (maj/min/dim/aug)
+    "fifth_bit",   # 1 << ((root + 7) % 12), for no5 detection
+    "intervals",   # CHORDS[key]["intervals"]
+])
+
+
+def _compact(name: str) -> str:
+    return (name.replace("Diminished", "dim")
+                .replace("Augmented",  "aug")
+                .replace("Major",      "maj")
+                .replace("Minor",      "min"))
+
+
+class ChordIndex:
+    """
+    matches(mask) → tuple of ChordMatch for every chord/root whose pcs are a
+    subset or superset of `mask` (and whose length fits). Masks are filled
+    lazily; build_all() precomputes all 4096, save()/load() persist them.
+    """
+    def __init__(self, chords=None):
+        chords = CHORDS if chords is None else chords
+        pairs = []
+        for key, meta in chords.items():
+            if "alias_of" in meta:
+                continue
+            ivs = meta["intervals"]
+            disp = _compact(meta.get("display_name", key))
+            for root in range(12):
+                pcs = {(root + iv) % 12 for iv in ivs}   # same construction as the old loop
+                mask = 0
+                for pc in pcs:
+                    mask |= 1 << pc
+                pairs.append(ChordMatch(key, root, mask, len(pcs), meta["length"],
+                                        tuple(pcs), disp, 1 << ((root + 7) % 12), ivs))
+        self.pairs = tuple(pairs)
+        self._table = [None] * 4096
+        self.signature = hashlib.sha1(repr(
+            [(p.key, p.mask, p.length) for p in self.pairs]).encode("utf-8")).hexdigest()
+
+    # ---------- lookup ----------
+    def matches(self, mask: int) -> tuple:
+        mask &= 0xFFF
+        hit = self._table[mask]
+        if hit is None:
+            n = POPCOUNT[mask]
+            hit = self._table[mask] = tuple(
+                i for i, p in enumerate(self.pairs)
+                if p.length <= n and ((p.mask & ~mask) == 0 or (mask & ~p.mask) == 0))
+        pairs = self.pairs
+        return tuple(pairs[i] for i in hit)
+
+    @staticmethod
+    def is_no5(match: ChordMatch, mask: int) -> bool:
+        """Selection ⊆ chord and the only chord note missing is the 5th."""
+        return (mask & ~match.mask) == 0 and (match.mask & ~mask) == match.fifth_bit
+
+    # ---------- bulk build / disk cache ----------
+    def build_all(self):
+        """Fill every mask by enumerating each pair's supersets and subsets."""
+        table = [[] for _ in range(4096)]
+        for i, p in enumerate(self.pairs):
+            hits = set()
+            free = ~p.mask & 0xFFF
+            sub = free
+            while True:                       # supersets: chord ⊆ selection
+                hits.add(p.mask | sub)
+                if sub == 0:
+                    break
+                sub = (sub - 1) & free
+            sub = p.mask
+            while True:                       # subsets: selection ⊆ chord
+                hits.add(sub)
+                if sub == 0:
+                    break
+                sub = (sub - 1) & p.mask
+            for m in hits:
+                if p.length <= POPCOUNT[m]:
+                    table[m].append(i)        # pairs visited in order → order kept
+        self._table = [tuple(t) for t in table]
+        return self
+
+    def save(self, path=None):
+        path = path or os.path.join(_cache_dir(), "chord_index.pkl")
+        if any(t is None for t in self._table):
+            self.build_all()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump((_FORMAT, self.signature, self._table), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+        return path
+
+    def load(self, path=None) -> bool:
+        path = path or os.path.join(_cache_dir(), "chord_index.pkl")
+        try:
+            with open(path, "rb") as f:
+                fmt, sig, table = pickle.load(f)
+        except Exception:
+            return False
+        if fmt != _FORMAT or sig != self.signature or len(table) != 4096:
+            return False
+        self._table = list(table)
+        return True
+
+
+_INDEX = None
+
+
+def get_index(use_disk=False) -> ChordIndex:
+    """
+    Shared, fully built index (~0.1 s once). use_disk=True loads the table
+    from the cache dir instead, building and saving it on a miss.
+    """
+    global _INDEX
+    if _INDEX is None:
+        idx = ChordIndex()
+        if not (use_disk and idx.load()):
+            idx.build_all()
+            if use_disk:
+                idx.save()
+        _INDEX = idx
+    return _INDEX
@@ -73,6 +73,9 @@ MIDI_PORT_NAME      = 'gord 1'  # loopMIDI port prefix
 
 GRID_FONT = ("Fixedsys", 10)
 
+UI_MAX_FPS = 60   # cap on coalesced panel repaints (refresh_scheduler)
+ENGINE_HOST = False   # run MidiEngine/ChainRunner in their own process (engine_host); env GORD_ENGINE_HOST=1
+
 # Give flats the same colors as their enharmonic sharps:
 for semitone, pair in ENHARMONIC.items():
     if "/" in pair:
@@ -0,0 +1,496 @@
+# engine_host.py — MidiEngine + ChainRunner in their own process (optional)
+#
+# In-process, the mirror thread, ChainRunner._run and the Tk mainloop share
+# one GIL, so a long Tk call (Inspector _identify, a full grid repaint) also
+# delays chain loop accounting and parameter mirroring. With ENGINE_HOST on,
+# a spawned host process owns MidiEngine, ChainRunner and the daemon socket:
+#
+#   GUI ──shared memory (seqlock'd params + last_seq)──▶ host AppState mirror
+#   GUI ──command queue ("sync"/"grid"/"call"/"runner")──▶ host
+#   GUI ◀──event queue ("tick"/"done"/"apply"/"bank"/"caps")── host
+#
+# EngineProxy stands in for MidiEngine on the GUI side and make_chain_runner()
+# hands out a RemoteChainRunner, so panels keep their engine/runner calls.
+import struct, threading, time
+import multiprocessing as mp
+from array import array
+from multiprocessing import shared_memory
+
+from config import NOTE_NAMES
+from theory import MASK_PCS
+from utils import pcs_mask
+from midi_engine import EngineParams, rows_editable
+from chain_runner import _parse_global_loops, apply_snapshot
+from sequence_engine import root_bank_signature
+
+# ---------- shared parameter block ----------
+# seq is a seqlock counter (odd while the GUI writes); notes follow the header
+# as int16 with REST for None. Longer sequences go over the command queue.
+_HEAD = struct.Struct("<IdidiiBBBBBBHII")
+_SEQ  = struct.Struct("<I")
+MAX_STEPS = 32768
+REST = -32768
+LONG = 0xFFFFFFFF          # seq_len marker: this version came over the queue
+
+# sequence-shaping fields the host needs to render a root bank
+_GRID_FIELDS = (
+    "selected_notes", "playback_root", "selected_intervals", "muted_intervals",
+    "extension_octaves", "scale", "stay_in_key", "key_anchor", "key_mapper",
+    "alt_seq_enabled", "direction_mode", "include_turnaround", "shuffle_seed",
+    "stride_n",
+)
+
+
+class SharedParams:
+    """Single-writer (GUI) / single-reader (host) parameter block."""
+    SIZE = _HEAD.size + 2 * MAX_STEPS
+
+    def __init__(self, name=None):
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=self.SIZE)
+        else:
+            self.shm = _attach(name)
+        self.name = self.shm.name
+        self._seq = 0
+
+    def write(self, fields, notes=None):
+        """fields = _HEAD order minus seq; notes (list) only when they changed."""
+        buf = self.shm.buf
+        self._seq += 1
+        _SEQ.pack_into(buf, 0, self._seq)
+        _HEAD.pack_into(buf, 0, self._seq, *fields)
+        if notes is not None:
+            raw = array("h", [REST if n is None else n for n in notes]).tobytes()
+            buf[_HEAD.size:_HEAD.size + len(raw)] = raw
+        self._seq += 1
+        _SEQ.pack_into(buf, 0, self._seq)
+
+    def read(self, known_ver=None):
+        """(fields, notes) — notes is None when seq_ver == known_ver."""
+        buf = self.shm.buf
+        while True:
+            s1 = _SEQ.unpack_from(buf, 0)[0]
+            if s1 & 1:
+                time.sleep(0)
+                continue
+            head = _HEAD.unpack_from(buf, 0)
+            notes = None
+            seq_len, seq_ver = head[-2], head[-1]
+            if seq_ver != known_ver and seq_len != LONG:
+                a = array("h")
+                a.frombytes(bytes(buf[_HEAD.size:_HEAD.size + 2 * seq_len]))
+                notes = [None if n == REST else n for n in a]
+            if _SEQ.unpack_from(buf, 0)[0] == s1:
+                return head[1:], notes
+
+    def close(self):
+        try:
+            self.shm.close()
+            if self.owner:
+                self.shm.unlink()
+        except Exception:
+            pass
+
+
+def _attach(name):
+    # the GUI owns (and unlinks) the block; before 3.13 the spawned host
+    # shares the GUI's resource tracker, so a plain attach is already safe
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+# ---------- host process ----------
+# fields the ChainRunner sets from each snapshot; while it owns the sequence
+# the GUI's (possibly stale) echo of them is ignored
+_RUNNER_OWNED = ("subdivision", "gate", "diatonic_mode", "scale_notes", "original_root", "last_seq")
+
+
+def _set(st, name, value):
+    if getattr(st, name, None) != value:
+        setattr(st, name, value)
+
+
+def _apply_block(st, engine, runner, block, seq_ver):
+    (bpm, subdiv, gate, ch, tr, slave, running, dia, bank_mode, build_mode,
+     root_idx, scale_mask, seq_len, ver), notes = block.read(seq_ver)
+    owned = (runner is not None and runner.running
+             and not engine._chain_active)
+    vals = {
+        "bpm": bpm, "default_channel": ch, "transpose": tr,
+        "slave_mode": bool(slave), "is_running": bool(running),
+        "root_bank_mode": bool(bank_mode), "build_mode_enabled": bool(build_mode),
+        "subdivision": subdiv, "gate": gate, "diatonic_mode": bool(dia),
+        "scale_notes": set(MASK_PCS[scale_mask]), "original_root": NOTE_NAMES[root_idx],
+    }
+    for name, value in vals.items():
+        if not (owned and name in _RUNNER_OWNED):
+            _set(st, name, value)
+    if notes is not None and not owned:
+        st.last_seq = notes
+    return ver
+
+
+def _host_main(shm_name, cmd_q, evt_q, sock):
+    from state import AppState
+    from midi_engine import MidiEngine
+
+    block = SharedParams(shm_name)
+    st = AppState()
+    st.chain_runner = None
+    engine = MidiEngine(st, sock=sock)
+    engine.on_bank = lambda sig, raw: evt_q.put(("bank", sig, raw))
+    st.midi_engine = engine
+    evt_q.put(("caps", sorted(engine._rt.caps)))
+    runner = None
+    seq_ver = None
+    pending = [None]    # slots of a refused hot-swap, re-armed at the next loop start
+
+    def on_tick(idx, cur, total, active):
+        slots = pending[0]
+        if slots is not None and active and cur == 1:
+            # loop boundary: a clean re-arm, starting at the row that just began
+            pending[0] = None
+            rows = [s.get("idx") for s in slots]
+            try:
+                engine.play_chain(slots, index=rows.index(idx) if idx in rows else 0)
+            except Exception as e:
+                print(f"⚠️ engine host: deferred re-arm failed: {e}")
+        evt_q.put(("tick", idx, cur, total, active,
+                   runner.global_loop_counter if runner else 0, time.monotonic()))
+
+    def on_done():
+        evt_q.put(("done", runner.global_loop_counter if runner else 0))
+
+    def on_apply(snap):
+        evt_q.put(("apply", snap))
+
+    while True:
+        msg = cmd_q.get()
+        op = msg[0]
+        try:
+            if op == "sync":
+                seq_ver = _apply_block(st, engine, runner, block, seq_ver)
+            elif op == "seq":                       # longer than MAX_STEPS
+                seq_ver = msg[1]
+                st.last_seq = msg[2]
+            elif op == "grid":
+                for name, value in msg[1].items():
+                    _set(st, name, value)
+            elif op == "call":
+                if msg[1] in ("play_chain", "stop_chain"):
+                    pending[0] = None
+                getattr(engine, msg[1])(*msg[2])
+            elif op == "update_chain":
+                # hot-swap; if the daemon can't take it, re-arm at the next loop
+                # start (as ChainArpsWindow does in-process), never mid-loop
+                if pending[0] is not None or not engine.update_chain(msg[1]):
+                    if runner is not None and runner.running:
+                        pending[0] = msg[1]
+                    else:
+                        last = engine._last_chain
+                        engine.play_chain(msg[1], index=last[1] if last else 0)
+            elif op == "runner":
+                what = msg[1]
+                if what == "new":
+                    if runner:
+                        runner.stop()
+                    st.chain_arps_list = msg[3]
+                    runner = engine.make_chain_runner(st, on_tick, on_done, global_loops=msg[2])
+                    runner.on_apply = on_apply
+                    st.chain_runner = runner
+                elif runner is None:
+                    pass
+                elif what == "rebuild":
+                    st.chain_arps_list = msg[2]
+                    runner.rebuild_active_slots()
+                elif what == "start":
+                    runner.start()
+                elif what == "stop":
+                    runner.stop()
+            elif op == "shutdown":
+                break
+        except Exception as e:
+            print(f"⚠️ engine host: {op} failed: {e}")
+
+    if runner:
+        runner.stop()
+    try:
+        engine.panic()
+    except Exception:
+        pass
+    block.close()
+
+
+# ---------- GUI side ----------
+class RemoteChainRunner:
+    """ChainRunner look-alike whose loop runs in the engine host."""
+    def __init__(self, proxy, state, on_tick, on_done, global_loops=""):
+        self.proxy = proxy
+        self.state = state
+        self.on_tick = on_tick
+        self.on_done = on_done
+        self.global_loops = _parse_global_loops(global_loops)
+        self.global_loop_counter = 0
+        self._cur_idx = None
+        self._cur_total = None
+        self.last_tick_at = None        # host time.monotonic() of the latest tick
+        self.running = False
+        proxy._runner = self
+        proxy._cmd(("runner", "new", global_loops, self._snaps()))
+
+    def _snaps(self):
+        return list(getattr(self.state, "chain_arps_list", []) or [])
+
+    def rebuild_active_slots(self):
+        self.proxy._cmd(("runner", "rebuild", self._snaps()))
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.proxy._publish()
+        self.proxy._cmd(("runner", "start"))
+
+    def stop(self):
+        self.proxy._cmd(("runner", "stop"))
+        was = self.running
+        self.running = False
+        if was and self.on_tick and self._cur_idx is not None:
+            try:
+                self.on_tick(self._cur_idx, 0, self._cur_total, False)
+            except Exception:
+                pass
+        self._cur_idx = None
+        self._cur_total = None
+
+    # events from the host (event thread)
+    def _on_tick(self, idx, cur, total, active, counter, t):
+        self.global_loop_counter = counter
+        self.last_tick_at = t
+        if active:
+            self._cur_idx, self._cur_total = idx, total
+        if self.on_tick and (active or self.running):
+            self.on_tick(idx, cur, total, active)
+
+    def _on_done(self, counter):
+        self.global_loop_counter = counter
+        self.running = False
+        self._cur_idx = None
+        if self.on_done:
+            self.on_done()
+
+
+class EngineProxy(EngineParams):
+    """
+    MidiEngine stand-in for the GUI: parameters go to the host through the
+    shared block, transport/chain calls through the command queue.
+    """
+    START_METHOD = "spawn"          # fresh interpreter: no Tk state inherited
+    FALLBACK_POLL_S = 1.0
+
+    def __init__(self, state, sock="/tmp/gord_rt.sock"):
+        self.state = state
+        self._chain_active = False
+        self._chain_rows = []
+        self._caps = set()              # daemon caps, as the host negotiated them
+        self._runner = None
+        self._bank = None               # (signature, raw seqs) from the host
+        self._lock = threading.Lock()
+        self._last_fields = None
+        self._seq_obj = None
+        self._seq_len = -1
+        self._seq_ver = 0
+        self._closed = False
+
+        ctx = mp.get_context(self.START_METHOD)
+        self.block = SharedParams()
+        self._cmd_q = ctx.Queue()
+        self._evt_q = ctx.Queue()
+        self.proc = ctx.Process(target=_host_main, name="gord-engine-host",
+                                args=(self.block.name, self._cmd_q, self._evt_q, sock),
+                                daemon=True)
+        self.proc.start()
+        self._publish()
+
+        threading.Thread(target=self._publish_loop, daemon=True).start()
+        threading.Thread(target=self._event_loop, daemon=True).start()
+
+    # ---------- plumbing ----------
+    def _cmd(self, msg):
+        if not self._closed:
+            self._cmd_q.put(msg)
+
+    def _fields(self):
+        st = self.state
+        try:
+            root_idx = NOTE_NAMES.index(getattr(st, "original_root", "C"))
+        except ValueError:
+            root_idx = 0
+        return (self.get_tempo(), self.get_subdivision(), self._gate_pct(),
+                self.get_channel(), self.get_transpose(), self.is_slave(),
+                bool(getattr(st, "is_running", False)),
+                bool(getattr(st, "diatonic_mode", False)),
+                bool(getattr(st, "root_bank_mode", False)),
+                bool(getattr(st, "build_mode_enabled", False)),
+                root_idx, pcs_mask(getattr(st, "scale_notes", None) or ()))
+
+    def _publish(self, force_grid=False):
+        """Write the block if anything moved and wake the host."""
+        st = self.state
+        with self._lock:
+            fields = self._fields()
+            seq = getattr(st, "last_seq", None) or []
+            notes = None
+            if seq is not self._seq_obj or len(seq) != self._seq_len:
+                self._seq_obj, self._seq_len = seq, len(seq)
+                self._seq_ver = (self._seq_ver + 1) & 0xFFFFFFFF
+                notes = list(seq)
+            if notes is None and fields == self._last_fields and not force_grid:
+                return
+            self._last_fields = fields
+            long_seq = notes is not None and len(notes) > MAX_STEPS
+            seq_len = LONG if self._seq_len > MAX_STEPS else self._seq_len
+            self.block.write(fields + (seq_len, self._seq_ver),
+                             None if long_seq else notes)
+            if long_seq:
+                self._cmd(("seq", self._seq_ver, notes))
+            if notes is not None or force_grid:
+                if getattr(st, "root_bank_mode", False):
+                    self._cmd(("grid", {k: getattr(st, k, None) for k in _GRID_FIELDS}))
+            self._cmd(("sync",))
+
+    def _publish_loop(self):
+        seen = None
+        while not self._closed:
+            try:
+                cur = self.state.wait_for_change(seen, timeout=self.FALLBACK_POLL_S)
+            except Exception:
+                time.sleep(self.FALLBACK_POLL_S)
+                cur = None
+            grid = cur is not None and seen is not None and cur.get("sequence") != seen.get("sequence")
+            seen = cur
+            try:
+                self._publish(force_grid=grid)
+            except Exception:
+                pass
+
+    def _event_loop(self):
+        while not self._closed:
+            try:
+                evt = self._evt_q.get()
+            except Exception:
+                return
+            kind = evt[0]
+            r = self._runner
+            try:
+                if kind == "tick" and r is not None:
+                    r._on_tick(*evt[1:7])
+                elif kind == "done" and r is not None:
+                    r._on_done(evt[1])
+                elif kind == "apply":
+                    apply_snapshot(self.state, evt[1])
+                elif kind == "bank":
+                    self._bank = (evt[1], evt[2])
+                elif kind == "caps":
+                    self._caps = set(evt[1])
+            except Exception as e:
+                print(f"⚠️ engine host event {kind} failed: {e}")
+
+    def _call(self, name, *args):
+        self._publish()                 # host sees the params this call was made with
+        self._cmd(("call", name, args))
+
+    # ---------- MidiEngine surface ----------
+    def panic(self):
+        self._call("panic")
+
+    def start(self):
+        self._call("start")
+
+    def stop(self):
+        self._call("stop")
+        cr = getattr(self.state, "chain_runner", None)
+        if cr:
+            try: cr.stop()
+            except Exception: pass
+
+    def update_slave(self, flag: bool):
+        self.state.slave_mode = bool(flag)
+        self._call("update_slave", bool(flag))
+
+    def set_sequence(self, notes):
+        self._call("set_sequence", list(notes or []))
+
+    def make_chain_runner(self, state, on_tick, on_done, global_loops=""):
+        return RemoteChainRunner(self, state, on_tick, on_done, global_loops=global_loops)
+
+    def play_chain(self, slots, index=0):
+        self._chain_active = True
+        self._chain_rows = [s.get("idx") for s in (slots or [])]
+        self._call("play_chain", list(slots or []), int(index))
+
+    def update_chain(self, slots, at="loop") -> bool:
+        """True = the host owns the change: hot-swapped, or (if the daemon refuses
+        the edit) re-armed at the next loop start while the chain runs."""
+        new_rows = [s.get("idx") for s in (slots or [])]
+        if ("chain_edit" not in self._caps or not self._chain_active
+                or not new_rows or not rows_editable(self._chain_rows, new_rows)):
+            return False
+        self._chain_rows = new_rows
+        self._publish()
+        self._cmd(("update_chain", list(slots)))
+        return True
+
+    def stop_chain(self):
+        self._chain_active = False
+        self._call("stop_chain")
+
+    # ---------- root bank ----------
+    def _bank_valid(self):
+        st = self.state
+        bank = self._bank
+        if (bank is None or self._chain_active
+                or not getattr(st, "root_bank_mode", False)
+                or not getattr(st, "is_running", False)
+                or getattr(st, "build_mode_enabled", False)):
+            return None
+        try:
+            return bank if bank[0] == root_bank_signature(st) else None
+        except Exception:
+            return None
+
+    def select_root(self, name) -> bool:
+        if self._bank_valid() is None:
+            return False
+        self._call("select_root", name)
+        return True
+
+    def root_bank_seq(self, name):
+        bank = self._bank_valid()
+        if bank is None:
+            return None
+        try:
+            return list(bank[1][NOTE_NAMES.index(name)])
+        except ValueError:
+            return list(bank[1][0])
+
+    # ---------- lifetime ----------
+    def close(self):
+        if self._closed:
+            return
+        try:
+            self._cmd_q.put(("shutdown",))
+        except Exception:
+            pass
+        self._closed = True
+        self.proc.join(timeout=1.0)
+        if self.proc.is_alive():
+            self.proc.terminate()
+        try:
+            self._evt_q.put(("closed",))
+        except Exception:
+            pass
+        self.block.close()
@@ -0,0 +1,173 @@
+# fredt_link.py — one long-lived FREDT viewer, fed root/note sets over a socket
+#
+# "Open FREDT" used to start a fresh fredt_main.py per click (interpreter +
+# Tk start-up each time, and the windows piled up). Now FREDT runs with
+# --listen and binds FREDT_SOCK; Gord sends it JSON datagrams:
+#   {"cmd":"show","root":"C","notes":["C","E","G"],"raise":true}
+#   {"cmd":"noop"}                      (liveness probe, no reply)
+# If nothing is listening, show() spawns a single instance with the notes on
+# its command line. follow(state) then pushes every last_seq change while the
+# viewer is up. Without AF_UNIX there is no channel: every show() spawns a
+# viewer, as before, and push() does nothing.
+import os, sys, json, socket, threading, subprocess, time
+
+FREDT_SOCK = "/tmp/gord_fredt.sock"
+HAVE_UNIX  = hasattr(socket, "AF_UNIX")
+
+
+def notes_from_state(state):
+    """(root_name, [note names]) shown for the current sequence, or (None, [])."""
+    from config import NOTE_NAMES
+    seq   = list(getattr(state, "last_seq", None) or [])
+    pcs   = {n % 12 for n in seq if n is not None}
+    notes = [NOTE_NAMES[pc] for pc in sorted(pcs)] or sorted(getattr(state, "selected_notes", ()) or ())
+    if not notes:
+        return None, []
+    return getattr(state, "original_root", None) or notes[0], notes
+
+
+class FredtLink:
+    START_TIMEOUT_S = 5.0   # how long a spawned viewer gets to bind its socket
+    FOLLOW_POLL_S   = 1.0   # wait_for_change safety timeout
+
+    def __init__(self, path=FREDT_SOCK):
+        self.path = path
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) if HAVE_UNIX else None
+        self._lock = threading.Lock()
+        self._proc = None
+        self._pending = None        # latest show() while a spawned viewer starts
+        self._last_sent = None
+        self._follow_thread = None
+        self._state = None
+
+    # ---------- transport ----------
+    def _send(self, msg) -> bool:
+        if self.sock is None:
+            return False
+        try:
+            self.sock.sendto(json.dumps(msg).encode("utf-8"), self.path)
+            return True
+        except OSError:             # no socket file / nobody bound (ECONNREFUSED)
+            return False
+
+    def listening(self) -> bool:
+        return self._send({"cmd": "noop"})
+
+    def _starting(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    # ---------- public ----------
+    def show(self, root, notes) -> bool:
+        """Bring up the viewer on (root, notes): update the live one, or spawn it."""
+        if not notes:
+            return False
+        if not HAVE_UNIX:
+            return self._spawn(root, notes)     # nothing could deliver a _pending
+        msg = {"cmd": "show", "root": root, "notes": list(notes), "raise": True}
+        with self._lock:
+            if self._send(msg):
+                self._last_sent = (root, tuple(notes))
+                return True
+            if self._starting():
+                self._pending = msg         # delivered once it binds
+                return True
+            return self._spawn(root, notes)
+
+    def push(self, root, notes) -> bool:
+        """Live update without raising or spawning; repeats are dropped."""
+        sig = (root, tuple(notes))
+        if not HAVE_UNIX or not notes or sig == self._last_sent:
+            return False
+        with self._lock:
+            if self._starting() and not self.listening():
+                self._pending = {"cmd": "show", "root": root, "notes": list(notes)}
+                return True
+            if self._send({"cmd": "show", "root": root, "notes": list(notes)}):
+                self._last_sent = sig
+                return True
+        return False
+
+    def follow(self, state):
+        """Push notes_from_state(state) on every sequence change while a viewer is up."""
+        self._state = state
+        if self._follow_thread and self._follow_thread.is_alive():
+            return
+        if not hasattr(state, "wait_for_change"):
+            return
+        self._follow_thread = threading.Thread(target=self._follow_loop, daemon=True)
+        self._follow_thread.start()
+
+    def close(self):
+        try:
+            if self.sock:
+                self.sock.close()
+        except Exception:
+            pass
+
+    # ---------- internals ----------
+    def _spawn(self, root, notes) -> bool:
+        from utils import resource_path
+        fredt_py = resource_path("FREDT/fredt_main.py")
+        if not os.path.exists(fredt_py):
+            print("⚠️  fredt_main.py not found")
+            return False
+
+        python_exe = "pythonw" if getattr(sys, "frozen", False) else sys.executable
+        cmd = [python_exe, fredt_py, "--root", root, "--notes", ",".join(notes)]
+        if HAVE_UNIX:
+            cmd += ["--listen", self.path]
+        self._proc = subprocess.Popen(
+            cmd,
+            cwd=os.path.dirname(fredt_py),
+            creationflags=(
+                subprocess.CREATE_NO_WINDOW        # still suppresses if python.exe used
+                if sys.platform == "win32" else 0
+            )
+        )
+        self._last_sent = (root, tuple(notes))
+        if HAVE_UNIX:
+            threading.Thread(target=self._flush_when_ready, args=(self._proc,), daemon=True).start()
+        return True
+
+    def _flush_when_ready(self, proc):
+        # deliver whatever changed between spawn and the viewer binding its socket
+        deadline = time.time() + self.START_TIMEOUT_S
+        while time.time() < deadline and proc.poll() is None:
+            if self.listening():
+                with self._lock:
+                    msg, self._pending = self._pending, None
+                    if msg and self._send(msg):
+                        self._last_sent = (msg["root"], tuple(msg["notes"]))
+                return
+            time.sleep(0.05)
+
+    def _follow_loop(self):
+        seen = None
+        while True:
+            try:
+                cur = self._state.wait_for_change(seen, timeout=self.FOLLOW_POLL_S)
+            except Exception:
+                time.sleep(self.FOLLOW_POLL_S)
+                continue
+            if seen is not None and cur.get("sequence") == seen.get("sequence"):
+                seen = cur
+                continue
+            seen = cur
+            if not (self._starting() or self._last_sent):
+                continue            # no viewer opened yet
+            try:
+                root, notes = notes_from_state(self._state)
+            except Exception:
+                continue
+            if notes:
+                self.push(root, notes)
+
+
+_LINK = None
+
+
+def get_link() -> FredtLink:
+    global _LINK
+    if _LINK is None:
+        _LINK = FredtLink()
+    return _LINK
@@ -0,0 +1,482 @@
+# gord_wire.py — compact binary framing for the /tmp/gord_rt.sock control socket
+#
+# Every datagram starts with a fixed 4-byte header:
+#     magic "GW" | version u8 | opcode u8
+# followed by an opcode-specific little-endian body. Notes travel as int8
+# arrays (-1 = rest, 0..127 = MIDI note). encode()/decode() map to and from
+# the same dicts the JSON protocol uses, so both ends can keep one code path
+# and JSON stays the fallback for daemons that never answer the handshake.
+import hashlib, struct, zlib
+from array import array
+
+MAGIC   = b"GW"
+VERSION = 1
+
+HEADER = struct.Struct("<2sBB")
+
+OP_NOOP  = 0
+OP_SET   = 1
+OP_SEQ   = 2
+OP_CHAIN = 3
+OP_START = 4
+OP_STOP  = 5
+OP_PANIC = 6
+OP_CHAIN_BEGIN  = 7
+OP_CHAIN_PART   = 8
+OP_CHAIN_COMMIT = 9
+OP_BANK_BEGIN   = 10
+OP_ROOT         = 11
+OP_SUBSCRIBE    = 12
+OP_EVENT        = 13
+OP_CHAIN_EDIT   = 14
+OP_PATTERN      = 15
+OP_CHAIN_REF    = 16
+
+_OPS   = {"noop": OP_NOOP, "set": OP_SET, "seq": OP_SEQ, "chain": OP_CHAIN,
+          "start": OP_START, "stop": OP_STOP, "panic": OP_PANIC,
+          "chain_begin": OP_CHAIN_BEGIN, "chain_part": OP_CHAIN_PART,
+          "chain_commit": OP_CHAIN_COMMIT,
+          "bank_begin": OP_BANK_BEGIN, "root": OP_ROOT,
+          "subscribe": OP_SUBSCRIBE, "event": OP_EVENT,
+          "chain_edit": OP_CHAIN_EDIT,
+          "pattern": OP_PATTERN, "chain_ref": OP_CHAIN_REF}
+_NAMES = {v: k for k, v in _OPS.items()}
+
+# SET: presence flags + fixed field block (tempo f32, subdiv u16, gate f32, ch u8, tr i8)
+_SET_FLAGS  = struct.Struct("<H")
+_SET_FIELDS = struct.Struct("<fHfBb")
+F_TEMPO     = 1 << 0
+F_SUBDIV    = 1 << 1
+F_GATE      = 1 << 2
+F_CHANNEL   = 1 << 3
+F_TRANSPOSE = 1 << 4
+F_SLAVE     = 1 << 5   # slave_mode present
+F_SLAVE_ON  = 1 << 6   # slave_mode value
+F_IMMEDIATE = 1 << 7
+F_SCALE     = 1 << 8   # trailing u16 scale_mask (daemon-side snap after transpose)
+
+_COUNT      = struct.Struct("<H")
+_CHAIN_HEAD = struct.Struct("<HH")    # index, slot count
+_SLOT_HEAD  = struct.Struct("<hH")    # loops (-1 = infinite), note count
+
+# Multi-part chain upload (begin → parts → commit with crc32)
+_BEGIN_HEAD  = struct.Struct("<IHH")   # upload id, slot count, start index
+_PART_HEAD   = struct.Struct("<IHhIH") # upload id, slot, loops, note offset, note count
+_COMMIT_HEAD = struct.Struct("<II")    # upload id, crc32
+
+# Root bank: uploaded like a chain (bank_begin → chain_part… → chain_commit),
+# then switched with a tiny ROOT message
+_ROOT = struct.Struct("<BBH")          # bank index, has scale_mask, scale_mask
+
+# Event feed (daemon → subscribed client). A client subscribes from its bound
+# reply socket; the daemon then sends one EVENT per loop start (and per step
+# if asked). slot -1 = base sequence; gen bumps on every chain install; t is
+# the step's scheduled host time in monotonic ns; pass counts the chain's
+# wraps back to its first slot (kept across installs and edits).
+_SUBSCRIBE = struct.Struct("<BB")      # on, steps
+_EVENT     = struct.Struct("<BHhHIQH") # kind, gen, slot, loop, step, t_ns, pass
+EV_STEP = 1   # a step was scheduled
+EV_WRAP = 2   # the same slot/pattern starts another loop
+EV_SLOT = 3   # first loop of a slot (chain advance, chain install, start)
+EVENT_KINDS = {EV_STEP: "step", EV_WRAP: "wrap", EV_SLOT: "slot"}
+_EVENT_CODES = {v: k for k, v in EVENT_KINDS.items()}
+
+# Incremental chain edit: ops on the live chain, applied by the scheduler at
+# the next loop (or slot) boundary. Only replace/insert carry notes.
+_EDIT_HEAD = struct.Struct("<BBHH")    # at (0 loop, 1 slot), flags, gen, op count
+_EDIT_OP   = struct.Struct("<BHHhH")   # op, slot, to (move), loops, note count
+E_MORE     = 1 << 0                    # more ops of this batch follow
+E_GEN      = 1 << 1                    # gen present
+EDIT_OPS   = {1: "replace", 2: "insert", 3: "delete", 4: "move"}
+_EDIT_CODES = {v: k for k, v in EDIT_OPS.items()}
+_EDIT_AT    = {"loop": 0, "slot": 1}
+
+# Pattern dictionary: a note array is defined once under its content hash
+# (PATTERN, split by offset when long) and chains reference it by id
+# (CHAIN_REF: 10 bytes per slot). The daemon answers {"cmd":"missing","ids"}
+# for ids it doesn't hold.
+_PAT_HEAD  = struct.Struct("<QIIH")    # id, total notes, offset, note count
+_REF_SLOT  = struct.Struct("<Qh")      # id, loops (-1 = infinite)
+
+MAX_DGRAM = 4096          # GordRT receives into a fixed 4096-byte buffer
+PART_NOTES_BINARY = 3072  # notes per chain_part datagram (binary)
+PART_NOTES_JSON   = 600   # notes per chain_part datagram (JSON, ≤5 chars/note)
+
+
+class WireError(ValueError):
+    pass
+
+
+def is_binary(data: bytes) -> bool:
+    return data[:2] == MAGIC
+
+
+def _notes_to_bytes(notes) -> bytes:
+    # fast path: already-clean ints (-1 rests, 0..127) go straight through C
+    try:
+        out = array("b", notes or ())
+        if not out or min(out) >= -1:
+            return out.tobytes()
+    except (TypeError, OverflowError):
+        pass
+    out = array("b")
+    for n in notes or ():
+        try:
+            nn = int(n)
+        except Exception:
+            nn = -1
+        out.append(-1 if nn < 0 else min(127, nn))
+    return out.tobytes()
+
+
+def _bytes_to_notes(buf, off, count):
+    end = off + count
+    if end > len(buf):
+        raise WireError("truncated note array")
+    notes = array("b")
+    notes.frombytes(bytes(buf[off:end]))
+    return notes.tolist(), end
+
+
+# ----------------------------
+#           Encode
+# ----------------------------
+def _enc_set(m):
+    flags = 0
+    tempo = subdiv = gate = ch = tr = 0
+    if m.get("tempo") is not None:       flags |= F_TEMPO;     tempo  = float(m["tempo"])
+    if m.get("subdivision") is not None: flags |= F_SUBDIV;    subdiv = int(m["subdivision"])
+    if m.get("gate") is not None:        flags |= F_GATE;      gate   = float(m["gate"])
+    if m.get("channel") is not None:     flags |= F_CHANNEL;   ch     = int(m["channel"])
+    if m.get("transpose") is not None:   flags |= F_TRANSPOSE; tr     = int(m["transpose"])
+    if m.get("slave_mode") is not None:
+        flags |= F_SLAVE | (F_SLAVE_ON if m["slave_mode"] else 0)
+    if m.get("immediate"):
+        flags |= F_IMMEDIATE
+    tail = b""
+    if m.get("scale_mask") is not None:
+        flags |= F_SCALE
+        tail = _COUNT.pack(int(m["scale_mask"]) & 0xFFF)
+    return _SET_FLAGS.pack(flags) + _SET_FIELDS.pack(tempo, subdiv, gate, ch, tr) + tail
+
+
+def _enc_seq(m):
+    notes = _notes_to_bytes(m.get("notes"))
+    return _COUNT.pack(len(notes)) + notes
+
+
+def _enc_chain(m):
+    slots = m.get("slots") or []
+    parts = [_CHAIN_HEAD.pack(int(m.get("index", 0)), len(slots))]
+    for s in slots:
+        notes = _notes_to_bytes(s.get("notes"))
+        loops = max(-1, min(0x7FFF, int(s.get("loops", 1))))
+        parts.append(_SLOT_HEAD.pack(loops, len(notes)))
+        parts.append(notes)
+    return b"".join(parts)
+
+
+def _enc_chain_begin(m):
+    return _BEGIN_HEAD.pack(int(m["id"]), int(m["slots"]), int(m.get("index", 0)))
+
+
+def _enc_chain_part(m):
+    notes = _notes_to_bytes(m.get("notes"))
+    loops = max(-1, min(0x7FFF, int(m.get("loops", 1))))
+    return _PART_HEAD.pack(int(m["id"]), int(m["slot"]), loops,
+                           int(m.get("offset", 0)), len(notes)) + notes
+
+
+def _enc_chain_commit(m):
+    return _COMMIT_HEAD.pack(int(m["id"]), int(m["crc"]) & 0xFFFFFFFF)
+
+
+def _enc_root(m):
+    mask = m.get("scale_mask")
+    return _ROOT.pack(int(m["index"]), mask is not None, int(mask or 0) & 0xFFF)
+
+
+def _enc_subscribe(m):
+    return _SUBSCRIBE.pack(bool(m.get("on", True)), bool(m.get("steps")))
+
+
+def _enc_event(m):
+    return _EVENT.pack(_EVENT_CODES[m["kind"]], int(m.get("gen", 0)) & 0xFFFF,
+                       int(m.get("slot", -1)), min(0xFFFF, int(m.get("loop", 0))),
+                       int(m.get("step", 0)) & 0xFFFFFFFF, int(m["t"]), int(m.get("pass", 0)) & 0xFFFF)
+
+
+def _enc_chain_edit(m):
+    ops = m.get("ops") or []
+    flags = (E_MORE if m.get("more") else 0) | (E_GEN if m.get("gen") is not None else 0)
+    parts = [_EDIT_HEAD.pack(_EDIT_AT.get(m.get("at") or "loop", 0), flags,
+                             int(m.get("gen") or 0) & 0xFFFF, len(ops))]
+    for op in ops:
+        notes = _notes_to_bytes(op.get("notes")) if op["op"] in ("replace", "insert") else b""
+        loops = max(-1, min(0x7FFF, int(op.get("loops", 1))))
+        parts.append(_EDIT_OP.pack(_EDIT_CODES[op["op"]], int(op.get("slot", 0)),
+                                   int(op.get("to", 0)), loops, len(notes)))
+        parts.append(notes)
+    return b"".join(parts)
+
+
+def _enc_pattern(m):
+    notes = _notes_to_bytes(m.get("notes"))
+    return _PAT_HEAD.pack(int(m["id"]), int(m.get("total", len(notes))),
+                          int(m.get("offset", 0)), len(notes)) + notes
+
+
+def _enc_chain_ref(m):
+    slots = m.get("slots") or []
+    parts = [_CHAIN_HEAD.pack(int(m.get("index", 0)), len(slots))]
+    for s in slots:
+        parts.append(_REF_SLOT.pack(int(s["id"]), max(-1, min(0x7FFF, int(s.get("loops", 1))))))
+    return b"".join(parts)
+
+
+_ENCODERS = {OP_SET: _enc_set, OP_SEQ: _enc_seq, OP_CHAIN: _enc_chain,
+             OP_CHAIN_BEGIN: _enc_chain_begin, OP_CHAIN_PART: _enc_chain_part,
+             OP_CHAIN_COMMIT: _enc_chain_commit,
+             OP_BANK_BEGIN: _enc_chain_begin, OP_ROOT: _enc_root,
+             OP_SUBSCRIBE: _enc_subscribe, OP_EVENT: _enc_event,
+             OP_CHAIN_EDIT: _enc_chain_edit,
+             OP_PATTERN: _enc_pattern, OP_CHAIN_REF: _enc_chain_ref}
+
+
+def encode(obj: dict):
+    """Return the binary datagram for a protocol dict, or None if it has no binary form."""
+    op = _OPS.get(obj.get("cmd"))
+    if op is None:
+        return None
+    enc = _ENCODERS.get(op)
+    try:
+        body = enc(obj) if enc else b""
+    except struct.error:
+        return None   # out-of-range field (e.g. >65535 notes): let the caller use JSON
+    return HEADER.pack(MAGIC, VERSION, op) + body
+
+
+# ----------------------------
+#           Decode
+# ----------------------------
+def _dec_set(buf, off):
+    if len(buf) < off + _SET_FLAGS.size + _SET_FIELDS.size:
+        raise WireError("truncated set")
+    (flags,) = _SET_FLAGS.unpack_from(buf, off)
+    tempo, subdiv, gate, ch, tr = _SET_FIELDS.unpack_from(buf, off + _SET_FLAGS.size)
+    m = {"cmd": "set"}
+    if flags & F_TEMPO:     m["tempo"]       = tempo
+    if flags & F_SUBDIV:    m["subdivision"] = subdiv
+    if flags & F_GATE:      m["gate"]        = gate
+    if flags & F_CHANNEL:   m["channel"]     = ch
+    if flags & F_TRANSPOSE: m["transpose"]   = tr
+    if flags & F_SLAVE:     m["slave_mode"]  = bool(flags & F_SLAVE_ON)
+    if flags & F_IMMEDIATE: m["immediate"]   = True
+    if flags & F_SCALE:
+        end = off + _SET_FLAGS.size + _SET_FIELDS.size
+        if len(buf) < end + _COUNT.size:
+            raise WireError("truncated set scale_mask")
+        (m["scale_mask"],) = _COUNT.unpack_from(buf, end)
+    return m
+
+
+def _dec_seq(buf, off):
+    if len(buf) < off + _COUNT.size:
+        raise WireError("truncated seq")
+    (count,) = _COUNT.unpack_from(buf, off)
+    notes, _ = _bytes_to_notes(buf, off + _COUNT.size, count)
+    return {"cmd": "seq", "notes": notes}
+
+
+def _dec_chain(buf, off):
+    if len(buf) < off + _CHAIN_HEAD.size:
+        raise WireError("truncated chain")
+    index, nslots = _CHAIN_HEAD.unpack_from(buf, off)
+    off += _CHAIN_HEAD.size
+    slots = []
+    for _ in range(nslots):
+        if len(buf) < off + _SLOT_HEAD.size:
+            raise WireError("truncated chain slot")
+        loops, count = _SLOT_HEAD.unpack_from(buf, off)
+        notes, off = _bytes_to_notes(buf, off + _SLOT_HEAD.size, count)
+        slots.append({"notes": notes, "loops": loops})
+    return {"cmd": "chain", "slots": slots, "index": index}
+
+
+def _dec_chain_begin(buf, off, cmd="chain_begin"):
+    if len(buf) < off + _BEGIN_HEAD.size:
+        raise WireError(f"truncated {cmd}")
+    uid, nslots, index = _BEGIN_HEAD.unpack_from(buf, off)
+    return {"cmd": cmd, "id": uid, "slots": nslots, "index": index}
+
+
+def _dec_chain_part(buf, off):
+    if len(buf) < off + _PART_HEAD.size:
+        raise WireError("truncated chain_part")
+    uid, slot, loops, offset, count = _PART_HEAD.unpack_from(buf, off)
+    notes, _ = _bytes_to_notes(buf, off + _PART_HEAD.size, count)
+    return {"cmd": "chain_part", "id": uid, "slot": slot, "loops": loops,
+            "offset": offset, "notes": notes}
+
+
+def _dec_chain_commit(buf, off):
+    if len(buf) < off + _COMMIT_HEAD.size:
+        raise WireError("truncated chain_commit")
+    uid, crc = _COMMIT_HEAD.unpack_from(buf, off)
+    return {"cmd": "chain_commit", "id": uid, "crc": crc}
+
+
+def _dec_root(buf, off):
+    if len(buf) < off + _ROOT.size:
+        raise WireError("truncated root")
+    index, has_mask, mask = _ROOT.unpack_from(buf, off)
+    m = {"cmd": "root", "index": index}
+    if has_mask:
+        m["scale_mask"] = mask
+    return m
+
+
+def _dec_subscribe(buf, off):
+    if len(buf) < off + _SUBSCRIBE.size:
+        raise WireError("truncated subscribe")
+    on, steps = _SUBSCRIBE.unpack_from(buf, off)
+    return {"cmd": "subscribe", "on": bool(on), "steps": bool(steps)}
+
+
+def _dec_event(buf, off):
+    if len(buf) < off + _EVENT.size:
+        raise WireError("truncated event")
+    kind, gen, slot, loop, step, t, pass_ = _EVENT.unpack_from(buf, off)
+    if kind not in EVENT_KINDS:
+        raise WireError(f"unknown event kind {kind}")
+    return {"cmd": "event", "kind": EVENT_KINDS[kind], "gen": gen, "slot": slot,
+            "loop": loop, "step": step, "t": t, "pass": pass_}
+
+
+def _dec_chain_edit(buf, off):
+    if len(buf) < off + _EDIT_HEAD.size:
+        raise WireError("truncated chain_edit")
+    at, flags, gen, nops = _EDIT_HEAD.unpack_from(buf, off)
+    off += _EDIT_HEAD.size
+    ops = []
+    for _ in range(nops):
+        if len(buf) < off + _EDIT_OP.size:
+            raise WireError("truncated chain_edit op")
+        code, slot, to, loops, count = _EDIT_OP.unpack_from(buf, off)
+        if code not in EDIT_OPS:
+            raise WireError(f"unknown chain_edit op {code}")
+        notes, off = _bytes_to_notes(buf, off + _EDIT_OP.size, count)
+        op = {"op": EDIT_OPS[code], "slot": slot}
+        if op["op"] in ("replace", "insert"):
+            op["notes"], op["loops"] = notes, loops
+        elif op["op"] == "move":
+            op["to"] = to
+        ops.append(op)
+    m = {"cmd": "chain_edit", "at": "slot" if at == 1 else "loop", "ops": ops}
+    if flags & E_MORE:
+        m["more"] = True
+    if flags & E_GEN:
+        m["gen"] = gen
+    return m
+
+
+def _dec_pattern(buf, off):
+    if len(buf) < off + _PAT_HEAD.size:
+        raise WireError("truncated pattern")
+    pid, total, offset, count = _PAT_HEAD.unpack_from(buf, off)
+    notes, _ = _bytes_to_notes(buf, off + _PAT_HEAD.size, count)
+    return {"cmd": "pattern", "id": pid, "total": total, "offset": offset, "notes": notes}
+
+
+def _dec_chain_ref(buf, off):
+    if len(buf) < off + _CHAIN_HEAD.size:
+        raise WireError("truncated chain_ref")
+    index, nslots = _CHAIN_HEAD.unpack_from(buf, off)
+    off += _CHAIN_HEAD.size
+    if len(buf) < off + nslots * _REF_SLOT.size:
+        raise WireError("truncated chain_ref slots")
+    slots = []
+    for _ in range(nslots):
+        pid, loops = _REF_SLOT.unpack_from(buf, off)
+        off += _REF_SLOT.size
+        slots.append({"id": pid, "loops": loops})
+    return {"cmd": "chain_ref", "slots": slots, "index": index}
+
+
+_DECODERS = {OP_SET: _dec_set, OP_SEQ: _dec_seq, OP_CHAIN: _dec_chain,
+             OP_CHAIN_BEGIN: _dec_chain_begin, OP_CHAIN_PART: _dec_chain_part,
+             OP_CHAIN_COMMIT: _dec_chain_commit,
+             OP_BANK_BEGIN: lambda b, o: _dec_chain_begin(b, o, "bank_begin"),
+             OP_ROOT: _dec_root,
+             OP_SUBSCRIBE: _dec_subscribe, OP_EVENT: _dec_event,
+             OP_CHAIN_EDIT: _dec_chain_edit,
+             OP_PATTERN: _dec_pattern, OP_CHAIN_REF: _dec_chain_ref}
+
+
+def decode(data: bytes) -> dict:
+    """Parse one binary datagram back into its protocol dict (raises WireError)."""
+    if len(data) < HEADER.size:
+        raise WireError("short datagram")
+    magic, version, op = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise WireError("bad magic")
+    if version > VERSION:
+        raise WireError(f"unsupported wire version {version}")
+    name = _NAMES.get(op)
+    if name is None:
+        raise WireError(f"unknown opcode {op}")
+    dec = _DECODERS.get(op)
+    return dec(data, HEADER.size) if dec else {"cmd": name}
+
+
+# ----------------------------
+#     Multi-part chain upload
+# ----------------------------
+def chain_checksum(slots) -> int:
+    """crc32 over every slot's (loops, count, int8 notes) — same bytes both ends."""
+    crc = 0
+    for s in slots or ():
+        notes = _notes_to_bytes(s.get("notes"))
+        loops = max(-1, min(0x7FFF, int(s.get("loops", 1))))
+        crc = zlib.crc32(_SLOT_HEAD.pack(loops, len(notes) & 0xFFFF), crc)
+        crc = zlib.crc32(notes, crc)
+    return crc & 0xFFFFFFFF
+
+
+def pattern_id(notes) -> int:
+    """Content address of a note array: 64-bit blake2b of its int8 wire bytes."""
+    return int.from_bytes(hashlib.blake2b(_notes_to_bytes(notes), digest_size=8).digest(), "little")
+
+
+def split_pattern(pid, notes, part_notes):
+    """PATTERN message(s) defining `notes` under `pid` (at least one)."""
+    notes = list(notes or [])
+    msgs, off = [], 0
+    while True:
+        chunk = notes[off:off + part_notes]
+        msgs.append({"cmd": "pattern", "id": pid, "total": len(notes), "offset": off, "notes": chunk})
+        off += len(chunk)
+        if off >= len(notes):
+            return msgs
+
+
+def split_chain(slots, index, upload_id, part_notes, begin="chain_begin"):
+    """
+    Break one chain into begin / per-slot fragments / commit messages.
+    Every slot gets at least one part (so empty slots still arrive).
+    begin="bank_begin" stages a root bank instead of a chain.
+    """
+    msgs = [{"cmd": begin, "id": upload_id, "slots": len(slots), "index": int(index)}]
+    for si, s in enumerate(slots):
+        notes = list(s.get("notes") or [])
+        loops = s.get("loops", 1)
+        off = 0
+        while True:
+            chunk = notes[off:off + part_notes]
+            msgs.append({"cmd": "chain_part", "id": upload_id, "slot": si,
+                         "loops": loops, "offset": off, "notes": chunk})
+            off += len(chunk)
+            if off >= len(notes):
+                break
+    msgs.append({"cmd": "chain_commit", "id": upload_id, "crc": chain_checksum(slots)})
+    return msgs
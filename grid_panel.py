@@ -10,7 +10,7 @@ from config import (
 )
 from chain_arps import ChainArpsWindow
 from utils import Tooltip, FancyTooltip, get_snapped_intervals_octaves, \
-                  best_scales_for_notes, snap_to_scale, find_implied_chord
+                  best_scales_for_notes, snap_notes, find_implied_chord
 from theory import CHORDS, get_scale_keys, get_chord_keys
 from collections import defaultdict
 from pathlib import Path
@@ -33,6 +33,16 @@ class IntervalGridPanel(tk.Frame):
         self.notes_button = None
         self.notes_label = None
 
+        # Shadow model: last options painted per widget, so refreshes only
+        # issue .config() (one Tcl round-trip each) for cells that changed.
+        self._painted = {}
+        self._paint_depth = 0
+        self._paint_mark = 0
+        self.tcl_calls = 0            # configs actually issued, all time
+        self.tcl_calls_skipped = 0    # configs avoided by the shadow model
+        self.last_refresh_calls = 0   # configs issued by the last refresh
+        self.refresh_count = 0
+
         self.cheatsheet_active = False
         self.cheatsheet_intervals = []
 
@@ -215,6 +225,21 @@ class IntervalGridPanel(tk.Frame):
                                   sticky=STICKY, padx=CELL_PAD, pady=0)
         self.notes_container.grid_propagate(False)
 
+        # Fixed pool of note labels, reconfigured in place by update_notes_row
+        inner = tk.Frame(self.notes_container, bg=COLORS['bg'])
+        inner.pack(expand=True, fill='both')     # <-- fill so it takes the row’s box
+        # DO NOT call pack_propagate(False) here
+        self._notes_row = tk.Frame(inner, bg=COLORS['bg'])
+        self._notes_row.pack(expand=True)        # <-- centers the whole strip horizontally
+        self._notes_row.bind('<Button-1>', self._show_notes_menu)
+        self._note_pool = []
+        for _ in range(12):                      # update_display_notes caps at 12
+            lbl = tk.Label(self._notes_row, text="", font=self._font_notes, bg=COLORS['bg'])
+            lbl.bind('<Button-1>', self._show_notes_menu)
+            self._note_pool.append(lbl)
+        self._notes_shown = 0
+        FancyTooltip(self.notes_container, lambda: self._notes_tooltip_text())
+
         arrow_opts = dict(width=4, height=2, relief="ridge", bd=1,
                           bg="white", fg="black",
                           font=self._font_small, cursor="hand2")
@@ -315,24 +340,63 @@ class IntervalGridPanel(tk.Frame):
 
 
 
+    # ---------- shadow-model painting ----------
+    def _paint(self, widget, **opts):
+        """widget.config(**opts), limited to options that differ from the last paint."""
+        last = self._painted.get(widget)
+        if last is None:
+            last = self._painted[widget] = {}
+            changed = opts
+        else:
+            changed = {k: v for k, v in opts.items() if last.get(k) != v}
+        if not changed:
+            self.tcl_calls_skipped += 1
+            return
+        widget.config(**changed)
+        last.update(changed)
+        self.tcl_calls += 1
+
+    def _begin_paint(self):
+        if self._paint_depth == 0:
+            self._paint_mark = self.tcl_calls
+        self._paint_depth += 1
+
+    def _end_paint(self):
+        self._paint_depth -= 1
+        if self._paint_depth == 0:
+            self.refresh_count += 1
+            self.last_refresh_calls = self.tcl_calls - self._paint_mark
+
+    def paint_stats(self) -> dict:
+        """Tcl config calls: last refresh, running totals, and calls skipped."""
+        return {
+            "refreshes": self.refresh_count,
+            "last_refresh_calls": self.last_refresh_calls,
+            "tcl_calls": self.tcl_calls,
+            "skipped": self.tcl_calls_skipped,
+        }
+
     def update_grid(self):
+        self._begin_paint()
+        try:
+            self._paint_cells()
+            # Refresh highlight borders after text/colors
+            self._refresh_overlays()
+        finally:
+            self._end_paint()
+
+    def _paint_cells(self):
         root = next(iter(self.state.selected_notes)) if self.state.selected_notes else None
+        muted = self.state.muted_intervals
 
         for iv in range(13):
-            # Set note label text + color
             if not self.state.selected_notes:
-                txt = "–"
-                note_color = COLORS['text']
                 base_note = None
             else:
-                idx = (NOTE_NAMES.index(root) + iv) % 12
-                enh = ENHARMONIC[idx]
-                txt = enh.split("/")[1] if self.state.use_flats and "/" in enh else enh.split("/")[0]
-                base_note = NOTE_NAMES[idx]
-                note_color = NOTE_TO_COLOR.get(base_note, COLORS['text'])
+                base_note = NOTE_NAMES[(NOTE_NAMES.index(root) + iv) % 12]
 
-            # Only text/fg here; frame color handled in _refresh_overlays
-            self.note_labels[iv].config(text=txt, fg=note_color, font=self._font_small, bg=COLORS['bg'])
+            # Note label text/fg/frame are painted in _refresh_overlays (it
+            # always ran last and overwrote them here anyway)
 
             # Interval button visual — ALWAYS note color; gray ONLY when muted
             ib = self.interval_buttons[iv]
@@ -345,43 +409,28 @@ class IntervalGridPanel(tk.Frame):
                     idx_fb = (NOTE_NAMES.index(fallback_root) + iv) % 12
                     bn = NOTE_NAMES[idx_fb]
 
-            if iv in self.state.muted_intervals:
+            if iv in muted:
                 ib_bg = "#E0E0E0"                 # muted → gray
             else:
                 ib_bg = NOTE_TO_COLOR.get(bn, "#E0E0E0")  # always the note color
 
-            ib.config(bg=ib_bg, fg="black")
+            self._paint(ib, bg=ib_bg, fg="black")
 
 
             # Octave cells
+            self._ensure_collections(iv)
+            octs = self.state.extension_octaves[iv]
+            on_color = 'lightgray' if iv in muted else NOTE_TO_COLOR.get(base_note, COLORS['button'])
             for o, ob in enumerate(self.octave_buttons[iv]):
-                self._ensure_collections(iv)
-                active = (o in self.state.extension_octaves[iv])
-
-                color = (
-                    'lightgray' if iv in self.state.muted_intervals
-                    else NOTE_TO_COLOR.get(base_note, COLORS['button'])
-                ) if active else 'white'
-
-                ob.config(bg=color, fg='black')
-
-
-
-
-        # Refresh highlight borders after text/colors
-        self._refresh_overlays()
-
+                self._paint(ob, bg=(on_color if o in octs else 'white'), fg='black')
 
 
-    def update_notes_row(self):
-        # Clear previous widgets
-        for child in self.notes_container.winfo_children():
-            child.destroy()
 
-        # 1) Build unique note list from current sequence (with optional snapping)
+    def update_display_notes(self):
+        """Unique (display name, note) pairs of the current sequence; sets state.display_notes."""
         seq = self.state.last_seq or []
         if (self.state.diatonic_mode and not self.state.stay_in_key and self.state.scale_notes):
-            seq = [snap_to_scale(n, self.state.scale_notes) if n is not None else None for n in seq]
+            seq = snap_notes(seq, self.state.scale_notes)
 
         seen = set()
         names = []
@@ -397,26 +446,22 @@ class IntervalGridPanel(tk.Frame):
                 if len(names) >= 12:
                     break
         self.state.display_notes = [n[1] for n in names]
+        return names
 
-        # 2) Render as a single horizontal row, centered in the fixed-height container
-        inner = tk.Frame(self.notes_container, bg=COLORS['bg'])
-        inner.pack(expand=True, fill='both')     # <-- fill so it takes the row’s box
-        # DO NOT call pack_propagate(False) here
-
-        row = tk.Frame(inner, bg=COLORS['bg'])
-        row.pack(expand=True)                    # <-- centers the whole strip horizontally
-
-        row.bind('<Button-1>', self._show_notes_menu)
-
-        for label, base in names:
-            col = NOTE_TO_COLOR.get(base, COLORS['text'])
-            lbl = tk.Label(row, text=label, font=self._font_notes, bg=COLORS['bg'], fg=col)
-            lbl.pack(side='left', padx=(0, CELL_PAD))
-            lbl.bind('<Button-1>', self._show_notes_menu)
-
-
+    def update_notes_row(self):
+        # 1) Build unique note list from current sequence (with optional snapping)
+        names = self.update_display_notes()
 
-        FancyTooltip(self.notes_container, lambda: self._notes_tooltip_text())
+        # 2) Reconfigure the pooled labels; visible ones are always a prefix of
+        #    the pool, so packing/unpacking at the tail keeps their order
+        for i, (label, base) in enumerate(names):
+            lbl = self._note_pool[i]
+            self._paint(lbl, text=label, fg=NOTE_TO_COLOR.get(base, COLORS['text']))
+            if i >= self._notes_shown:
+                lbl.pack(side='left', padx=(0, CELL_PAD))
+        for lbl in self._note_pool[len(names):self._notes_shown]:
+            lbl.pack_forget()
+        self._notes_shown = len(names)
 
 
 
@@ -434,43 +479,29 @@ class IntervalGridPanel(tk.Frame):
 
             
     # ----------------------------------------------------------------------
-    # grid_panel.py  –  replace the whole _open_fredt() body
     def _open_fredt(self):
-        from config import NOTE_NAMES
-        from utils import resource_path
-        import subprocess, sys, os
-
-        # ── build note list (unchanged) ───────────────────────────────
-        seq   = getattr(self.state, "last_seq", [])
-        pcs   = {n % 12 for n in seq if n is not None} if seq else set()
-        notes = [NOTE_NAMES[pc] for pc in sorted(pcs)] or sorted(self.state.selected_notes)
-        if not notes:
-            return
-        root_name = getattr(self.state, "original_root", None) or notes[0]
+        # One long-lived viewer: update it in place, spawning only if none listens
+        from fredt_link import get_link, notes_from_state
 
-        fredt_py = resource_path("FREDT/fredt_main.py")
-        if not os.path.exists(fredt_py):
-            print("⚠️  fredt_main.py not found")
+        root_name, notes = notes_from_state(self.state)
+        if not notes:
             return
-
-        # ── **here is the only line that changed** ──
-        python_exe = "pythonw" if getattr(sys, "frozen", False) else sys.executable
-        # --------------------------------------------
-
-        subprocess.Popen(
-            [python_exe, fredt_py, "--root", root_name, "--notes", ",".join(notes)],
-            cwd=os.path.dirname(fredt_py),
-            creationflags=(
-                subprocess.CREATE_NO_WINDOW        # still suppresses if python.exe used
-                if sys.platform == "win32" else 0
-            )
-        )
+        link = get_link()
+        if link.show(root_name, notes):
+            link.follow(self.state)     # keep it in step with last_seq from here on
 
 
     # ─────────────────────────────────────────────────────────────
 
     def _refresh_overlays(self):
         """Colour the left-hand note labels with frames that always match."""
+        self._begin_paint()
+        try:
+            self._paint_overlays()
+        finally:
+            self._end_paint()
+
+    def _paint_overlays(self):
         # determine the current root index safely
         root = next(iter(self.state.selected_notes), None)
         if root in NOTE_NAMES:
@@ -525,8 +556,9 @@ class IntervalGridPanel(tk.Frame):
             colour = NOTE_TO_COLOR.get(base_note, COLORS['highlight'])
 
             # border = wrapper bg; inner label stays on app bg
-            wrap.config(bg=(colour if show else COLORS['bg']))
-            lbl.config(
+            self._paint(wrap, bg=(colour if show else COLORS['bg']))
+            self._paint(
+                lbl,
                 text=base_note,
                 bg=COLORS['bg'],
                 fg=NOTE_TO_COLOR.get(base_note, COLORS['text']),
@@ -582,6 +614,7 @@ class IntervalGridPanel(tk.Frame):
             # chord overlay shouldn't force scale filtering
             self.state.scale = None
             self.state.scale_notes.clear()
+            self.state.touch("sequence")
 
         self._refresh_overlays()
         self.on_change()
@@ -595,6 +628,7 @@ class IntervalGridPanel(tk.Frame):
         # clear any scale filtering
         self.state.scale = None
         self.state.scale_notes.clear()
+        self.state.touch("sequence")
         self.state.last_selection_label = ""
 
         # fully exit Diatonic + Stay-In-Key (if they were on)
@@ -912,18 +946,16 @@ class IntervalGridPanel(tk.Frame):
 
         # ── identify chords & bucket them ───────────────────────────────
         def _identify(self, sel_mask, bass_pc):
-            from theory import NOTE_NAMES, CHORDS
+            from theory import NOTE_NAMES
+            from chord_index import get_index
             from collections import defaultdict
 
             pcs       = [i for i in range(12) if sel_mask & (1 << i)]
-            sel_set   = set(pcs)
-            N         = len(sel_set)
+            N         = len(pcs)
             user_root = getattr(self.master.state, "original_root", None)
+            index     = get_index()
 
             # ── helpers ──────────────────────────────────────────────
-            def pc_set(r, ivs):            # root-pc → set of chord pcs
-                return {(r + iv) % 12 for iv in ivs}
-
             def inversion_sort_key(d):     # order inversions by distance
                 root = d["root_pc"]
                 bass = d.get("bass_pc", root)
@@ -936,49 +968,30 @@ class IntervalGridPanel(tk.Frame):
             buckets = defaultdict(list)
             seen    = set()
 
-            for key, meta in CHORDS.items():
-                if "alias_of" in meta or meta["length"] > N:
-                    continue
-                ivs = meta["intervals"]
+            # chord ⊆ selection or selection ⊆ chord, in CHORDS × root order
+            for m in index.matches(sel_mask):
+                root = m.root
+                # “no5”: selection ⊆ chord and only the 5th is missing
+                disp = m.disp + "no5" if index.is_no5(m, sel_mask) else m.disp
 
-                for root in range(12):
-                    pcs_ch = pc_set(root, ivs)
-                    missing = pcs_ch - sel_set       # chord notes not played
-                    # allow either exact/full match or selection subset of a chord
-                    if not (pcs_ch.issubset(sel_set) or sel_set.issubset(pcs_ch)):
+                base = NOTE_NAMES[root] + disp
+                for bass in m.bass_order:
+                    name = base if bass == root else f"{base}/{NOTE_NAMES[bass]}"
+                    if name in seen:
                         continue
-
-                    # detect a “no5” case (selection ⊆ chord and only 5th is missing)
-                    fifth_pc = (root + 7) % 12
-                    no5 = sel_set.issubset(pcs_ch) and missing == {fifth_pc}
-
-                    # build display name (compact)
-                    disp = (meta.get("display_name", key)
-                               .replace("Diminished", "dim")
-                               .replace("Augmented",  "aug")
-                               .replace("Major",      "maj")
-                               .replace("Minor",      "min"))
-                    if no5:
-                        disp += "no5"
-
-                    base = NOTE_NAMES[root] + disp
-                    for bass in pcs_ch:
-                        name = base if bass == root else f"{base}/{NOTE_NAMES[bass]}"
-                        if name in seen:
-                            continue
-                        seen.add(name)
-
-                        matches = len(pcs_ch)
-                        tag     = ("EXACT" if matches == N and NOTE_NAMES[root] == user_root
-                                   else f"{matches}/{N}")
-
-                        buckets[tag].append({
-                            "name":      name,
-                            "root_pc":   root,
-                            "bass_pc":   bass if bass != root else None,
-                            "intervals": ivs,
-                            "chord_type": key
-                        })
+                    seen.add(name)
+
+                    matches = m.size
+                    tag     = ("EXACT" if matches == N and NOTE_NAMES[root] == user_root
+                               else f"{matches}/{N}")
+
+                    buckets[tag].append({
+                        "name":      name,
+                        "root_pc":   root,
+                        "bass_pc":   bass if bass != root else None,
+                        "intervals": m.intervals,
+                        "chord_type": m.key
+                    })
 
             # ——— determine the note‐header order from the first EXACT match ———
             if "EXACT" in buckets and buckets["EXACT"]:
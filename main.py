@@ -6,7 +6,7 @@ import random
 import sys
 import json, socket, threading, os
 from utils import NOTE_NAMES, KeyMapper
-from config import COLORS, NOTE_TO_COLOR, MIDI_PORT_NAME
+from config import COLORS, NOTE_TO_COLOR, MIDI_PORT_NAME, UI_MAX_FPS, ENGINE_HOST
 from state import AppState
 from theory import SCALES, NOTE_NAMES
 from grid_panel import IntervalGridPanel
@@ -15,9 +15,9 @@ from transport_panel import TransportPanel
 from midi_engine import MidiEngine
 from sequence_engine import SequenceGenerator
 from utils import resource_path
-from chain_runner import ChainRunner
 from chain_arps import ChainArpsWindow
 from rt_daemon import GordRTDaemon
+from refresh_scheduler import RefreshScheduler
 import atexit 
 
 # ── Main ──────────────────────────────────────────────────────────────
@@ -79,11 +79,19 @@ def main():
 
     # ── Global state ────────────────────────────────────────────────
     state = AppState()
-    engine = MidiEngine(state)
+    if ENGINE_HOST or os.environ.get("GORD_ENGINE_HOST") == "1":
+        from engine_host import EngineProxy
+        engine = EngineProxy(state)       # engine + chain runner off the Tk process
+        atexit.register(engine.close)
+    else:
+        engine = MidiEngine(state)
     engine.panic()
     state.last_seq = SequenceGenerator(state).get_sequence_list()  # initial empty list
     state._prev_root = state.original_root 
 
+    # Panel repaints are coalesced per frame; panels register below
+    refresh = RefreshScheduler(root, max_fps=UI_MAX_FPS)
+
     # ── Helper: rebuild sequence from state ────────────────────────
     def regenerate_sequence():
         state.last_seq = SequenceGenerator(state).get_sequence_list()
@@ -119,41 +127,32 @@ def main():
         # 2) Compute allowed pitch-classes
         state.scale_notes = set()
         if state.diatonic_mode and getattr(state, "scale", None):
-            from utils import calc_scale_notes, snap_to_scale
+            from utils import calc_scale_notes, snap_notes
             # Anchor key tonic stays fixed while Stay-In-Key is ON
             anchor_tonic = (getattr(state, "key_anchor", None) or state.original_root) if getattr(state, "stay_in_key", False) else state.original_root
             state.scale_notes = calc_scale_notes(anchor_tonic, state.scale)
 
             # 3) If we are staying in key, snap EVERY note (prefer upward)
             if getattr(state, "stay_in_key", False):
-                snapped = []
-                for n in base_seq:
-                    if n is None:
-                        snapped.append(None)
-                    else:
-                        snapped.append(snap_to_scale(n, state.scale_notes))  # tries +1, -1, +2, -2...
-                state.last_seq = snapped
+                state.last_seq = snap_notes(base_seq, state.scale_notes)  # tries +1, -1, +2, -2...
             else:
                 # Plain diatonic filter/snap when not staying in key
-                state.last_seq = [snap_to_scale(n, state.scale_notes) if n is not None else None for n in base_seq]
+                state.last_seq = snap_notes(base_seq, state.scale_notes)
         else:
             # No diatonic behavior
             state.last_seq = base_seq
 
+        # Root bank: the daemon already holds this root's pattern; keep GUI in step with it
+        banked = engine.root_bank_seq(state.original_root)
+        if banked is not None:
+            state.last_seq = banked
+
         # Keep selection to the current root (the grid header & pull-in root should follow the keybed)
         state.selected_notes = {state.original_root}
+        grid.update_display_notes()     # model data chain snapshots read right away
 
-        # ---------- refresh GUI ----------
-        piano.redraw()
-        grid.update_grid()
-        grid._refresh_overlays()
-        grid.update_notes_row()
-        seq.update_counters()
-
-        # IMPORTANT: pull-in grid should display relative to CURRENT root
-        seq.set_root(state.original_root)
-
-        transport.update_export_buttons()
+        # ---------- refresh GUI (deferred + merged, see RefreshScheduler) ----------
+        refresh.mark("piano", "grid", "notes_row", "counters", "seq_root", "export")
 
 
 
@@ -171,8 +170,8 @@ def main():
         if state.chain_mode_enabled:
             if state.chain_runner is None:
                 raw = state.chain_arps_window.global_loops_var.get().strip().lower()
-                state.chain_runner = ChainRunner(
-                    state, engine,
+                state.chain_runner = engine.make_chain_runner(
+                    state,
                     state.chain_arps_window._update_ticker_for_row,
                     state.chain_arps_window._on_chain_complete,
                     global_loops=raw
@@ -245,6 +244,7 @@ def main():
         state.extension_octaves.clear()
         state.muted_intervals.clear()
         state.last_seq.clear()
+        state.touch("sequence")
 
         # exit any Build-mode preview
         state.build_mode_enabled = False
@@ -264,6 +264,7 @@ def main():
             state.selected_notes.clear()
             state.selected_notes.add(note)
             state.original_root = note
+            engine.select_root(note)   # root bank: daemon switches before we repaint
             on_change()
 
     # ── Grid column weights ────────────────────────────────────────
@@ -298,7 +299,7 @@ def main():
 
     # ── Left: Interval / Octave grid ───────────────────────────────
     grid = IntervalGridPanel(root, state, engine, on_change=on_change)
-    root.bind("<<RedrawIntervals>>", lambda e: grid._refresh_overlays())
+    root.bind("<<RedrawIntervals>>", lambda e: refresh.mark("overlays"))
     grid.grid(row=0, column=0, sticky='n', padx=(0, 0), pady=(20, 0))
 
     # ── Right: Sequence / Piano panel ──────────────────────────────
@@ -313,6 +314,16 @@ def main():
     piano = seq.piano
     piano.root_label.pack_forget()  # hide duplicate root note beside piano
 
+    # ── Refresh scheduler: paint order for on_change ───────────────
+    refresh.register("piano",     piano.redraw)
+    refresh.register("grid",      grid.update_grid)            # includes overlays
+    refresh.register("overlays",  grid._refresh_overlays)
+    refresh.register("notes_row", grid.update_notes_row)
+    refresh.register("counters",  seq.update_counters)
+    # IMPORTANT: pull-in grid should display relative to CURRENT root
+    refresh.register("seq_root",  lambda: seq.set_root(state.original_root))
+    refresh.register("export",    transport.update_export_buttons)
+
     # Wire transport to sequence panel
     seq.transport = transport
     
@@ -1,6 +1,17 @@
 # midi_engine.py — daemon-driven transport (KORG-level minimal, anti-trill + empty-start fix)
-import threading, time, json, socket
-from utils import snap_to_scale
+import threading, time, json, socket, os, atexit
+from config import NOTE_NAMES
+from utils import snap_note, snap_notes, pcs_mask
+from sequence_engine import build_root_bank, root_bank_signature
+import gord_wire
+
+def _wire_loops(v) -> int:
+    """Slot loop count as the daemon takes it: -1 = infinite (None / "x"), else >= 1."""
+    if v is None: return -1
+    if isinstance(v, str) and v.strip().lower() in ("x","none",""): return -1
+    try: return max(1, int(v))
+    except Exception: return 1
+
 
 # ----------------------------
 #  UDP client for Swift daemon
@@ -12,8 +23,76 @@ class GordRTClient:
         # debug signatures to avoid spam
         self._dbg_last_seq = None
         self._dbg_last_chain = None
-        
-        
+        # wire format: JSON until a daemon answers the noop handshake
+        self.wire_version = 0
+        self.caps = set()
+        self._reply_path = None
+        self._upload_id = 0
+        # pattern dictionary ('patterns' cap): ids the daemon holds, last chain sent by ref
+        self.known_patterns = set()
+        self._chain_lock = threading.Lock()
+        self._last_ref_chain = None
+        self._resend_budget = 0
+
+    def _bind_reply_path(self):
+        # the daemon can only answer a bound datagram socket
+        if self._reply_path:
+            return True
+        path = f"/tmp/gord_rt_client.{os.getpid()}.{id(self):x}.sock"
+        try:
+            try: os.unlink(path)
+            except FileNotFoundError: pass
+            self.sock.bind(path)
+        except OSError:
+            return False
+        self._reply_path = path
+        atexit.register(self.close)
+        return True
+
+    def negotiate(self, timeout=0.25):
+        """
+        Handshake on noop: offer our binary wire version and wait briefly for
+        {"cmd":"hello","wire":N,"caps":[...]}. Older daemons stay silent and we
+        keep speaking JSON. Returns the negotiated wire version (0 = JSON).
+        """
+        self.wire_version = 0
+        self.caps = set()
+        self.known_patterns = set()   # a (re)started daemon holds no patterns
+        if not self._bind_reply_path():
+            return 0
+        hello = {"cmd": "noop", "hello": 1, "wire": gord_wire.VERSION}
+        prev = self.sock.gettimeout()
+        try:
+            self.sock.settimeout(0.0)
+            try:    # drop stale replies
+                while self.sock.recv(4096): pass
+            except (BlockingIOError, OSError):
+                pass
+            self.sock.settimeout(timeout)
+            self.sock.sendto(json.dumps(hello).encode("utf-8"), self.path)
+            data = self.sock.recv(4096)
+            reply = json.loads(data.decode("utf-8"))
+            if reply.get("cmd") == "hello":
+                self.wire_version = min(gord_wire.VERSION, int(reply.get("wire", 0)))
+                self.caps = set(reply.get("caps") or [])
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.sock.settimeout(prev)
+        return self.wire_version
+
+    def _encode(self, obj: dict) -> bytes:
+        if self.wire_version:
+            data = gord_wire.encode(obj)
+            if data is not None:
+                return data
+        return json.dumps(obj).encode("utf-8")
+
+    def close(self):
+        path, self._reply_path = self._reply_path, None
+        if path:
+            try: os.unlink(path)
+            except OSError: pass
 
     def _send(self, obj: dict):
         # --- minimal one-line TX probe (only on content change) ---
@@ -37,13 +116,13 @@ class GordRTClient:
             pass
         # -----------------------------------------------------------
         try:
-            self.sock.sendto(json.dumps(obj).encode("utf-8"), self.path)
+            self.sock.sendto(self._encode(obj), self.path)
         except OSError:
             pass
 
     def set_params(self, *, tempo=None, subdivision=None, gate=None,
                    channel=None, transpose=None, slave_mode=None,
-                   immediate=False):
+                   scale_mask=None, immediate=False):
         msg = {"cmd": "set"}
         if tempo is not None:        msg["tempo"]       = float(tempo)
         if subdivision is not None:  msg["subdivision"] = int(subdivision)
@@ -51,6 +130,7 @@ class GordRTClient:
         if channel is not None:      msg["channel"]     = int(channel)
         if transpose is not None:    msg["transpose"]   = int(transpose)
         if slave_mode is not None:   msg["slave_mode"]  = bool(slave_mode)
+        if scale_mask is not None:   msg["scale_mask"]  = int(scale_mask) & 0xFFF
         if immediate:                msg["immediate"]   = True
         self._send(msg)
         
@@ -71,28 +151,236 @@ class GordRTClient:
 
 
     def set_chain(self, slots, index=0):
-        def _loops(v):
-            if v is None: return -1
-            if isinstance(v, str) and v.strip().lower() in ("x","none",""): return -1
-            try: return max(1, int(v))
-            except: return 1
         payload = {"cmd":"chain","slots":[{"notes":[-1 if n is None else int(n) for n in s.get("notes",[])],
-                                           "loops":_loops(s.get("loops",1))} for s in slots],
+                                           "loops":_wire_loops(s.get("loops",1))} for s in slots],
                    "index": int(index)}
         lens  = [len(s.get("notes", [])) for s in slots]
-        loops = [_loops(s.get("loops", 1)) for s in slots]
+        loops = [_wire_loops(s.get("loops", 1)) for s in slots]
         print(f"[GORD→DAEMON] CHAIN slots={len(slots)} lens={lens} loops={loops} index={index}")
-        self._send(payload)
+        if "patterns" in self.caps and payload["slots"]:
+            self._resend_budget = 3
+            if self._send_chain_ref(payload):
+                return
+        if len(self._encode(payload)) <= gord_wire.MAX_DGRAM:
+            self._send(payload)
+        elif "chunked_chain" in self.caps:
+            self._send_chain_parts(payload)
+        else:
+            print(f"[GORD→DAEMON] CHAIN too large for one datagram; daemon has no chunked upload")
+            self._send(payload)
+
+    def _send_chain_ref(self, payload) -> bool:
+        """
+        Arm `payload` by reference: define only the patterns the daemon doesn't
+        hold yet, then send {"cmd":"chain_ref"} (10 bytes per slot). False if
+        even the reference list won't fit one datagram.
+        """
+        ref = {"cmd": "chain_ref", "index": payload["index"],
+               "slots": [{"id": gord_wire.pattern_id(s["notes"]), "loops": s["loops"]}
+                         for s in payload["slots"]]}
+        if len(self._encode(ref)) > gord_wire.MAX_DGRAM:
+            return False
+        part = gord_wire.PART_NOTES_BINARY if self.wire_version else gord_wire.PART_NOTES_JSON
+        with self._chain_lock:
+            for s, r in zip(payload["slots"], ref["slots"]):
+                if r["id"] in self.known_patterns:
+                    continue
+                for msg in gord_wire.split_pattern(r["id"], s["notes"], part):
+                    self._send(msg)
+                self.known_patterns.add(r["id"])
+            self._send(ref)
+            self._last_ref_chain = payload
+        return True
+
+    def _on_missing(self, ids):
+        # the daemon lost patterns we thought it held (restart / eviction): re-arm once more
+        with self._chain_lock:
+            lost = self.known_patterns.intersection(ids)
+            self.known_patterns.difference_update(ids)
+            payload = self._last_ref_chain
+        if not lost or payload is None or self._resend_budget <= 0:
+            return
+        self._resend_budget -= 1
+        print(f"[GORD→DAEMON] CHAIN re-defining {len(lost)} pattern(s) the daemon lost")
+        self._send_chain_ref(payload)
+
+    def chain_edit(self, ops, at="loop", gen=None) -> bool:
+        """
+        Send replace/insert/delete/move ops for the live chain ('chain_edit'
+        cap), split over datagrams when needed. False if one op alone is too
+        big for a datagram (caller re-arms with set_chain instead).
+        """
+        clean = []
+        for op in ops:
+            op = dict(op)
+            if "notes" in op:
+                op["notes"] = [-1 if n is None else int(n) for n in op["notes"]]
+                op["loops"] = _wire_loops(op.get("loops", 1))   # same coercion as set_chain
+            clean.append(op)
+
+        def _msg(batch, more):
+            m = {"cmd": "chain_edit", "at": at, "ops": batch}
+            if more: m["more"] = True
+            if gen is not None: m["gen"] = int(gen)
+            return m
+
+        batches, batch = [], []
+        for op in clean:
+            if len(self._encode(_msg([op], True))) > gord_wire.MAX_DGRAM:
+                return False
+            if batch and len(self._encode(_msg(batch + [op], True))) > gord_wire.MAX_DGRAM:
+                batches.append(batch)
+                batch = []
+            batch.append(op)
+        batches.append(batch)
+        print(f"[GORD→DAEMON] CHAIN EDIT {[op['op'] + str(op['slot']) for op in clean]} at={at}")
+        for i, b in enumerate(batches):
+            self._send(_msg(b, i < len(batches) - 1))
+        return True
+
+    def _send_chain_parts(self, payload, begin="chain_begin"):
+        # begin → per-slot fragments → commit(crc32); the daemon installs at commit only
+        self._upload_id = (self._upload_id + 1) & 0xFFFFFFFF
+        part = gord_wire.PART_NOTES_BINARY if self.wire_version else gord_wire.PART_NOTES_JSON
+        for msg in gord_wire.split_chain(payload["slots"], payload["index"], self._upload_id,
+                                         part, begin=begin):
+            self._send(msg)
+
+    def set_bank(self, patterns, index=0):
+        """Upload one pattern per root (always multi-part; needs 'root_bank')."""
+        slots = [{"notes": list(p), "loops": -1} for p in patterns]
+        print(f"[GORD→DAEMON] BANK roots={len(slots)} lens={[len(p) for p in patterns]} index={index}")
+        self._send_chain_parts({"slots": slots, "index": int(index)}, begin="bank_begin")
+
+    def select_root(self, index, scale_mask=None):
+        msg = {"cmd": "root", "index": int(index)}
+        if scale_mask is not None:
+            msg["scale_mask"] = int(scale_mask) & 0xFFF
+        self._send(msg)
 
     def start(self): self._send({"cmd": "start"})
     def stop(self):  self._send({"cmd": "stop"})
     def panic(self): self._send({"cmd": "panic"})
 
+    # ---------- event feed ('events' cap) ----------
+    def subscribe(self, on=True, steps=False):
+        """Ask the daemon to send loop (and optionally step) events to our reply socket."""
+        if not self._bind_reply_path():
+            return False
+        self._send({"cmd": "subscribe", "on": bool(on), "steps": bool(steps),
+                    "wire": self.wire_version})
+        return True
+
+    def recv_event(self, timeout=None):
+        """
+        Next event dict from the daemon, or None on timeout / a non-event
+        datagram. "missing" pattern replies are handled here on the way.
+        """
+        if not self._reply_path:
+            return None
+        try:
+            self.sock.settimeout(timeout)
+            data = self.sock.recv(4096)
+        except OSError:
+            return None
+        try:
+            msg = gord_wire.decode(data) if gord_wire.is_binary(data) else json.loads(data.decode("utf-8"))
+        except ValueError:
+            return None
+        if isinstance(msg, dict) and msg.get("cmd") == "missing":
+            self._on_missing(msg.get("ids") or [])
+            return self.recv_event(timeout)
+        return msg if isinstance(msg, dict) and msg.get("cmd") == "event" else None
+
+
+# ----------------------------
+#      Chain edit diffing
+# ----------------------------
+def rows_editable(old_rows, new_rows) -> bool:
+    """Both chains identify every slot by a distinct Chain Arps row."""
+    return (None not in old_rows and None not in new_rows
+            and len(set(old_rows)) == len(old_rows) and len(set(new_rows)) == len(new_rows))
+
+
+def chain_edit_ops(old_rows, old_slots, new_rows, new_slots):
+    """
+    Ops turning the armed chain (old) into new, slots matched by row:
+    deletes (high → low), then per target position a move or insert, plus a
+    replace where a kept slot's notes/loops changed. Unchanged slots cost nothing.
+    """
+    ops = []
+    rows = list(old_rows)
+    by_row = dict(zip(old_rows, old_slots))
+    keep = set(new_rows)
+    for i in range(len(rows) - 1, -1, -1):
+        if rows[i] not in keep:
+            ops.append({"op": "delete", "slot": i})
+            rows.pop(i)
+    for j, (row, slot) in enumerate(zip(new_rows, new_slots)):
+        if j < len(rows) and rows[j] == row:
+            pass
+        elif row in rows:
+            p = rows.index(row)
+            ops.append({"op": "move", "slot": p, "to": j})
+            rows.insert(j, rows.pop(p))
+        else:
+            ops.append({"op": "insert", "slot": j, "notes": slot["notes"], "loops": slot["loops"]})
+            rows.insert(j, row)
+            continue
+        old = by_row[row]
+        if list(old["notes"]) != list(slot["notes"]) or old["loops"] != slot["loops"]:
+            ops.append({"op": "replace", "slot": j, "notes": slot["notes"], "loops": slot["loops"]})
+    return ops
+
 
 # ----------------------------
 #            Engine
 # ----------------------------
-class MidiEngine:
+class EngineParams:
+    """Transport parameters read off AppState (shared by MidiEngine and engine_host.EngineProxy)."""
+    def get_subdivision(self) -> int:
+        return int(getattr(self.state, "subdivision", 16))
+
+    def get_tempo(self) -> float:
+        # Prefer bpm; fall back to legacy 'tempo' if present.
+        return float(getattr(self.state, "bpm", getattr(self.state, "tempo", 120.0)))
+
+
+    def get_channel(self) -> int:
+        return int(getattr(self.state, "default_channel", 1))
+
+    def get_transpose(self) -> int:
+        return int(getattr(self.state, "transpose", 0))
+
+    def set_transpose(self, semitones: int):
+        """Key/octave shift; with daemon-side transpose the mirror sends one `set`."""
+        self.state.transpose = int(semitones)
+
+    def is_slave(self) -> bool:
+        return bool(getattr(self.state, "slave_mode", False))
+
+    def get_gate(self) -> float:
+        raw = getattr(self.state, "gate", getattr(self.state, "gate_pct", 45.0))
+        try:
+            g = float(raw)
+        except Exception:
+            g = 45.0
+        if g > 1.5:
+            g = g / 100.0
+        return max(0.01, min(0.99, g))
+
+    def _gate_pct(self) -> float:
+        raw = getattr(self.state, "gate", getattr(self.state, "gate_pct", 45.0))
+        try:
+            g = float(raw)
+        except Exception:
+            g = 45.0
+        if g <= 1.5:
+            g *= 100.0
+        return max(1.0, min(99.0, g))
+
+
+class MidiEngine(EngineParams):
     """
     - Mirrors params/seq to the Swift daemon (debounced)
     - Idempotent Start/Stop (no “burst”/”trill” leftovers)
@@ -100,6 +388,9 @@ class MidiEngine:
     - Chain arming support
     - Auto-rearm if Start happened with an empty sequence
     """
+    POLL_S          = 0.05   # legacy poll period (state without change notification)
+    FALLBACK_POLL_S = 1.0    # safety re-check while idle; None = sleep until notified
+
     def __init__(self, state, sock="/tmp/gord_rt.sock"):
         self.state = state
         self._rt = GordRTClient(sock)
@@ -110,10 +401,32 @@ class MidiEngine:
         self._prev_t = None
         self._prev_s = None
         self._prev_gate = None
-        self._prev_params_sig = None   # (tempo, subdiv, gate, ch, tr, slave)
+        self._prev_params_sig = None   # (tempo, subdiv, gate, ch, tr, slave, scale_mask)
         self._prev_seq_sig    = None   # tuple(seq) or "CHAIN"
         self._last_chain = None 
+        # compiled base sequence: ((seq version, id, len, tr, dia, mask), tuple)
+        self._seq_cache = (None, ())
+        self.seq_cache_hits = 0
+        self.seq_cache_misses = 0
+        # root bank: {"key", "raw": [12 seqs], "wire": [12 tuples], "masks": [12]}
+        self._bank = None
+        self._bank_building = None    # key of the rebuild in flight
+        self.on_bank = None           # fn(signature, raw seqs) after a bank upload (engine host)
+        # daemon event feed: loop/slot boundaries as the daemon schedules them
+        self._event_listeners = []
+        self._event_thr = None
+        self._chain_rows = []         # Chain Arps row index per armed daemon slot
+        self._install_rows = []       # rows as of the last full chain install
+        self._rows_by_gen = {}        # chain_edit tag (0x8000+) → rows after that edit
+        self._seen_gen = None         # chain gen of the last daemon event
+        self._edit_tag = 0
         
+        # binary wire if the daemon speaks it; JSON otherwise
+        try:
+            self._rt.negotiate()
+        except Exception:
+            pass
+
         # known-silent baseline
         try:
             self._rt.set_sequence([-1])
@@ -123,6 +436,10 @@ class MidiEngine:
         self._thr = threading.Thread(target=self._mirror_loop, daemon=True)
         self._thr.start()
 
+        if "events" in self._rt.caps:
+            self._event_thr = threading.Thread(target=self._event_loop, daemon=True)
+            self._event_thr.start()
+
     # ---------- tiny getters ----------
     def set_sequence(self, notes):
         """
@@ -136,51 +453,45 @@ class MidiEngine:
         except Exception:
             pass
         
+    # ---------- daemon-side transpose ----------
+    def daemon_transposes(self) -> bool:
+        """
+        True when the daemon applies transpose + scale snap per step: notes
+        then go out untransposed/unsnapped and a key change is one `set`.
+        """
+        return "transpose" in self._rt.caps
+
+    def _out_scale_mask(self):
+        # None = legacy daemon (field omitted); 0 = no daemon-side snapping
+        if not self.daemon_transposes():
+            return None
+        scale = getattr(self.state, "scale_notes", None) or []
+        return pcs_mask(scale) if bool(getattr(self.state, "diatonic_mode", False)) and scale else 0
+
+    def _note_transform(self):
+        # (transpose, diatonic) baked into outgoing notes
+        if self.daemon_transposes():
+            return 0, False
+        return self.get_transpose(), bool(getattr(self.state, "diatonic_mode", False))
+
     def _map_out_note(self, n):
         if n is None or n == -1:
             return -1
-        n_out = int(n) + self.get_transpose() + 12
-        if bool(getattr(self.state, "diatonic_mode", False)) and (getattr(self.state, "scale_notes", None) or []):
-            n_out = snap_to_scale(n_out, getattr(self.state, "scale_notes", []))
+        tr, dia = self._note_transform()
+        n_out = int(n) + tr + 12
+        if dia and (getattr(self.state, "scale_notes", None) or []):
+            n_out = snap_note(n_out, pcs_mask(getattr(self.state, "scale_notes", [])))
         return max(0, min(127, n_out))
 
+    def _map_out_notes(self, notes):
+        # bulk _map_out_note: one mask/table lookup for the whole slot
+        tr, dia = self._note_transform()
+        out = [None if (n is None or n == -1) else int(n) + tr + 12 for n in (notes or [])]
+        scale = getattr(self.state, "scale_notes", None) or []
+        if dia and scale:
+            out = snap_notes(out, scale)
+        return [-1 if n is None else max(0, min(127, n)) for n in out]
 
-    def get_subdivision(self) -> int:
-        return int(getattr(self.state, "subdivision", 16))
-
-    def get_tempo(self) -> float:
-        # Prefer bpm; fall back to legacy 'tempo' if present.
-        return float(getattr(self.state, "bpm", getattr(self.state, "tempo", 120.0)))
-
-
-    def get_channel(self) -> int:
-        return int(getattr(self.state, "default_channel", 1))
-
-    def get_transpose(self) -> int:
-        return int(getattr(self.state, "transpose", 0))
-
-    def is_slave(self) -> bool:
-        return bool(getattr(self.state, "slave_mode", False))
-
-    def get_gate(self) -> float:
-        raw = getattr(self.state, "gate", getattr(self.state, "gate_pct", 45.0))
-        try:
-            g = float(raw)
-        except Exception:
-            g = 45.0
-        if g > 1.5:
-            g = g / 100.0
-        return max(0.01, min(0.99, g))
-
-    def _gate_pct(self) -> float:
-        raw = getattr(self.state, "gate", getattr(self.state, "gate_pct", 45.0))
-        try:
-            g = float(raw)
-        except Exception:
-            g = 45.0
-        if g <= 1.5:
-            g *= 100.0
-        return max(1.0, min(99.0, g))
 
     # ---------- public transport ----------
     def panic(self):
@@ -219,6 +530,7 @@ class MidiEngine:
             channel=self.get_channel(),
             transpose=self.get_transpose(),
             slave_mode=self.is_slave(),
+            scale_mask=self._out_scale_mask(),
             immediate=True,
         )
 
@@ -232,6 +544,7 @@ class MidiEngine:
                 mapped, idx = self._last_chain
                 try:
                     self._rt.set_chain(mapped, int(idx))
+                    self._install_rows = self._chain_rows
                 except Exception:
                     pass
 
@@ -272,6 +585,11 @@ class MidiEngine:
 
 
     # ---------- chain ----------
+    def make_chain_runner(self, state, on_tick, on_done, global_loops=""):
+        """ChainRunner driving this engine (EngineProxy returns a remote one)."""
+        from chain_runner import ChainRunner
+        return ChainRunner(state, self, on_tick, on_done, global_loops=global_loops)
+
     def play_chain(self, slots, index=0):
         # if transport already running and we are master, resume after re-arm
         should_restart = bool(getattr(self.state, "is_running", False)) and not self.is_slave()
@@ -298,10 +616,13 @@ class MidiEngine:
         mapped = []
         for s in (slots or []):
             mapped.append({
-                "notes": [self._map_out_note(n) for n in s.get("notes", [])],
+                "notes": self._map_out_notes(s.get("notes", [])),
                 "loops": s.get("loops", 1),
             })
         self._last_chain = (mapped, int(index))
+        self._chain_rows = [s.get("idx") for s in (slots or [])]
+        self._install_rows = self._chain_rows
+        self._rows_by_gen = {}
 
         if mapped:
             self._rt.set_chain(mapped, int(index))
@@ -319,6 +640,33 @@ class MidiEngine:
 
 
 
+    def update_chain(self, slots, at="loop") -> bool:
+        """
+        Hot-swap the armed chain to `slots` (as for play_chain, each with its
+        row "idx"): only changed slots are sent, as chain_edit ops the daemon
+        applies at the next loop boundary — no stop, no re-arm, slot timing
+        kept. Returns False when that isn't possible; use play_chain then.
+        """
+        if "chain_edit" not in self._rt.caps or not self._chain_active or not self._last_chain:
+            return False
+        old_slots, index = self._last_chain
+        new_rows = [s.get("idx") for s in (slots or [])]
+        if not new_rows or not rows_editable(self._chain_rows, new_rows):
+            return False
+        mapped = [{"notes": self._map_out_notes(s.get("notes", [])), "loops": s.get("loops", 1)}
+                  for s in slots]
+        ops = chain_edit_ops(self._chain_rows, old_slots, new_rows, mapped)
+        if ops:
+            self._edit_tag = (self._edit_tag + 1) & 0x7FFF
+            gen = 0x8000 | self._edit_tag
+            if not self._rt.chain_edit(ops, at=at, gen=gen):
+                return False
+            self._rows_by_gen[gen] = new_rows
+            self._prune_rows_by_gen()
+        self._last_chain = (mapped, index)
+        self._chain_rows = new_rows
+        return True
+
     def stop_chain(self):
         self._chain_active = False
         try:
@@ -327,7 +675,72 @@ class MidiEngine:
             # Force silence instead of reverting to base sequence
             self._rt.set_sequence([-1])
             self._prev_seq_sig = tuple([-1])  # block mirror loop from re-pushing base seq
+            self._wake_mirror()
+
+
+    # ---------- event feed ----------
+    EVENT_RESUBSCRIBE_S = 1.0   # quiet this long → subscribe again (daemon restarts forget us)
+
+    def daemon_events(self) -> bool:
+        """True when loop boundaries come from the daemon instead of being estimated."""
+        return self._event_thr is not None and self._event_thr.is_alive()
 
+    def add_event_listener(self, fn):
+        """fn(event dict) on the event thread, for every daemon event."""
+        if fn not in self._event_listeners:
+            self._event_listeners.append(fn)
+
+    def remove_event_listener(self, fn):
+        try:
+            self._event_listeners.remove(fn)
+        except ValueError:
+            pass
+
+    def chain_row(self, slot, gen=None):
+        """Chain Arps row behind daemon chain slot `slot` as of chain `gen` (None if unknown)."""
+        if gen in self._rows_by_gen:
+            rows = self._rows_by_gen[gen]
+        elif gen is not None and not gen & 0x8000:
+            rows = self._install_rows       # daemon-numbered: a full install
+        else:
+            rows = self._chain_rows
+        return rows[slot] if 0 <= slot < len(rows) else None
+
+    ROWS_BY_GEN_MAX = 16        # recent edit gens kept (pending edits collapse to the latest)
+
+    def _prune_rows_by_gen(self):
+        """
+        Keep only gens the daemon can still report: the one it last reported
+        (edits before it are gone for good) and the latest ROWS_BY_GEN_MAX.
+        """
+        gens = list(self._rows_by_gen)
+        seen = self._seen_gen
+        if seen in self._rows_by_gen:
+            gens = gens[gens.index(seen):]
+        keep = set(gens[-self.ROWS_BY_GEN_MAX:])
+        if seen in self._rows_by_gen:
+            keep.add(seen)
+        for g in list(self._rows_by_gen):
+            if g not in keep:
+                self._rows_by_gen.pop(g, None)
+
+    def _event_loop(self):
+        self._rt.subscribe()
+        while True:
+            ev = self._rt.recv_event(timeout=self.EVENT_RESUBSCRIBE_S)
+            if ev is None:
+                self._rt.subscribe()
+                continue
+            gen = ev.get("gen")
+            if gen != self._seen_gen:
+                self._seen_gen = gen
+                if gen in self._rows_by_gen:
+                    self._prune_rows_by_gen()
+            for fn in list(self._event_listeners):
+                try:
+                    fn(ev)
+                except Exception:
+                    pass
 
     # ---------- internals ----------
     def _flush_silence(self):
@@ -340,22 +753,34 @@ class MidiEngine:
             pass
 
     def _build_seq(self):
+        """
+        Wire-ready tuple for state.last_seq (transpose, +12, snap, clamp).
+        Memoised on the AppState sequence version, so an unchanged pattern
+        costs O(1) per mirror pass however long it is.
+        """
         seq = getattr(self.state, "last_seq", None) or []
-        dia = bool(getattr(self.state, "diatonic_mode", False))
         scale = getattr(self.state, "scale_notes", None) or []
-        tr = int(getattr(self.state, "transpose", 0))
-        out = []
-        for n in seq:
-            if n is None:
-                out.append(-1)
-                continue
-            n_out = int(n) + tr + 12
-            if dia and scale:
-                n_out = snap_to_scale(n_out, scale)
-            n_out = max(0, min(127, n_out))
-            out.append(n_out)
+        tr, dia = self._note_transform()
+
+        versions = getattr(self.state, "versions", None)
+        ver = versions()["sequence"] if versions else None
+        key = (ver, id(seq), len(seq), tr, dia, pcs_mask(scale) if dia else 0)
+        cached_key, cached = self._seq_cache
+        if ver is not None and key == cached_key:
+            self.seq_cache_hits += 1
+            return cached
+        self.seq_cache_misses += 1
+
+        out = [None if n is None else int(n) + tr + 12 for n in seq]
+        if dia and scale:
+            out = snap_notes(out, key[-1])
+        out = tuple(-1 if n is None else max(0, min(127, n)) for n in out)
+        self._seq_cache = (key, out)
         return out
 
+    def seq_cache_stats(self) -> dict:
+        return {"hits": self.seq_cache_hits, "misses": self.seq_cache_misses}
+
     def _push_all(self, immediate=True):
         t  = self.get_tempo()
         s  = self.get_subdivision()
@@ -367,6 +792,7 @@ class MidiEngine:
         self._rt.set_params(
             tempo=t, subdivision=s, gate=gP,
             channel=ch, transpose=tr, slave_mode=sl,
+            scale_mask=self._out_scale_mask(),
             immediate=bool(immediate)
         )
         if not self._chain_active:
@@ -397,47 +823,168 @@ class MidiEngine:
 
 
 
+    def _wake_mirror(self):
+        # engine-side changes (chain on/off) need a sequence re-check too
+        touch = getattr(self.state, "touch", None)
+        if touch:
+            try: touch("sequence")
+            except Exception: pass
+
     def _mirror_loop(self):
+        # Sleep until AppState reports a change; the timeout is only a safety
+        # net for code that mutates state in place without state.touch().
+        wait = getattr(self.state, "wait_for_change", None)
+        seen = None
         while True:
+            if wait is None:
+                time.sleep(self.POLL_S)    # plain state object: legacy polling
+                self._mirror_once(seq_dirty=True)
+                continue
             try:
-                # read current state
-                t   = round(self.get_tempo(), 4)
-                s   = int(self.get_subdivision())
-                gP  = round(self._gate_pct(), 2)
-                ch  = int(self.get_channel())
-                tr  = int(self.get_transpose())
-                sl  = bool(self.is_slave())
-                running = bool(getattr(self.state, "is_running", False))
-
-                # sequence signature (only content!)
-                if self._chain_active:
-                    seq_sig  = "CHAIN"
-                    seq_list = None   # chain mode pushes via set_chain elsewhere
-                else:
-                    seq_list = self._build_seq()
-                    seq_sig  = tuple(seq_list)
-
-                # PARAMS: only send if params changed (never stop/start on tempo)
-                params_sig = (t, s, gP, ch, tr, sl)
-                if params_sig != self._prev_params_sig:
-                    self._rt.set_params(
-                        tempo=t, subdivision=s, gate=gP,
-                        channel=ch, transpose=tr, slave_mode=sl,
-                        immediate=False   # GUI already throttles; smooth glide
-                    )
-                    self._prev_params_sig = params_sig
-
-                # SEQUENCE: only send when actual content changes (not when BPM moves)
-                if not self._chain_active and seq_sig != self._prev_seq_sig:
-                    self._rt.set_sequence(seq_list)
-                    self._prev_seq_sig = seq_sig
-
-                # Auto-kick only for “started empty then got notes” (non-slave)
-                if running and getattr(self, "_armed_restart", False) and (seq_list and any(n != -1 for n in seq_list)) and not sl:
-                    self._rt.start()
-                    self._armed_restart = False
-
+                cur = wait(seen, timeout=self.FALLBACK_POLL_S)
             except Exception:
-                pass
-            finally:
-                time.sleep(0.05)
+                time.sleep(self.POLL_S)
+                cur = None
+            seq_dirty = (cur is None or seen is None or cur == seen or
+                         cur.get("sequence") != seen.get("sequence"))
+            seen = cur
+            self._mirror_once(seq_dirty)
+
+    def _mirror_once(self, seq_dirty=True):
+        try:
+            # read current state
+            t   = round(self.get_tempo(), 4)
+            s   = int(self.get_subdivision())
+            gP  = round(self._gate_pct(), 2)
+            ch  = int(self.get_channel())
+            tr  = int(self.get_transpose())
+            sl  = bool(self.is_slave())
+            sm  = self._out_scale_mask()
+            running = bool(getattr(self.state, "is_running", False))
+
+            # sequence signature (only content!) — rebuilt only when it may have moved
+            if self._chain_active:
+                seq_sig  = "CHAIN"
+                seq_list = None   # chain mode pushes via set_chain elsewhere
+            elif seq_dirty:
+                seq_list = self._build_seq()
+                seq_sig  = tuple(seq_list)
+            else:
+                seq_sig  = self._prev_seq_sig
+                seq_list = list(seq_sig) if seq_sig else []
+
+            # PARAMS: only send if params changed (never stop/start on tempo)
+            params_sig = (t, s, gP, ch, tr, sl, sm)
+            prev = self._prev_params_sig
+            if params_sig != prev:
+                # key-only change (daemon-side transpose): land on the next step
+                key_only = (sm is not None and prev is not None and
+                            params_sig[:4] + params_sig[5:6] == prev[:4] + prev[5:6])
+                self._rt.set_params(
+                    tempo=t, subdivision=s, gate=gP,
+                    channel=ch, transpose=tr, slave_mode=sl,
+                    scale_mask=sm,
+                    immediate=key_only   # else GUI already throttles; smooth glide
+                )
+                self._prev_params_sig = params_sig
+
+            # SEQUENCE: only send when actual content changes (not when BPM moves)
+            if not self._chain_active and seq_sig != self._prev_seq_sig:
+                self._rt.set_sequence(seq_list)
+                self._prev_seq_sig = seq_sig
+
+            # Auto-kick only for “started empty then got notes” (non-slave)
+            if running and getattr(self, "_armed_restart", False) and (seq_list and any(n != -1 for n in seq_list)) and not sl:
+                self._rt.start()
+                self._armed_restart = False
+
+            if self._bank_wanted():
+                self._maybe_rebuild_bank()
+
+        except Exception:
+            pass
+
+    # ---------- root bank ----------
+    def _bank_wanted(self) -> bool:
+        st = self.state
+        return (bool(getattr(st, "root_bank_mode", False))
+                and bool(getattr(st, "is_running", False))
+                and not self._chain_active
+                and not bool(getattr(st, "build_mode_enabled", False))
+                and "root_bank" in self._rt.caps and "chunked_chain" in self._rt.caps)
+
+    def _bank_key(self):
+        return (root_bank_signature(self.state), self._note_transform(), self.daemon_transposes())
+
+    def _bank_valid(self):
+        bank = self._bank
+        if bank is None or not self._bank_wanted():
+            return None
+        try:
+            return bank if bank["key"] == self._bank_key() else None
+        except Exception:
+            return None
+
+    def _maybe_rebuild_bank(self):
+        key = self._bank_key()
+        if (self._bank and self._bank["key"] == key) or self._bank_building == key:
+            return
+        self._bank_building = key
+        threading.Thread(target=self._rebuild_bank, args=(key,), daemon=True).start()
+
+    def _rebuild_bank(self, key):
+        # background: render 12 roots, map for the wire, upload once
+        try:
+            entries = build_root_bank(self.state)
+            tr, dia = self._note_transform()
+            wire, masks = [], []
+            for seq, pcs in entries:
+                out = [None if n is None else int(n) + tr + 12 for n in seq]
+                if dia and pcs:
+                    out = snap_notes(out, pcs)
+                wire.append(tuple(-1 if n is None else max(0, min(127, n)) for n in out))
+                masks.append(pcs_mask(pcs) if self.daemon_transposes() else None)
+            if self._bank_building != key or self._bank_key() != key:
+                return   # grid moved on while we were rendering
+            root = getattr(self.state, "original_root", "C")
+            idx = self._root_index(root)
+            self._rt.set_bank(wire, idx)
+            self._bank = {"key": key, "raw": [seq for seq, _ in entries],
+                          "wire": wire, "masks": masks}
+            if self.on_bank:
+                self.on_bank(key[0], self._bank["raw"])
+        except Exception:
+            pass
+        finally:
+            if self._bank_building == key:
+                self._bank_building = None
+
+    @staticmethod
+    def _root_index(name):
+        try:
+            return NOTE_NAMES.index(name)
+        except ValueError:
+            return 0
+
+    def select_root(self, name) -> bool:
+        """
+        Switch the playing pattern to another root via the bank (next step,
+        no sequence upload). Returns False when the bank can't serve it.
+        """
+        bank = self._bank_valid()
+        if bank is None:
+            return False
+        k = self._root_index(name)
+        try:
+            self._rt.select_root(k, bank["masks"][k])
+        except Exception:
+            return False
+        self._prev_seq_sig = bank["wire"][k]   # mirror: daemon already has it
+        return True
+
+    def root_bank_seq(self, name):
+        """Pre-rendered last_seq for `name` when the bank is current, else None."""
+        bank = self._bank_valid()
+        if bank is None:
+            return None
+        return list(bank["raw"][self._root_index(name)])
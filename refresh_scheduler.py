@@ -0,0 +1,68 @@
+# refresh_scheduler.py — coalesced, frame-capped panel repaints
+#
+# main.on_change used to repaint every panel synchronously, and several
+# paths call it more than once per user action. Panels are now marked
+# dirty; a single after_idle flush paints each dirty panel once, in
+# registration order, at most max_fps times a second. Model work (sequence
+# regeneration, daemon push) stays synchronous in the caller.
+import time
+
+
+class RefreshScheduler:
+    def __init__(self, widget, max_fps=60):
+        self.widget = widget
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+        self._painters = {}          # name → fn, insertion order = paint order
+        self._dirty = set()
+        self._pending = None         # after / after_idle id
+        self._last_flush = 0.0
+        # counters
+        self.marks = 0
+        self.flushes = 0
+        self.paints = 0
+
+    def register(self, name, fn):
+        self._painters[name] = fn
+
+    def mark(self, *names):
+        """Flag panels dirty (no names = all) and schedule one flush."""
+        self._dirty.update(names or self._painters)
+        self.marks += 1
+        if self._pending is not None:
+            return
+        wait = self.min_interval - (time.perf_counter() - self._last_flush)
+        try:
+            if wait > 0:
+                self._pending = self.widget.after(int(wait * 1000) + 1, self._run)
+            else:
+                self._pending = self.widget.after_idle(self._run)
+        except Exception:
+            self._pending = None     # no Tk loop (tear-down): paint right away
+            self.flush()
+
+    def flush(self):
+        """Paint everything dirty now."""
+        if self._pending is not None:
+            try:
+                self.widget.after_cancel(self._pending)
+            except Exception:
+                pass
+            self._pending = None
+        dirty, self._dirty = self._dirty, set()
+        self._last_flush = time.perf_counter()
+        self.flushes += 1
+        for name, fn in list(self._painters.items()):
+            if name not in dirty:
+                continue
+            try:
+                fn()
+                self.paints += 1
+            except Exception as e:
+                print(f"⚠️ refresh {name} failed: {e}")
+
+    def _run(self):
+        self._pending = None
+        self.flush()
+
+    def stats(self) -> dict:
+        return {"marks": self.marks, "flushes": self.flushes, "paints": self.paints}
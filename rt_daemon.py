@@ -1,5 +1,5 @@
 # rt_daemon.py
-import os, sys, time, json, socket, subprocess, atexit, stat
+import os, sys, time, json, socket, subprocess, atexit, stat, importlib.util
 
 CTRL_SOCK = "/tmp/gord_rt.sock"
 
@@ -35,10 +35,49 @@ def find_gordrt():
 
     return os.path.join(here, "GordRT")
 
+def find_standin():
+    """Pure-Python stand-in (rt_standin.py) next to this file or in the bundle."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    cand = os.path.join(here, "rt_standin.py")
+    if os.path.exists(cand): return cand
+    meipass = getattr(sys, "_MEIPASS", None)
+    if meipass:
+        cand = os.path.join(meipass, "rt_standin.py")
+        if os.path.exists(cand): return cand
+    return cand
+
+def _want_standin(exe):
+    """
+    GORD_RT_STANDIN=1 forces the Python stand-in, =0 forbids it.
+    Otherwise fall back to it off macOS or when the Swift binary is missing.
+    """
+    flag = os.environ.get("GORD_RT_STANDIN", "").strip().lower()
+    if flag in ("1", "true", "yes"): return True
+    if flag in ("0", "false", "no"): return False
+    return sys.platform != "darwin" or not os.path.exists(exe)
+
+def _standin_sink(spec, out_name):
+    """
+    Sink spec for the stand-in. The default ('mido' on the MIDI out port) needs
+    mido; without it fall back to the event log with a warning. An explicit
+    mido sink without mido is an error.
+    """
+    if spec.strip().lower().partition(":")[0] not in ("", "mido"):
+        return spec
+    if importlib.util.find_spec("mido") is None:
+        if spec:
+            raise RuntimeError(f"GordRT stand-in sink {spec!r} needs mido (pip install mido python-rtmidi)")
+        print("⚠️ mido not installed: GordRT stand-in writes MIDI to /tmp/gord_rt_events.log instead of a port")
+        return "file:/tmp/gord_rt_events.log"
+    return spec or "mido:" + (out_name or "gord out")
+
 class GordRTDaemon:
-    def __init__(self, dest: str = ""):
+    def __init__(self, dest: str = "", standin=None, sink: str = ""):
         self.dest = dest or os.environ.get("GORD_MIDI_DEST", "")
         self.proc = None
+        self.inproc = None              # (GordRTStandin, clock port) when run on threads
+        self.standin = standin          # None = auto (see _want_standin)
+        self.sink = sink or os.environ.get("GORD_RT_SINK", "")
 
     def _socket_ready(self, timeout=3.0):
         t0 = time.time()
@@ -61,7 +100,8 @@ class GordRTDaemon:
             time.sleep(0.05)
 
         exe = find_gordrt()
-        if not os.path.exists(exe):
+        use_standin = _want_standin(exe) if self.standin is None else bool(self.standin)
+        if not use_standin and not os.path.exists(exe):
             raise FileNotFoundError(f"GordRT not found at: {exe}")
 
         try: os.unlink(CTRL_SOCK)
@@ -83,6 +123,10 @@ class GordRTDaemon:
         # External clock ON so daemon follows incoming START/CLOCK
         env["GORD_EXTERNAL_CLK"] = "1" if os.environ.get("GORD_EXTERNAL_CLK") else ""
 
+        if use_standin:
+            self._launch_standin(env)
+            return
+
         subprocess.run(["pkill","-x","GordRT"], check=False)
         self.proc = subprocess.Popen([exe], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
@@ -99,6 +143,36 @@ class GordRTDaemon:
 
         atexit.register(self.stop)
 
+    def _launch_standin(self, env):
+        env["GORD_RT_SINK"] = _standin_sink(self.sink or env.get("GORD_RT_SINK", ""),
+                                            env.get("GORD_MIDI_OUT"))
+        if getattr(sys, "frozen", False):
+            # a bundled sys.executable is the app itself, not python: run on threads
+            import rt_standin
+            daemon = rt_standin.GordRTStandin(CTRL_SOCK, rt_standin.make_sink(env["GORD_RT_SINK"]))
+            daemon.start()
+            src = env.get("GORD_MIDI_IN")
+            self.inproc = (daemon, rt_standin._open_clock_in(daemon, src) if src else None)
+            atexit.register(self.stop)
+            return
+
+        script = find_standin()
+        if not os.path.exists(script):
+            raise FileNotFoundError(f"rt_standin.py not found at: {script}")
+
+        self.proc = subprocess.Popen(
+            [sys.executable, script, "--sock", CTRL_SOCK],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            env=env,
+        )
+
+        if not self._socket_ready(timeout=3.0):
+            raise RuntimeError("GordRT stand-in failed to start (socket not ready).")
+
+        atexit.register(self.stop)
+
     def stop(self):
         # Ask daemon to stop, then tear down process/socket
         try:
@@ -121,5 +195,13 @@ class GordRTDaemon:
                 pass
         self.proc = None
 
+        if self.inproc:
+            daemon, clock_port = self.inproc
+            self.inproc = None
+            if clock_port is not None:
+                try: clock_port.close()
+                except Exception: pass
+            daemon.stop()
+
         try: os.unlink(CTRL_SOCK)
         except FileNotFoundError: pass
@@ -0,0 +1,913 @@
+#!/usr/bin/env python3
+"""
+rt_standin.py — pure-Python GordRT stand-in.
+
+Speaks the same AF_UNIX datagram protocol as tools/GordRT on /tmp/gord_rt.sock
+(set / seq / chain / start / stop / panic / noop), in JSON or the binary
+framing from gord_wire.py, plus the "events" feed (subscribe → one event
+datagram per loop start, optionally per step) and "chain_edit" (slot
+replace/insert/delete/move staged for the next loop or slot boundary), and
+copies its scheduler:
+30 ms lookahead, 5 ms lead, lastOffTS/minOnTS fences, debounced pendingSet,
+pendingNotes swapped at loop boundaries and chain loopsLeft accounting.
+
+Instead of CoreMIDI the output goes to a pluggable sink:
+  memory          – in-process event list (tests / timing probes)
+  file:PATH       – one line per event: sched_ns emit_ns late_ns bytes
+  mido[:PORT]     – mido virtual output port (default name "gord out")
+
+Usage:
+  python3 rt_standin.py                          # mido sink, /tmp/gord_rt.sock
+  python3 rt_standin.py --sink file:/tmp/rt.log
+  python3 rt_standin.py --sock /tmp/x.sock --sink memory
+"""
+
+import os, sys, time, json, socket, threading, heapq, argparse
+from collections import OrderedDict
+import gord_wire
+
+CTRL_SOCK = "/tmp/gord_rt.sock"
+RECV_BUF  = 4096                 # same fixed receive buffer as GordRT.runIPC
+
+LOOKAHEAD_NS      = 30_000_000   # 30 ms
+LEAD_NS           =  5_000_000   # 5 ms
+SAFE_NS           =  1_000_000   # ~1 ms OFF→ON fence
+PARAM_DEBOUNCE_NS = 20_000_000
+INT_MAX           = sys.maxsize  # Swift Int.max (infinite loops)
+MAX_PATTERNS      = 4096         # pattern dictionary size (least recently used evicted)
+
+
+def host_now() -> int:
+    return time.monotonic_ns()
+
+def _midichannel(ch): return (int(ch) - 1) & 0x0F
+def _st_on(ch):  return 0x90 | _midichannel(ch)
+def _st_off(ch): return 0x80 | _midichannel(ch)
+
+def _snap(n, mask):
+    # nearest in-scale note, same probe order as utils.snap_to_scale
+    if not mask or mask & (1 << (n % 12)):
+        return n
+    for d in (1, -1, 2, -2, 3, -3):
+        if mask & (1 << ((n + d) % 12)):
+            return n + d
+    return n
+
+
+# ----------------------------
+#            Sinks
+# ----------------------------
+class MemorySink:
+    """Keeps every scheduled packet as (sched_ns, submit_ns, bytes)."""
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def send(self, ts_ns, data):
+        with self._lock:
+            self.events.append((int(ts_ns), host_now(), bytes(data)))
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.events)
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+
+    def close(self):
+        pass
+
+
+class _ReleaseSink:
+    """
+    CoreMIDI accepts future timestamps; Python outputs don't. This base holds
+    packets in a heap and releases each one at its timestamp, then calls
+    _emit(sched_ns, emit_ns, data).
+    """
+    def __init__(self):
+        self._heap = []
+        self._seq = 0
+        self._cv = threading.Condition()
+        self._closed = False
+        self._thr = threading.Thread(target=self._run, daemon=True)
+        self._thr.start()
+
+    def send(self, ts_ns, data):
+        with self._cv:
+            self._seq += 1
+            heapq.heappush(self._heap, (int(ts_ns), self._seq, bytes(data)))
+            self._cv.notify()
+
+    def _run(self):
+        while True:
+            with self._cv:
+                while not self._closed and not self._heap:
+                    self._cv.wait()
+                if self._closed:
+                    return
+                ts, _, data = self._heap[0]
+                wait_ns = ts - host_now()
+                if wait_ns > 0:
+                    self._cv.wait(timeout=wait_ns / 1e9)
+                    continue
+                heapq.heappop(self._heap)
+            try:
+                self._emit(ts, host_now(), data)
+            except Exception:
+                pass
+
+    def _emit(self, sched_ns, emit_ns, data):
+        raise NotImplementedError
+
+    def close(self):
+        with self._cv:
+            self._closed = True
+            self._cv.notify_all()
+
+
+class FileSink(_ReleaseSink):
+    def __init__(self, path):
+        self._fh = open(path, "a", buffering=1)
+        super().__init__()
+
+    def _emit(self, sched_ns, emit_ns, data):
+        self._fh.write(f"{sched_ns} {emit_ns} {emit_ns - sched_ns} {data.hex()}\n")
+
+    def close(self):
+        super().close()
+        try: self._fh.close()
+        except Exception: pass
+
+
+class MidoSink(_ReleaseSink):
+    def __init__(self, name="gord out"):
+        import mido   # optional: only needed for this sink
+        self._mido = mido
+        self._port = mido.open_output(name, virtual=True)
+        super().__init__()
+
+    def _emit(self, sched_ns, emit_ns, data):
+        self._port.send(self._mido.Message.from_bytes(list(data)))
+
+    def close(self):
+        super().close()
+        try: self._port.close()
+        except Exception: pass
+
+
+def make_sink(spec: str = ""):
+    """'memory' | 'file:PATH' | 'mido[:PORT]' (default: mido on GORD_MIDI_OUT)."""
+    spec = (spec or "").strip()
+    kind, _, arg = spec.partition(":")
+    kind = kind.lower() or "mido"
+    if kind == "memory":
+        return MemorySink()
+    if kind == "file":
+        return FileSink(arg or "/tmp/gord_rt_events.log")
+    if kind == "mido":
+        return MidoSink(arg or os.environ.get("GORD_MIDI_OUT", "") or "gord out")
+    raise ValueError(f"unknown sink: {spec!r}")
+
+
+# ----------------------------
+#         Shared state
+# ----------------------------
+class _Shared:
+    def __init__(self):
+        # current “effective” musical state
+        self.running   = False
+        self.bpm       = 120.0
+        self.subdiv    = 4
+        self.gatePct   = 50.0
+        self.channel   = 1
+        self.transpose = 0
+        self.scaleMask = 0            # 12-bit pc mask; non-zero = snap after transpose
+        self.notes     = [-1]         # start silent; -1 = rest
+        # note scheduling fences
+        self.lastOffTS = 0
+        self.minOnTS   = 0
+        # chain
+        self.chainSlots = []          # [{"notes": [...], "loops": n}]
+        self.chainIndex = 0
+        self.loopsLeft  = 0
+        self.chainGen   = 0           # bumped per chain install (event feed)
+        self.chainPass  = 0           # bumped each time the chain wraps to slot 0
+        self.loopNum    = 1           # 1-based loop of the current slot/pattern
+        self.pendingEdits   = None    # chain_edit ops waiting for a boundary
+        self.pendingEditsAt = "loop"  # "loop" | "slot"
+        self.pendingEditGen = None    # gen the edited chain reports (client tag)
+        # root bank: one pre-rendered pattern per root, switched by index
+        self.bank      = []
+        self.bankIndex = 0
+        # pending (quantized) changes
+        self.pendingSet       = None
+        self.applyParamsAfter = None
+        self.pendingNotes     = None
+        # scheduler state
+        self.nextStepHost = None
+        self.stepIndex    = -1
+        # external clock (slave)
+        self.extSlave    = False
+        self.tickCounter = 0
+        self.lastClockTS = 0
+        self.clockAvg    = 0.0
+
+        self.lock = threading.Lock()
+
+
+# ----------------------------
+#           Daemon
+# ----------------------------
+class GordRTStandin:
+    """
+    In-process or standalone GordRT. start() binds the control socket and runs
+    the IPC + scheduler threads; handle(msg) applies one decoded message and
+    can be driven directly without a socket.
+    """
+    def __init__(self, sock_path=CTRL_SOCK, sink=None):
+        self.sock_path = sock_path
+        self.sink = sink if sink is not None else MemorySink()
+        self.shared = _Shared()
+        self._sock = None
+        self._stop = threading.Event()
+        self._threads = []
+        self._upload = None   # staged multi-part upload: {"kind", "id", "index", "slots"}
+        self._subs = {}       # event subscribers: addr → {"steps", "wire"}
+        self._edit_stage = [] # chain_edit ops of a batch still arriving ("more")
+        self._patterns = OrderedDict()   # pattern id → notes ('patterns' cap)
+        self._pat_stage = {}             # pattern id → notes of a definition still arriving
+
+    # ---------- lifecycle ----------
+    def start(self):
+        try: os.unlink(self.sock_path)
+        except FileNotFoundError: pass
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(self.sock_path)
+        self._sock.settimeout(0.2)
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._run_ipc, daemon=True),
+            threading.Thread(target=self._run_scheduler, daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout=0.5)
+        self._threads = []
+        if self._sock is not None:
+            try: self._sock.close()
+            except Exception: pass
+            self._sock = None
+        try: os.unlink(self.sock_path)
+        except FileNotFoundError: pass
+        try: self.sink.close()
+        except Exception: pass
+
+    def serve_forever(self):
+        self.start()
+        try:
+            while not self._stop.is_set():
+                time.sleep(0.2)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    # ---------- IPC ----------
+    def _run_ipc(self):
+        sys.stderr.write(f"[GordRT-py] control socket: {self.sock_path}\n")
+        while not self._stop.is_set():
+            try:
+                data, addr = self._sock.recvfrom(RECV_BUF)
+            except socket.timeout:
+                continue
+            except OSError:
+                if self._stop.is_set():
+                    return
+                continue
+            if not data:
+                continue
+            try:
+                if gord_wire.is_binary(data):
+                    msg = gord_wire.decode(data)
+                else:
+                    msg = json.loads(data.decode("utf-8"))
+            except Exception:
+                continue   # truncated / garbage datagram: dropped, like GordRT
+            if isinstance(msg, dict):
+                self.handle(msg, addr)
+
+    def handle(self, msg: dict, addr=None):
+        cmd = msg.get("cmd")
+        fn = getattr(self, f"_on_{cmd}", None) if isinstance(cmd, str) else None
+        if fn is not None:
+            fn(msg, addr)
+
+    def _reply(self, addr, obj):
+        if not addr or self._sock is None:
+            return
+        try:
+            self._sock.sendto(json.dumps(obj).encode("utf-8"), addr)
+        except OSError:
+            pass
+
+    def caps(self):
+        return ["chunked_chain", "transpose", "root_bank", "events", "chain_edit", "patterns"]
+
+    # ---------- event feed ----------
+    def _on_subscribe(self, msg, addr=None):
+        if not addr:
+            return   # unbound client: nowhere to send events
+        if msg.get("on", True):
+            self._subs[addr] = {"steps": bool(msg.get("steps")), "wire": int(msg.get("wire", 1))}
+        else:
+            self._subs.pop(addr, None)
+
+    def _want_steps(self):
+        return any(sub["steps"] for sub in list(self._subs.values()))
+
+    def _loop_event_locked(self, ts, idx):
+        sh = self.shared
+        slot = sh.chainIndex if sh.chainSlots else -1
+        return {"cmd": "event", "kind": "slot" if sh.loopNum == 1 else "wrap",
+                "gen": sh.chainGen, "slot": slot, "loop": sh.loopNum, "step": idx, "t": int(ts),
+                "pass": sh.chainPass}
+
+    def _publish(self, events):
+        if not events or not self._subs or self._sock is None:
+            return
+        for addr, sub in list(self._subs.items()):
+            for ev in events:
+                if ev["kind"] == "step" and not sub["steps"]:
+                    continue
+                data = gord_wire.encode(ev) if sub["wire"] else None
+                try:
+                    self._sock.sendto(data or json.dumps(ev).encode("utf-8"), addr)
+                except OSError:
+                    self._subs.pop(addr, None)   # client gone
+                    break
+
+    def _on_noop(self, msg, addr=None):
+        # handshake: advertise the binary wire version + optional features
+        if msg.get("hello"):
+            self._reply(addr, {"cmd": "hello", "wire": gord_wire.VERSION, "caps": self.caps()})
+
+    def _on_panic(self, msg, addr=None):
+        sh = self.shared
+        with sh.lock:
+            sh.running = False
+            sh.nextStepHost = None
+            sh.pendingSet = None
+            sh.applyParamsAfter = None
+            sh.pendingNotes = None
+            sh.notes = [-1]
+            sh.stepIndex = -1
+            sh.tickCounter = 0
+
+    def _on_chain(self, msg, addr=None):
+        # install slots and make chain own playback (clean handoff + fence)
+        sh = self.shared
+        slots = [{"notes": [int(n) for n in s.get("notes", [])], "loops": int(s.get("loops", 1))}
+                 for s in (msg.get("slots") or [])]
+        now = host_now()
+        with sh.lock:
+            sh.chainSlots = slots
+            sh.chainGen = (sh.chainGen + 1) & 0x7FFF   # 0x8000+ = client edit tags
+            sh.pendingEdits = None
+            sh.loopNum = 1
+            has = bool(slots)
+            sh.chainIndex = max(0, min(int(msg.get("index") or 0), len(slots) - 1)) if has else 0
+            sh.pendingNotes = None
+            sh.pendingSet = None
+            if has:
+                slot = slots[sh.chainIndex]
+                sh.notes = slot["notes"]
+                sh.loopsLeft = INT_MAX if slot["loops"] <= 0 else max(1, slot["loops"])
+                sh.stepIndex = -1
+                if sh.extSlave:
+                    sh.tickCounter = 0
+                start_at = max(now + LEAD_NS, sh.lastOffTS + SAFE_NS)
+                sh.nextStepHost = start_at
+                sh.minOnTS = start_at
+            else:
+                sh.notes = [-1]
+                sh.loopsLeft = 0
+                sh.stepIndex = -1
+
+    # ---------- pattern dictionary ----------
+    def _on_pattern(self, msg, addr=None):
+        """Define notes under their content hash; long ones arrive in offset order."""
+        pid = int(msg.get("id", -1))
+        staged = self._pat_stage.pop(pid, [])
+        notes = staged if int(msg.get("offset", 0)) else []
+        if int(msg.get("offset", 0)) != len(notes):
+            return   # gap: drop, a chain_ref will report it missing
+        notes.extend(int(n) for n in (msg.get("notes") or []))
+        if len(notes) < int(msg.get("total", len(notes))):
+            self._pat_stage[pid] = notes
+            return
+        if gord_wire.pattern_id(notes) != pid:
+            return   # corrupt / truncated: never install under the wrong id
+        self._patterns[pid] = notes
+        self._patterns.move_to_end(pid)
+        while len(self._patterns) > MAX_PATTERNS:
+            self._patterns.popitem(last=False)
+
+    def _on_chain_ref(self, msg, addr=None):
+        # resolve ids → a plain chain install; unknown ids are reported, nothing armed
+        refs = msg.get("slots") or []
+        missing = sorted({int(r.get("id", -1)) for r in refs} - self._patterns.keys())
+        if missing:
+            self._reply(addr, {"cmd": "missing", "ids": missing})
+            return
+        slots = []
+        for r in refs:
+            pid = int(r["id"])
+            self._patterns.move_to_end(pid)
+            slots.append({"notes": self._patterns[pid], "loops": int(r.get("loops", 1))})
+        self._on_chain({"slots": slots, "index": msg.get("index", 0)}, addr)
+
+    # ---------- incremental chain edits ----------
+    def _on_chain_edit(self, msg, addr=None):
+        """
+        Stage slot edits on the live chain; the scheduler applies them at the
+        next loop boundary (at="slot": next slot change) with no stop/re-arm.
+        Ops of a batch split over datagrams arrive with more=True until the last.
+        """
+        self._edit_stage.extend(msg.get("ops") or [])
+        if msg.get("more"):
+            return
+        ops, self._edit_stage = self._edit_stage, []
+        sh = self.shared
+        with sh.lock:
+            if not sh.chainSlots:
+                return   # nothing linked: the client arms with `chain`
+            sh.pendingEdits = (sh.pendingEdits or []) + list(ops)
+            sh.pendingEditsAt = msg.get("at") or "loop"
+            sh.pendingEditGen = msg.get("gen")
+            if not sh.running:
+                self._apply_edits_locked()
+
+    def _apply_edits_locked(self):
+        sh = self.shared
+        ops, sh.pendingEdits = sh.pendingEdits, None
+        slots = list(sh.chainSlots)
+        cur = sh.chainSlots[sh.chainIndex] if sh.chainSlots else None
+        cur_at = sh.chainIndex    # where the next slot sits if `cur` is deleted
+        replaced = False
+        for op in ops or ():
+            kind, n = op.get("op"), int(op.get("slot", 0))
+            if kind in ("replace", "insert"):
+                new = {"notes": [int(x) for x in op.get("notes") or []], "loops": int(op.get("loops", 1))}
+                if kind == "insert":
+                    slots.insert(max(0, min(n, len(slots))), new)
+                elif 0 <= n < len(slots):
+                    if slots[n] is cur:
+                        cur, replaced = new, True
+                    slots[n] = new
+            elif kind == "delete" and 0 <= n < len(slots):
+                if slots[n] is cur:
+                    cur, cur_at = None, n
+                slots.pop(n)
+            elif kind == "move" and 0 <= n < len(slots):
+                slots.insert(max(0, min(int(op.get("to", n)), len(slots) - 1)), slots.pop(n))
+
+        gen = sh.pendingEditGen
+        # client tags are 0x8000+; daemon-numbered gens stay below (as in _on_chain)
+        sh.chainGen = int(gen) & 0xFFFF if gen is not None else (sh.chainGen + 1) & 0x7FFF
+        sh.stepIndex = -1
+        sh.chainSlots = slots
+        if not slots:
+            sh.notes, sh.loopsLeft, sh.chainIndex = [-1], 0, 0
+            return True
+
+        fresh = cur is None
+        if fresh:
+            if cur_at >= len(slots):
+                sh.chainPass = (sh.chainPass + 1) & 0xFFFF
+            sh.chainIndex = cur_at % len(slots)
+        else:
+            sh.chainIndex = next(i for i, s in enumerate(slots) if s is cur)
+            if replaced:   # keep the loops already played against the new count
+                left = INT_MAX if cur["loops"] <= 0 else cur["loops"] - (sh.loopNum - 1)
+                if left <= 0:
+                    sh.chainIndex = (sh.chainIndex + 1) % len(slots)
+                    if sh.chainIndex == 0:
+                        sh.chainPass = (sh.chainPass + 1) & 0xFFFF
+                    fresh = True
+                else:
+                    sh.loopsLeft = left
+        slot = slots[sh.chainIndex]
+        if fresh:
+            sh.loopsLeft = INT_MAX if slot["loops"] <= 0 else max(1, slot["loops"])
+            sh.loopNum = 1
+        sh.notes = slot["notes"]
+        return True
+
+    def _loop_end_locked(self):
+        # bar end: chain accounting, then any staged edits that are due
+        sh = self.shared
+        advanced = self._advance_chain_locked()
+        due = sh.pendingEdits is not None and (advanced or sh.pendingEditsAt != "slot")
+        if due:
+            self._apply_edits_locked()
+        return advanced or due
+
+    # ---------- multi-part chain (begin → parts → commit) ----------
+    def _on_chain_begin(self, msg, addr=None, kind="chain"):
+        # a new begin abandons whatever upload was half-staged
+        n = max(0, int(msg.get("slots") or 0))
+        self._upload = {"kind": kind, "id": msg.get("id"),
+                        "index": int(msg.get("index") or 0), "slots": [None] * n}
+
+    def _on_bank_begin(self, msg, addr=None):
+        self._on_chain_begin(msg, addr, kind="bank")
+
+    def _on_chain_part(self, msg, addr=None):
+        up = self._upload
+        if up is None or msg.get("id") != up["id"]:
+            return
+        si = int(msg.get("slot", -1))
+        if not (0 <= si < len(up["slots"])):
+            self._upload = None
+            return
+        slot = up["slots"][si]
+        if slot is None:
+            slot = up["slots"][si] = {"notes": [], "loops": int(msg.get("loops", 1))}
+        if int(msg.get("offset", 0)) != len(slot["notes"]):
+            self._upload = None   # gap / reorder: the commit can never verify
+            return
+        slot["notes"].extend(int(n) for n in (msg.get("notes") or []))
+
+    def _on_chain_commit(self, msg, addr=None):
+        up, self._upload = self._upload, None
+        if up is None or msg.get("id") != up["id"] or any(s is None for s in up["slots"]):
+            return
+        if gord_wire.chain_checksum(up["slots"]) != int(msg.get("crc", -1)):
+            return
+        if up["kind"] == "bank":
+            self._install_bank([s["notes"] for s in up["slots"]], up["index"])
+        else:
+            self._on_chain({"slots": up["slots"], "index": up["index"]}, addr)
+
+    # ---------- root bank ----------
+    def _install_bank(self, patterns, index):
+        sh = self.shared
+        with sh.lock:
+            sh.bank = patterns
+            sh.bankIndex = max(0, min(int(index), len(patterns) - 1)) if patterns else 0
+            if sh.chainSlots or not patterns:
+                return
+            notes = patterns[sh.bankIndex]
+            if notes == sh.notes:
+                return   # already playing this root: keep the step position
+        self._on_seq({"notes": notes})
+
+    def _on_root(self, msg, addr=None):
+        # switch pattern at the next step, keeping the step position
+        sh = self.shared
+        with sh.lock:
+            if sh.chainSlots or not sh.bank:
+                return
+            k = int(msg.get("index", 0))
+            if not (0 <= k < len(sh.bank)):
+                return
+            sh.bankIndex = k
+            sh.notes = sh.bank[k]
+            sh.pendingNotes = None
+            if msg.get("scale_mask") is not None:
+                sh.scaleMask = int(msg["scale_mask"]) & 0xFFF
+
+    def _on_set(self, msg, addr=None):
+        sh = self.shared
+        with sh.lock:
+            if msg.get("slave_mode") is not None:
+                sh.extSlave = bool(msg["slave_mode"])
+            sh.pendingSet = dict(msg)
+            wait = 0 if msg.get("immediate") else PARAM_DEBOUNCE_NS
+            sh.applyParamsAfter = host_now() + wait
+
+    def _on_seq(self, msg, addr=None):
+        sh = self.shared
+        new_notes = [int(n) for n in (msg.get("notes") or [])]
+        with sh.lock:
+            if sh.chainSlots:
+                return   # ignore while CHAIN is active
+            silent = not sh.notes or not any(n >= 0 for n in sh.notes)
+            if not sh.running or silent:
+                sh.notes = new_notes
+                sh.loopNum = 1
+                sh.stepIndex = -1
+                sh.nextStepHost = None
+                sh.pendingNotes = None
+            else:
+                sh.pendingNotes = new_notes
+
+    def _on_start(self, msg, addr=None):
+        sh = self.shared
+        now = host_now()
+        with sh.lock:
+            start_at = max(now + LEAD_NS, sh.lastOffTS + SAFE_NS)
+            sh.running = True
+            sh.stepIndex = -1
+            sh.loopNum = 1
+            sh.nextStepHost = start_at
+            sh.tickCounter = 0
+            sh.minOnTS = start_at
+            sh.pendingNotes = None
+            sh.pendingSet = None
+            sh.applyParamsAfter = None
+
+    def _on_stop(self, msg, addr=None):
+        sh = self.shared
+        with sh.lock:
+            sh.running = False
+            sh.stepIndex = -1
+            sh.nextStepHost = None
+            sh.tickCounter = 0
+            sh.minOnTS = 0
+            sh.pendingNotes = None
+            sh.pendingSet = None
+            sh.applyParamsAfter = None
+
+    # ---------- chain bar-end (lock held) ----------
+    def _advance_chain_locked(self):
+        sh = self.shared
+        if not sh.chainSlots:
+            sh.loopNum += 1
+            return False
+        if sh.loopsLeft != INT_MAX and sh.loopsLeft > 0:
+            sh.loopsLeft -= 1
+        if sh.loopsLeft == 0:
+            sh.chainIndex = (sh.chainIndex + 1) % len(sh.chainSlots)
+            if sh.chainIndex == 0:
+                sh.chainPass = (sh.chainPass + 1) & 0xFFFF
+            nxt = sh.chainSlots[sh.chainIndex]
+            sh.notes = nxt["notes"]
+            sh.loopsLeft = INT_MAX if nxt["loops"] <= 0 else max(1, nxt["loops"])
+            sh.stepIndex = -1
+            sh.loopNum = 1
+            return True
+        sh.loopNum += 1
+        return False
+
+    # ---------- scheduler (internal master) ----------
+    def _commit_params(self, running, bpm, subdiv, gate, channel, transpose, p):
+        sh = self.shared
+        tempo_changed = subdiv_changed = False
+        if p.get("tempo") is not None:
+            new = max(1.0, float(p["tempo"])); tempo_changed = new != bpm; bpm = new
+        if p.get("subdivision") is not None:
+            new = max(1, int(p["subdivision"])); subdiv_changed = new != subdiv; subdiv = new
+        if p.get("gate") is not None:      gate = max(0.0, min(100.0, float(p["gate"])))
+        if p.get("channel") is not None:   channel = min(16, max(1, int(p["channel"])))
+        if p.get("transpose") is not None: transpose = int(p["transpose"])
+
+        with sh.lock:
+            sh.pendingSet = None
+            sh.applyParamsAfter = None
+            sh.bpm, sh.subdiv, sh.gatePct = bpm, subdiv, gate
+            sh.channel, sh.transpose = channel, transpose
+            if p.get("scale_mask") is not None:
+                sh.scaleMask = int(p["scale_mask"]) & 0xFFF
+            last_off, is_slave = sh.lastOffTS, sh.extSlave
+
+        # SUBDIV change: fence + re-prime; TEMPO change: keep next event out of the past
+        if subdiv_changed and running:
+            fence = last_off + SAFE_NS
+            with sh.lock:
+                sh.stepIndex = -1
+                if is_slave:
+                    sh.tickCounter = 0
+                    sh.minOnTS = fence
+                else:
+                    start_at = max(host_now() + LEAD_NS, fence)
+                    sh.nextStepHost = start_at
+                    sh.minOnTS = start_at
+        elif tempo_changed and running and not is_slave:
+            with sh.lock:
+                nh = sh.nextStepHost
+                if nh is not None and nh < host_now() + 1_000_000:
+                    sh.nextStepHost = host_now() + LEAD_NS
+        return bpm, subdiv, gate, channel, transpose
+
+    def _emit_step(self, ts, raw, channel, transpose, gate_ns, scale_mask=0):
+        if 0 <= raw <= 127:
+            nn = min(127, max(0, _snap(raw + transpose, scale_mask)))
+            self.sink.send(ts, bytes((_st_on(channel), nn, 100)))
+            off_ts = ts + gate_ns
+            self.sink.send(off_ts, bytes((_st_off(channel), nn, 0)))
+            return off_ts
+        return None
+
+    def _run_scheduler(self):
+        sh = self.shared
+        while not self._stop.is_set():
+            with sh.lock:
+                running    = sh.running
+                bpm        = sh.bpm
+                subdiv     = sh.subdiv
+                gate       = sh.gatePct
+                channel    = sh.channel
+                transpose  = sh.transpose
+                scale_mask = sh.scaleMask
+                notes      = sh.notes
+                next_host  = sh.nextStepHost
+                idx        = sh.stepIndex
+                pending    = sh.pendingSet
+                apply_at   = sh.applyParamsAfter
+                ext_slave  = sh.extSlave
+
+            # commit debounced params (applies even when slaved)
+            if apply_at is not None and host_now() >= apply_at and pending is not None:
+                bpm, subdiv, gate, channel, transpose = self._commit_params(
+                    running, bpm, subdiv, gate, channel, transpose, pending)
+                with sh.lock:   # a subdiv fence may have re-primed the grid
+                    next_host, idx = sh.nextStepHost, sh.stepIndex
+                    scale_mask = sh.scaleMask
+
+            # slave: external F8 drives stepping
+            if ext_slave:
+                time.sleep(0.005)
+                continue
+
+            if running and notes:
+                step_ns = (60.0 / bpm) * (4.0 / max(1, subdiv)) * 1e9
+                gate_ns = int(step_ns * (gate / 100.0))
+                if gate_ns <= 1_000_000: gate_ns = 1_000_000
+                if gate_ns >= int(step_ns) - 1_000_000: gate_ns = int(step_ns) - 1_000_000
+
+                if next_host is None:
+                    next_host = host_now() + LEAD_NS
+                horizon = host_now() + LOOKAHEAD_NS
+
+                if next_host <= horizon:
+                    # SWAP BEFORE ADVANCING INDEX
+                    with sh.lock:
+                        if sh.pendingNotes is not None:
+                            sh.notes = notes = sh.pendingNotes
+                            sh.pendingNotes = None
+                            sh.stepIndex = idx = -1
+                            sh.loopNum = 1
+
+                    idx += 1
+                    cur_len = max(1, len(notes))
+                    if self._subs:
+                        events = []
+                        if idx % cur_len == 0:
+                            with sh.lock:
+                                events.append(self._loop_event_locked(next_host, idx))
+                        if self._want_steps():
+                            events.append({"cmd": "event", "kind": "step", "gen": 0, "slot": -1,
+                                           "loop": 0, "step": idx, "t": int(next_host)})
+                        self._publish(events)
+                    off_ts = self._emit_step(next_host, notes[idx % cur_len], channel, transpose, gate_ns, scale_mask)
+                    if off_ts is not None:
+                        with sh.lock:
+                            if off_ts > sh.lastOffTS:
+                                sh.lastOffTS = off_ts
+
+                    if (idx + 1) % cur_len == 0:
+                        with sh.lock:
+                            if self._loop_end_locked():
+                                notes, idx = sh.notes, -1
+
+                    next_host = next_host + int(step_ns)
+
+                with sh.lock:
+                    sh.nextStepHost = next_host
+                    sh.stepIndex = idx
+                time.sleep(0.005)
+            else:
+                time.sleep(0.01)
+
+    # ---------- MIDI in (clock/transport, slave mode) ----------
+    def handle_midi_in(self, status: int, ts_ns=None):
+        """Feed one realtime byte (FA/FB/FC/F8) from an external clock source."""
+        sh = self.shared
+        ts = host_now() if ts_ns is None else int(ts_ns)
+        events = None
+        with sh.lock:
+            if not sh.extSlave:
+                return   # ignore clocks when not slaved
+            if status == 0xFA:     # Start (fence against lingering OFF)
+                sh.running = True
+                sh.tickCounter = 0
+                sh.stepIndex = -1
+                sh.loopNum = 1
+                sh.lastClockTS = ts
+                sh.minOnTS = sh.lastOffTS + SAFE_NS
+                sh.pendingNotes = None
+                sh.pendingSet = None
+                sh.applyParamsAfter = None
+            elif status == 0xFB:   # Continue
+                sh.running = True
+            elif status == 0xFC:   # Stop (keep lastOffTS so next Start can fence)
+                sh.running = False
+                sh.stepIndex = -1
+                sh.nextStepHost = None
+                sh.tickCounter = 0
+                sh.minOnTS = 0
+                sh.pendingNotes = None
+                sh.pendingSet = None
+                sh.applyParamsAfter = None
+            elif status == 0xF8:   # Clock (24 PPQN)
+                events = self._on_clock_locked(ts)
+        self._publish(events)
+
+    def _on_clock_locked(self, ts):
+        """Advance on one F8; returns the events to publish once the lock is dropped."""
+        sh = self.shared
+        follow = sh.extSlave and sh.running and bool(sh.notes)
+        if sh.lastClockTS != 0:
+            sh.clockAvg = 0.8 * sh.clockAvg + 0.2 * float(ts - sh.lastClockTS)
+        sh.lastClockTS = ts
+        if not follow:
+            return None
+
+        tps = max(1, 96 // max(1, sh.subdiv))   # ticks-per-step at 24 PPQN
+        sh.tickCounter += 1
+        if sh.tickCounter < tps:
+            return None
+        sh.tickCounter = 0
+
+        # Fence: don't let a new ON start before the last OFF from old grid
+        if sh.minOnTS > 0 and ts <= sh.minOnTS:
+            return None
+
+        if sh.pendingNotes is not None:
+            sh.notes = sh.pendingNotes
+            sh.pendingNotes = None
+            sh.stepIndex = -1
+            sh.loopNum = 1
+
+        idx = sh.stepIndex + 1
+        sh.stepIndex = idx
+        cur_len = max(1, len(sh.notes))
+        events = []
+        if self._subs:
+            if idx % cur_len == 0:
+                events.append(self._loop_event_locked(ts, idx))
+            if self._want_steps():
+                events.append({"cmd": "event", "kind": "step", "gen": 0, "slot": -1,
+                               "loop": 0, "step": idx, "t": int(ts)})
+
+        gate_clocks = max(1, min(tps - 1, int(round(tps * min(100.0, max(0.0, sh.gatePct)) / 100.0))))
+        gate_ns = int(gate_clocks * sh.clockAvg) if sh.clockAvg > 1.0 else 10_000_000
+        off_ts = self._emit_step(ts, sh.notes[idx % cur_len], sh.channel, sh.transpose, gate_ns,
+                                 sh.scaleMask)
+        if off_ts is not None:
+            sh.lastOffTS = off_ts
+            sh.minOnTS = 0   # fence consumed
+
+        if (idx + 1) % cur_len == 0:
+            self._loop_end_locked()
+        return events
+
+
+def _open_clock_in(daemon, name):
+    """Route a mido input port's realtime bytes into the daemon (slave mode)."""
+    try:
+        import mido
+    except Exception:
+        sys.stderr.write("[GordRT-py] mido not installed; no clock input\n")
+        return None
+    needle = name.lower()
+    pick = next((p for p in mido.get_input_names() if needle in p.lower()), None)
+    if pick is None:
+        sys.stderr.write(f"[GordRT-py] WARNING: clock source '{name}' not found\n")
+        return None
+    codes = {"start": 0xFA, "continue": 0xFB, "stop": 0xFC, "clock": 0xF8}
+    def _cb(msg):
+        code = codes.get(msg.type)
+        if code is not None:
+            daemon.handle_midi_in(code)
+    sys.stderr.write(f"[GordRT-py] clock source: {pick}\n")
+    return mido.open_input(pick, callback=_cb)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Pure-Python GordRT stand-in")
+    ap.add_argument("--sock", default=CTRL_SOCK)
+    ap.add_argument("--sink", default=os.environ.get("GORD_RT_SINK", ""),
+                    help="memory | file:PATH | mido[:PORT]")
+    ap.add_argument("--clock-in", default=os.environ.get("GORD_MIDI_IN", ""))
+    args = ap.parse_args(argv)
+
+    daemon = GordRTStandin(args.sock, make_sink(args.sink))
+    clock_port = _open_clock_in(daemon, args.clock_in) if args.clock_in else None
+    sys.stderr.write(f"[GordRT-py] scheduler up. Use {args.sock} for control.\n")
+    try:
+        daemon.serve_forever()
+    finally:
+        if clock_port is not None:
+            clock_port.close()
+
+
+if __name__ == "__main__":
+    main()
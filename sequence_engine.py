@@ -1,8 +1,91 @@
 # sequence_engine.py
 
+import random
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from config import NOTE_NAMES, MAX_OCTAVE
 from theory import SCALES
-from utils import interval_to_degree, snap_to_scale
+from utils import interval_to_degree, snap_note, snap_notes, pcs_mask, calc_scale_notes
+
+# ── Direction modes ─────────────────────────────────────────────
+DIR_FORWARD, DIR_REVERSE, DIR_PING, DIR_REV_PING = 0, 1, 2, 3
+DIR_CONVERGE, DIR_DIVERGE, DIR_SHUFFLE, DIR_STRIDE = 4, 5, 6, 7
+
+
+@lru_cache(maxsize=256)
+def direction_permutation(length, mode, turnaround=True, param=0):
+    """
+    Step order for a `length`-step base sequence as a tuple of indices
+    (may repeat indices for ping-pong). param = seed (shuffle) or N (stride).
+    """
+    idx = range(length)
+    if mode == DIR_REVERSE:
+        return tuple(reversed(idx))
+    if mode in (DIR_PING, DIR_REV_PING):
+        fwd, rev = tuple(idx), tuple(reversed(idx))
+        if mode == DIR_PING:                               # forward then backward
+            perm = fwd + rev
+            return perm if turnaround else perm[:-1]
+        perm = rev + fwd                                   # backward then forward
+        return perm if turnaround else perm[1:]
+    if mode in (DIR_CONVERGE, DIR_DIVERGE):
+        # outside-in: 0, n-1, 1, n-2, …   (diverge = middle-out)
+        perm = []
+        lo, hi = 0, length - 1
+        while lo <= hi:
+            perm.append(lo)
+            if hi != lo:
+                perm.append(hi)
+            lo, hi = lo + 1, hi - 1
+        return tuple(reversed(perm)) if mode == DIR_DIVERGE else tuple(perm)
+    if mode == DIR_SHUFFLE:
+        perm = list(idx)
+        random.Random(param).shuffle(perm)
+        return tuple(perm)
+    if mode == DIR_STRIDE:
+        # every Nth step, then the next offset: 0, N, 2N, …, 1, 1+N, …
+        n = max(1, int(param) or 1)
+        return tuple(i for start in range(n) for i in range(start, length, n))
+    return tuple(idx)
+
+
+# ── Compiled-sequence cache ─────────────────────────────────────
+# get_sequence_list() is called several times per GUI action for the same
+# grid; an unchanged grid becomes a dict lookup keyed on grid_signature().
+_SEQ_CACHE_MAX = 64
+_seq_cache = OrderedDict()
+_seq_cache_lock = threading.Lock()
+_seq_stats = {"hits": 0, "misses": 0}
+
+
+def grid_signature(state):
+    """Frozen, hashable snapshot of every AppState field that shapes the sequence."""
+    st = state
+    return (
+        tuple(sorted(st.selected_notes)), st.playback_root,
+        tuple(sorted(st.selected_intervals)),
+        tuple(sorted(st.muted_intervals)),
+        tuple(sorted((iv, tuple(sorted(o))) for iv, o in st.extension_octaves.items() if o)),
+        st.scale, tuple(sorted(st.scale_notes or ())),
+        bool(st.diatonic_mode), bool(st.alt_seq_enabled),
+        st.direction_mode, bool(st.include_turnaround),
+        getattr(st, "shuffle_seed", 0), getattr(st, "stride_n", 2),
+    )
+
+
+def cache_stats() -> dict:
+    """Sequence cache counters (for profiling)."""
+    with _seq_cache_lock:
+        return dict(_seq_stats, size=len(_seq_cache), maxsize=_SEQ_CACHE_MAX,
+                    permutations=direction_permutation.cache_info()._asdict())
+
+
+def clear_cache():
+    with _seq_cache_lock:
+        _seq_cache.clear()
+        _seq_stats.update(hits=0, misses=0)
+
 
 class SequenceGenerator:
     """
@@ -29,6 +112,7 @@ class SequenceGenerator:
 
             root      = st.playback_root or next(iter(st.selected_notes))
             scale_ivs = SCALES[st.scale]["intervals"]        # e.g. [0,2,4,7,9]
+            mask      = pcs_mask(st.scale_notes)             # snap table key
             seq       = []
 
             for iv in sorted(st.selected_intervals):
@@ -46,7 +130,7 @@ class SequenceGenerator:
                     else:
                         # Chromatic: use raw interval, then snap to nearest scale
                         note = self._midi_from_grid(root, iv, o)
-                        note = snap_to_scale(note, st.scale_notes)
+                        note = snap_note(note, mask)
 
                     seq.append(note)
             return seq
@@ -80,6 +164,7 @@ class SequenceGenerator:
         root = st.playback_root or next(iter(st.selected_notes))
         use_diatonic = bool(getattr(st, "diatonic_mode", False) and st.scale)
         scale_ivs = SCALES[st.scale]["intervals"] if use_diatonic else None
+        mask = pcs_mask(st.scale_notes) if use_diatonic else 0
 
         lists = []
         for iv in sorted(st.selected_intervals):
@@ -98,7 +183,7 @@ class SequenceGenerator:
                         note = self._midi_from_grid(root, mapped_iv, o)
                     else:
                         note = self._midi_from_grid(root, iv, o)
-                        note = snap_to_scale(note, st.scale_notes)
+                        note = snap_note(note, mask)
                     seq.append(note)
             else:
                 seq = [self._midi_from_grid(root, iv, o) for o in octs]
@@ -124,7 +209,30 @@ class SequenceGenerator:
         Return the final play list, applying:
           • default vs alt mode
           • direction / ping-pong options
+        Memoised on grid_signature(); always returns a fresh list.
         """
+        try:
+            key = grid_signature(self.state)
+        except Exception:
+            key = None   # odd state (e.g. unhashable override): just build
+        if key is not None:
+            with _seq_cache_lock:
+                hit = _seq_cache.get(key)
+                if hit is not None:
+                    _seq_cache.move_to_end(key)
+                    _seq_stats["hits"] += 1
+                    return list(hit)
+                _seq_stats["misses"] += 1
+
+        seq = self._build_sequence_list()
+        if key is not None:
+            with _seq_cache_lock:
+                _seq_cache[key] = tuple(seq)
+                while len(_seq_cache) > _SEQ_CACHE_MAX:
+                    _seq_cache.popitem(last=False)
+        return seq
+
+    def _build_sequence_list(self):
         # 1) base sequence
         if self.state.alt_seq_enabled:
             seq = self._build_alt_cycle()          # new alt logic
@@ -132,21 +240,22 @@ class SequenceGenerator:
         else:
             seq = self.get_default_sequence()      # existing default builder
 
-        # 2) apply direction modes (unchanged)
-        if self.state.direction_mode == 1:                 # reverse
-            seq = list(reversed(seq))
-        elif self.state.direction_mode in (2, 3):          # ping-pong
-            rev = list(reversed(seq))
-            if self.state.direction_mode == 2:             # forward then backward
-                seq = seq + rev
-                if not self.state.include_turnaround:
-                    seq = seq[:-1]
-            else:                                          # backward then forward
-                seq = rev + seq
-                if not self.state.include_turnaround:
-                    seq = seq[1:]
+        return self.apply_direction(seq)
 
-        return seq
+    def apply_direction(self, seq):
+        """Apply direction_mode / include_turnaround to a base sequence (one gather)."""
+        st = self.state
+        mode = st.direction_mode or DIR_FORWARD
+        if mode == DIR_FORWARD or not seq:
+            return list(seq)
+        if mode == DIR_SHUFFLE:
+            param = getattr(st, "shuffle_seed", 0)
+        elif mode == DIR_STRIDE:
+            param = getattr(st, "stride_n", 2)
+        else:
+            param = 0
+        perm = direction_permutation(len(seq), mode, bool(st.include_turnaround), param)
+        return list(map(seq.__getitem__, perm))
     
     def _midi_from_grid(self, root, interval, octave):
         root_index = NOTE_NAMES.index(root)
@@ -155,3 +264,61 @@ class SequenceGenerator:
         return midi
 
 
+# ────────────────────────────────────────────────────────────
+# Root bank: the current pattern pre-rendered for all 12 roots
+# ────────────────────────────────────────────────────────────
+class _RootView:
+    """AppState stand-in with the root (and its scale) swapped; reads fall through."""
+    def __init__(self, state, root, scale_notes):
+        self._state = state
+        self.selected_notes = {root}
+        self.original_root  = root
+        self.playback_root  = None
+        self.scale_notes    = scale_notes
+
+    def __getattr__(self, name):
+        return getattr(self._state, name)
+
+
+def root_bank_signature(state):
+    """Everything except the root that shapes last_seq (bank invalidation key)."""
+    st = state
+    km = getattr(st, "key_mapper", None)
+    return (
+        tuple(sorted(st.selected_intervals)),
+        tuple(sorted((iv, tuple(sorted(o))) for iv, o in st.extension_octaves.items())),
+        tuple(sorted(st.muted_intervals)),
+        bool(st.alt_seq_enabled), st.direction_mode, bool(st.include_turnaround),
+        getattr(st, "shuffle_seed", 0), getattr(st, "stride_n", 2),
+        bool(st.diatonic_mode), st.scale, bool(st.stay_in_key), st.key_anchor,
+        (km.key_pc, km.scale, tuple(km.pattern)) if km else None,
+    )
+
+
+def build_root_bank(state):
+    """
+    last_seq for each of the 12 roots (index = pitch class), built the way
+    main.on_change does it. Stay-In-Key with a KeyMapper keeps the diatonic
+    shape via KeyMapper.transpose. Returns [(seq, scale_pcs), …].
+    """
+    st = state
+    diatonic = bool(st.diatonic_mode and st.scale)
+    stay = diatonic and bool(getattr(st, "stay_in_key", False))
+    km = getattr(st, "key_mapper", None) if stay else None
+    bank = []
+    for root in NOTE_NAMES:
+        pcs = set()
+        if diatonic:
+            anchor = (st.key_anchor or st.original_root) if stay else root
+            pcs = calc_scale_notes(anchor, st.scale)
+        view = _RootView(st, root, pcs)
+        gen = SequenceGenerator(view)
+        if km is not None:
+            seq = gen.apply_direction(km.transpose(root))
+        else:
+            seq = gen.get_sequence_list()
+            if diatonic:
+                seq = snap_notes(seq, pcs)
+        bank.append((list(seq), pcs))
+    return bank
+
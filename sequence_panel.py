@@ -5,7 +5,7 @@ from config import COLORS, ENHARMONIC, NOTE_NAMES, NOTE_TO_COLOR
 from piano_panel import PianoPanel
 from utils import Tooltip
 from sequence_engine import SequenceGenerator
-from utils import Tooltip, get_snapped_intervals_octaves, snap_to_scale
+from utils import Tooltip, get_snapped_intervals_octaves, snap_notes
 from config import COLORS, ENHARMONIC, NOTE_NAMES, NOTE_TO_COLOR, CELL_WIDTH, CELL_HEIGHT, CELL_PAD
 
 
@@ -298,13 +298,7 @@ class SequencePanel(tk.Frame):
         if self.state.diatonic_mode and self.state.scale_notes:
             snap_map = get_snapped_intervals_octaves(self.state)
             # Build snapped version of seq:
-            snapped_seq = []
-            for note in seq:
-                if note is None:
-                    snapped_seq.append(None)
-                else:
-                    snapped_seq.append(snap_to_scale(note, self.state.scale_notes))
-            seq = snapped_seq
+            seq = snap_notes(seq, self.state.scale_notes)
         for i, lbl in enumerate(self.seq_labels):      # ← make sure this line is here
             if i < len(seq):
                 if seq[i] is None:
@@ -507,7 +501,7 @@ class SequencePanel(tk.Frame):
             lbl.note_midi = None
             lbl.rest = False
             lbl.disabled = False
-            self.update_counters()
+        self.update_counters()
 
     def _refresh_mode_buttons(self):
         """
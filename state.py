@@ -1,10 +1,44 @@
 # state.py
 from collections import defaultdict
 import json
+import threading
+
+# ── Change groups ──
+# Assigning one of these attributes bumps its group's version and wakes
+# anyone blocked in wait_for_change() (the MidiEngine mirror thread).
+# In-place mutations (state.last_seq.clear()) don't go through __setattr__;
+# call state.touch(<group>) after those.
+CHANGE_GROUPS = ("params", "sequence", "chain")
+_FIELD_GROUPS = {
+    "bpm":                ("params",),
+    "tempo":              ("params",),
+    "gate_pct":           ("params",),
+    "gate":               ("params",),
+    "subdivision":        ("params",),
+    "default_channel":    ("params",),
+    "slave_mode":         ("params",),
+    "is_running":         ("params",),
+    "transpose":          ("params", "sequence"),
+    "last_seq":           ("sequence",),
+    "direction_mode":     ("sequence",),
+    "include_turnaround": ("sequence",),
+    "shuffle_seed":       ("sequence",),
+    "stride_n":           ("sequence",),
+    "diatonic_mode":      ("sequence",),
+    "root_bank_mode":     ("sequence",),
+    "scale_notes":        ("sequence",),
+    "chain_arps_list":    ("chain",),
+    "chain_mode_enabled": ("chain",),
+    "chain_global_loops": ("chain",),
+}
 
 
 class AppState:
     def __init__(self):
+        # change tracking (underscored: skipped by to_dict)
+        object.__setattr__(self, "_versions", dict.fromkeys(CHANGE_GROUPS, 0))
+        object.__setattr__(self, "_changed", threading.Condition())
+
         # ── Root & Playback Notes ──
         self.selected_notes = {"C"}
         self.original_root = "C"
@@ -33,8 +67,11 @@ class AppState:
 
         # ── Sequencer Modes ──
         self.alt_seq_enabled = False
-        self.direction_mode = 0
+        self.direction_mode = 0       # 0 fwd, 1 rev, 2 ping, 3 rev-ping, 4 converge, 5 diverge, 6 shuffle, 7 stride
         self.include_turnaround = True
+        self.shuffle_seed = 0         # direction 6
+        self.stride_n = 2             # direction 7: every Nth step
+        self.root_bank_mode = False   # while playing: all 12 roots pre-uploaded, keys switch by index
         
         # ── MIDI slave mode ──
         self.slave_mode = False  # <— REQUIRED
@@ -70,12 +107,42 @@ class AppState:
         self.midi_shown = False
         self.step_index = -1        # tick index counter
 
+    # ────────────────────────────────────────────────────────────────
+    # Change notification
+    # ────────────────────────────────────────────────────────────────
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        groups = _FIELD_GROUPS.get(name)
+        if groups:
+            self.touch(*groups)
+
+    def touch(self, *groups):
+        """Mark groups dirty (all groups if none given) and wake waiters."""
+        with self._changed:
+            for g in (groups or CHANGE_GROUPS):
+                self._versions[g] = self._versions.get(g, 0) + 1
+            self._changed.notify_all()
+
+    def versions(self) -> dict:
+        with self._changed:
+            return dict(self._versions)
+
+    def wait_for_change(self, since=None, timeout=None) -> dict:
+        """
+        Block until any group version differs from `since` (or timeout) and
+        return the current versions. since=None returns immediately.
+        """
+        with self._changed:
+            if since is not None:
+                self._changed.wait_for(lambda: self._versions != since, timeout)
+            return dict(self._versions)
+
     # ────────────────────────────────────────────────────────────────
     # Lightweight (de)serialisation helpers
     # ────────────────────────────────────────────────────────────────
     def to_dict(self) -> dict:
         """Return a JSON-friendly snapshot of the state (sets → lists)."""
-        data = self.__dict__.copy()
+        data = {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
         # convert non-serialisable types
         data['selected_notes']    = list(self.selected_notes)
         data['selected_intervals'] = list(self.selected_intervals)
@@ -85,7 +152,7 @@ class AppState:
 
     def from_dict(self, data: dict):
         """Restore state from dict (safe defaults for older saves)."""
-        self.__dict__.update(data)
+        self.__dict__.update({k: v for k, v in data.items() if not k.startswith("_")})
         # convert lists back to sets / defaultdict
         self.selected_notes       = set(data.get('selected_notes', {"C"}))
         self.selected_intervals   = set(data.get('selected_intervals', []))
@@ -93,3 +160,4 @@ class AppState:
         self.scale_notes          = set(data.get('scale_notes', []))
         # diatonic_mode defaults gracefully if not present
         self.diatonic_mode        = data.get('diatonic_mode', False)
+        self.touch()
@@ -1,24 +1,9 @@
-import json
 import os
 
-# Paths to JSON data files (assumed in same directory)
-_base_dir = os.path.dirname(__file__)
-_scales_path = os.path.join(_base_dir, 'scales.json')
-_chords_path = os.path.join(_base_dir, 'chords.json')
-
-# Load scales data
-with open(_scales_path, 'r') as f:
-    _scales_json = json.load(f)
-    _raw_scales = _scales_json.get('scales', {})
-    
-
+import theory_cache
 
-
-# Load chords and intervals data
-with open(_chords_path, 'r') as f:
-    _chords_json = json.load(f)
-    _raw_chords = _chords_json.get('chords', {})
-    INTERVALS = _chords_json.get('intervals', {})
+# Paths to JSON data files (assumed in same directory)
+_base_dir = os.path.dirname(os.path.abspath(__file__))
 
 
 def _resolve_aliases(raw_data: dict) -> dict:
@@ -38,9 +23,57 @@ def _resolve_aliases(raw_data: dict) -> dict:
     return resolved
     
 
+# ── Compiled tables (built once, then loaded from theory_cache) ──
+# Pitch-class sets as 12-bit masks (bit pc set). Everything that used to
+# rebuild sets from interval lists per call reads these instead.
+def _rotations(ivs) -> tuple:
+    """12 masks: the interval set rooted on each pitch class 0-11."""
+    base = 0
+    for iv in ivs:
+        base |= 1 << (iv % 12)
+    return tuple(((base << r) | (base >> (12 - r))) & 0xFFF for r in range(12))
+
+
+def _degree_map(ivs) -> dict:
+    """interval pc → first 0-based degree index holding it."""
+    out = {}
+    for idx, iv in enumerate(ivs):
+        out.setdefault(iv % 12, idx)
+    return out
+
+
+def _compile(scales_json: dict, chords_json: dict) -> dict:
+    """Everything derived from the JSON files; cached by theory_cache."""
+    scales = _resolve_aliases(scales_json.get('scales', {}))
+    chords = _resolve_aliases(chords_json.get('chords', {}))
+    mask_pcs = tuple(frozenset(pc for pc in range(12) if m & (1 << pc)) for m in range(4096))
+    return {
+        'SCALES':        scales,
+        'CHORDS':        chords,
+        'INTERVALS':     chords_json.get('intervals', {}),
+        'MASK_PCS':      mask_pcs,
+        'POPCOUNT':      tuple(len(pcs) for pcs in mask_pcs),
+        'SCALE_DEGREES': {k: _degree_map(v['intervals']) for k, v in scales.items()},
+        'SCALE_MASKS':   {k: _rotations(v['intervals']) for k, v in scales.items()},
+        # degree-ordered pcs per root (KeyMapper needs the order, not just the set)
+        'SCALE_PCS':     {k: tuple(tuple((r + iv) % 12 for iv in v['intervals']) for r in range(12))
+                          for k, v in scales.items()},
+        'CHORD_MASKS':   {k: _rotations(v['intervals']) for k, v in chords.items()},
+    }
+
+
+_tables = theory_cache.load(_base_dir, _compile, name="theory", deps=(os.path.abspath(__file__),))
+
 # Final lookup tables
-SCALES = _resolve_aliases(_raw_scales)
-CHORDS = _resolve_aliases(_raw_chords)
+SCALES        = _tables['SCALES']
+CHORDS        = _tables['CHORDS']
+INTERVALS     = _tables['INTERVALS']
+MASK_PCS      = _tables['MASK_PCS']
+POPCOUNT      = _tables['POPCOUNT']
+SCALE_DEGREES = _tables['SCALE_DEGREES']
+SCALE_MASKS   = _tables['SCALE_MASKS']
+SCALE_PCS     = _tables['SCALE_PCS']
+CHORD_MASKS   = _tables['CHORD_MASKS']
 
 
 def get_scale_keys(order: str = 'length_then_alpha') -> list:
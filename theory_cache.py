@@ -0,0 +1,101 @@
+# theory_cache.py — compiled scales/chords tables, cached on disk
+#
+# theory.py (and FREDT/theory.py) parse scales.json/chords.json, resolve
+# aliases and build their lookup tables at import. FREDT starts as a fresh
+# interpreter on every launch, so that work is repeated each time. Here the
+# compiled tables are marshalled once per source set and reloaded on the next
+# import. The cache is keyed by the source files' mtime/size; on a stamp miss
+# the content hash is checked before rebuilding, so a touch() or checkout
+# that leaves the bytes alone still hits.
+#
+# GORD_THEORY_CACHE=0 disables the cache (always compile). json/hashlib are
+# only imported on a miss — on a hit they'd be most of the import cost.
+import marshal
+import os
+import sys
+import zlib
+
+_FORMAT = 1
+
+
+def cache_dir():
+    return os.environ.get("GORD_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "gord")
+
+
+def _stamp(paths) -> tuple:
+    out = []
+    for p in paths:
+        st = os.stat(p)
+        out.append((os.path.basename(p), st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+
+def _digest(paths) -> str:
+    import hashlib
+    h = hashlib.sha1()
+    for p in paths:
+        with open(p, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def _cache_path(base_dir, name):
+    tag = "%08x" % zlib.crc32(os.path.abspath(base_dir).encode("utf-8"))
+    ver = "%d%d" % sys.version_info[:2]        # marshal format is per interpreter
+    return os.path.join(cache_dir(), f"{name}-{tag}-py{ver}.marshal")
+
+
+def _read_json(base_dir):
+    import json
+    with open(os.path.join(base_dir, "scales.json"), "r", encoding="utf-8") as f:
+        scales_json = json.load(f)
+    with open(os.path.join(base_dir, "chords.json"), "r", encoding="utf-8") as f:
+        chords_json = json.load(f)
+    return scales_json, chords_json
+
+
+def _write(path, payload):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(marshal.dumps(payload))
+        os.replace(tmp, path)
+    except (OSError, ValueError):
+        pass
+
+
+def load(base_dir, compile_fn, name="theory", deps=()) -> dict:
+    """
+    Return compile_fn(scales_json, chords_json) for the JSON files in
+    base_dir, from the cache when the sources (plus `deps`, typically the
+    calling theory.py) are unchanged. compile_fn must return a dict of
+    marshal-able values (dict/list/tuple/frozenset/str/int/...).
+    """
+    paths = [os.path.join(base_dir, "scales.json"), os.path.join(base_dir, "chords.json")]
+    paths += [p for p in deps if p]
+    if os.environ.get("GORD_THEORY_CACHE", "1") == "0":
+        return compile_fn(*_read_json(base_dir))
+
+    path = _cache_path(base_dir, name)
+    try:
+        stamp = _stamp(paths)
+    except OSError:
+        return compile_fn(*_read_json(base_dir))
+
+    try:
+        with open(path, "rb") as f:
+            fmt, old_stamp, old_digest, data = marshal.loads(f.read())
+        if fmt == _FORMAT:
+            if old_stamp == stamp:
+                return data
+            digest = _digest(paths)
+            if old_digest == digest:
+                _write(path, (_FORMAT, stamp, digest, data))   # refresh stamp
+                return data
+    except Exception:
+        pass
+
+    data = compile_fn(*_read_json(base_dir))
+    _write(path, (_FORMAT, stamp, _digest(paths), data))
+    return data
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py — import time of GORD and FREDT, theory cache off vs warm.
+
+Each sample is a fresh interpreter (FREDT launches as its own process), so
+the numbers include interpreter start-up. "before" runs with
+GORD_THEORY_CACHE=0 (scales/chords parsed and compiled on import, as the
+tree used to); "after" runs against a warm cache in a scratch cache dir.
+
+Usage:
+  python3 tools/bench_startup.py [--runs 7]
+"""
+import os, sys, argparse, statistics, subprocess, tempfile, time
+
+ROOT  = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FREDT = os.path.join(ROOT, "FREDT")
+
+# (label, module, cwd / sys.path[0]) — FREDT imports its siblings flat
+TARGETS = [
+    ("theory",           "theory",     ROOT),
+    ("main",             "main",       ROOT),
+    ("FREDT theory",     "theory",     FREDT),
+    ("FREDT.fredt_main", "fredt_main", FREDT),
+]
+
+_PROBE = (
+    "import sys, time\n"
+    "sys.path.insert(0, {path!r})\n"
+    "t0 = time.perf_counter()\n"
+    "try:\n"
+    "    import {mod}\n"
+    "except Exception as e:\n"
+    "    print('ERR', type(e).__name__, e); raise SystemExit\n"
+    "print(time.perf_counter() - t0)\n"
+)
+
+
+def _sample(mod, path, env):
+    t0 = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", _PROBE.format(mod=mod, path=path)],
+                         cwd=path, env=env, capture_output=True, text=True).stdout.strip()
+    wall = time.perf_counter() - t0
+    if not out or out.startswith("ERR"):
+        return None, out[4:] or "no output"
+    return (float(out), wall), None
+
+
+def _measure(mod, path, env, runs):
+    imports, walls = [], []
+    for _ in range(runs):
+        res, err = _sample(mod, path, env)
+        if err:
+            return None, err
+        imports.append(res[0])
+        walls.append(res[1])
+    return (statistics.median(imports) * 1e3, statistics.median(walls) * 1e3), None
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--runs", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as cache:
+        base = dict(os.environ, GORD_CACHE_DIR=cache)
+        cold = dict(base, GORD_THEORY_CACHE="0")
+        warm = dict(base, GORD_THEORY_CACHE="1")
+
+        print(f"{'target':<18} {'before ms':>10} {'after ms':>9} {'speedup':>8}"
+              f" {'proc before':>12} {'proc after':>11}   (import / whole process, median)")
+        for label, mod, path in TARGETS:
+            _sample(mod, path, warm)                  # populate the cache
+            before, err = _measure(mod, path, cold, args.runs)
+            after,  _   = _measure(mod, path, warm, args.runs) if not err else (None, None)
+            if err:
+                print(f"{label:<18} import failed: {err}")
+                continue
+            print(f"{label:<18} {before[0]:>10.1f} {after[0]:>9.1f} {before[0] / after[0]:>7.1f}x"
+                  f" {before[1]:>12.1f} {after[1]:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
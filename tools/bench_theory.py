@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+bench_theory.py — per-call cost of the theory helpers, set-based vs compiled tables.
+
+The "before" column re-implements the old per-call set building inline
+(interval list scans, set comprehensions); "after" is the current utils
+code reading theory's precomputed degree maps and pitch-class masks.
+
+Usage:
+  python3 tools/bench_theory.py [--n 2000]
+"""
+import os, sys, random, argparse, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import utils
+from theory import SCALES
+
+
+# ---------- legacy (pre-table) implementations ----------
+def _old_interval_to_degree(iv, scale_key):
+    if not scale_key:
+        return None
+    iv_mod = iv % 12
+    for idx, scale_iv in enumerate(SCALES[scale_key]['intervals']):
+        if scale_iv % 12 == iv_mod:
+            return idx
+    return None
+
+
+def _old_calc_scale_notes(root_name, scale_key):
+    root_pc = utils.NOTE_NAMES.index(root_name)
+    return {(root_pc + iv) % 12 for iv in SCALES[scale_key]["intervals"]}
+
+
+def _old_scale_sets(pcs, root_pc):
+    # the set work best_scales_for_notes did per scale, per call
+    input_set = set(pcs)
+    out = []
+    for key, d in SCALES.items():
+        s = {((root_pc or 0) + iv) % 12 for iv in d["intervals"]}
+        out.append((len(input_set & s), s.issubset(input_set), input_set.issubset(s), sorted(s - input_set)))
+    return out
+
+
+def _new_scale_sets(pcs, root_pc):
+    m = utils.pcs_mask(pcs)
+    r = (root_pc or 0) % 12
+    out = []
+    for rot in utils.SCALE_MASKS.values():
+        s = rot[r]
+        out.append((utils.POPCOUNT[m & s], not s & ~m, not m & ~s, sorted(utils.MASK_PCS[s & ~m])))
+    return out
+
+
+def _uncached_one_root(pcs, root_pc):
+    return utils._best_scales.__wrapped__(utils.pcs_mask(pcs), root_pc % 12, 6)
+
+
+def _uncached_any_root(pcs, root_pc):
+    return utils._best_scales.__wrapped__(utils.pcs_mask(pcs), None, 6)
+
+
+def _per_call_us(fn, args_list, n):
+    k = len(args_list)
+    t0 = time.perf_counter()
+    for i in range(n):
+        fn(*args_list[i % k])
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=2000)
+    args = ap.parse_args(argv)
+
+    rnd = random.Random(11)
+    keys = list(SCALES)
+    deg_args   = [(rnd.randrange(13), rnd.choice(keys)) for _ in range(256)]
+    notes_args = [(rnd.choice(utils.NOTE_NAMES), rnd.choice(keys)) for _ in range(256)]
+    pcs_args   = [(sorted(rnd.sample(range(12), rnd.randint(3, 7))), rnd.randrange(12)) for _ in range(64)]
+
+    rows = [
+        ("interval_to_degree", _old_interval_to_degree, utils.interval_to_degree, deg_args, args.n * 10),
+        ("calc_scale_notes",   _old_calc_scale_notes,   utils.calc_scale_notes,   notes_args, args.n * 10),
+        ("scale set match",    _old_scale_sets,         _new_scale_sets,          pcs_args, args.n // 4 or 1),
+        ("best_scales (full)", None,                    _uncached_one_root,       pcs_args, args.n // 4 or 1),
+        ("best_scales (any)",  None,                    _uncached_any_root,       pcs_args, args.n // 4 or 1),
+    ]
+    print(f"{'helper':<20} {'before µs':>10} {'after µs':>10} {'speedup':>8}")
+    for name, old, new, a, n in rows:
+        after = _per_call_us(new, a, n)
+        if old is None:
+            print(f"{name:<20} {'-':>10} {after:>10.2f} {'-':>8}")
+            continue
+        before = _per_call_us(old, a, n)
+        print(f"{name:<20} {before:>10.2f} {after:>10.2f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+bench_wire.py — JSON vs binary (gord_wire) control messages.
+
+Reports bytes on the wire and per-message encode/decode time for a 256-step
+sequence, a 16-slot chain and a typical slider `set`.
+
+Usage:
+  python3 tools/bench_wire.py [--n 2000]
+"""
+import os, sys, json, random, argparse, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gord_wire
+
+
+def _messages():
+    rnd = random.Random(7)
+    seq = [rnd.choice([-1] + list(range(36, 96))) for _ in range(256)]
+    chain = {"cmd": "chain", "index": 0, "slots": [
+        {"notes": [rnd.choice([-1] + list(range(36, 96))) for _ in range(rnd.randint(16, 64))],
+         "loops": rnd.choice([-1, 1, 2, 4])}
+        for _ in range(16)]}
+    setm = {"cmd": "set", "tempo": 123.5, "subdivision": 16, "gate": 45.0,
+            "channel": 1, "transpose": 0, "slave_mode": False}
+    return [("seq[256]", {"cmd": "seq", "notes": seq}), ("chain[16]", chain), ("set", setm)]
+
+
+def _per_call_us(fn, arg, n):
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn(arg)
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=2000)
+    args = ap.parse_args(argv)
+
+    j_enc = lambda m: json.dumps(m).encode("utf-8")
+    j_dec = lambda b: json.loads(b.decode("utf-8"))
+
+    print(f"{'message':<10} {'json B':>8} {'bin B':>7} {'json enc':>10} {'bin enc':>9}"
+          f" {'json dec':>10} {'bin dec':>9}   (µs/msg)")
+    for name, msg in _messages():
+        jb, bb = j_enc(msg), gord_wire.encode(msg)
+        assert gord_wire.decode(bb)["cmd"] == msg["cmd"]
+        print(f"{name:<10} {len(jb):>8} {len(bb):>7}"
+              f" {_per_call_us(j_enc, msg, args.n):>10.2f} {_per_call_us(gord_wire.encode, msg, args.n):>9.2f}"
+              f" {_per_call_us(j_dec, jb, args.n):>10.2f} {_per_call_us(gord_wire.decode, bb, args.n):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
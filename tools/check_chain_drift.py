@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+check_chain_drift.py — ChainRunner loop-boundary drift on a virtual clock.
+
+Runs ChainRunner._run against an injected clock whose sleep() oversleeps by a
+random 0–--jitter-ms (like a loaded machine), for --loops slot loops over two
+slots of different lengths at 240 BPM 1/16. Boundary times are compared with
+the exact cumulative sum of loop lengths. The old per-loop accounting
+(t0 = time.time() each loop, remaining recomputed from it) is replayed on the
+same clock for comparison. A tempo change half-way through a loop checks the
+rebasing: the rest of that loop should stretch to the new tempo.
+
+Usage:
+  python3 tools/check_chain_drift.py [--loops 1000] [--jitter-ms 4]
+"""
+import os, sys, argparse, random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from state import AppState
+from chain_runner import ChainRunner
+
+
+class VirtualClock:
+    def __init__(self, jitter_ns, seed=1):
+        self.t = 0
+        self.jitter_ns = jitter_ns
+        self.rng = random.Random(seed)
+        self.hooks = []                     # (at_ns, fn), fired once when passed
+
+    def now_ns(self):
+        return self.t
+
+    def sleep(self, secs):
+        self.t += int(secs * 1e9) + self.rng.randint(0, self.jitter_ns)
+        for hook in [h for h in self.hooks if self.t >= h[0]]:
+            self.hooks.remove(hook)
+            hook[1]()
+        return False                        # Event.wait(): "not stopped"
+
+
+class _Engine:
+    # the slice of MidiEngine ChainRunner reads
+    _chain_active = False
+
+    def __init__(self, state):
+        self.state = state
+
+    def get_tempo(self):
+        return float(self.state.bpm)
+
+    def get_subdivision(self):
+        return int(self.state.subdivision)
+
+    def _push_all(self, immediate=True):
+        pass
+
+
+def _state():
+    st = AppState()
+    st.bpm = 240.0
+    st.subdivision = 16
+    st.chain_arps_list = [
+        {"root": "C", "sequence": list(range(60, 68)), "loop_count": 1},    # 8 steps
+        {"root": "G", "sequence": list(range(67, 79)), "loop_count": 1},    # 12 steps
+    ]
+    return st
+
+
+def _step_ns(bpm, subdiv=16):
+    return (60.0 / bpm) * (4.0 / subdiv) * 1e9
+
+
+def _ideal(n_loops, bpm=240.0):
+    # exact boundaries: slot lengths alternate 8/12 steps
+    out, t = [], 0
+    for k in range(n_loops):
+        out.append(t)
+        t += int(round((8 if k % 2 == 0 else 12) * _step_ns(bpm)))
+    return out, t
+
+
+def run_new(n_loops, jitter_ns):
+    st = _state()
+    clk = VirtualClock(jitter_ns)
+    ticks = []
+    runner = ChainRunner(st, _Engine(st), lambda i, c, t, a: a and ticks.append(clk.t),
+                         None, global_loops=str(n_loops // 2), clock=clk.now_ns, sleep=clk.sleep)
+    runner.running = True
+    runner._run()
+    return ticks, runner.deadline_ns
+
+
+def run_legacy(n_loops, jitter_ns):
+    # the pre-deadline loop: t0 taken after each wake, remaining recomputed from it
+    clk = VirtualClock(jitter_ns)
+    ticks = []
+    for k in range(n_loops):
+        ticks.append(clk.t)
+        loop = (8 if k % 2 == 0 else 12) * _step_ns(240.0) / 1e9
+        t0, remain = clk.t, loop
+        while remain > 0:
+            clk.sleep(min(0.02, remain))
+            remain = loop - (clk.t - t0) / 1e9
+    return ticks, clk.t
+
+
+def run_tempo_change(jitter_ns):
+    # 240 → 120 BPM half-way through the third loop (8 steps: 500 ms at 240)
+    st = _state()
+    clk = VirtualClock(jitter_ns)
+    ticks = []
+    runner = ChainRunner(st, _Engine(st), lambda i, c, t, a: a and ticks.append(clk.t),
+                         None, global_loops="3", clock=clk.now_ns, sleep=clk.sleep)
+    ideal, _ = _ideal(3)
+    change_at = ideal[2] + int(250e6)
+    clk.hooks.append((change_at, lambda: setattr(st, "bpm", 120.0)))
+    runner.running = True
+    runner._run()
+    return ticks
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--loops", type=int, default=1000)
+    ap.add_argument("--jitter-ms", type=float, default=4.0)
+    args = ap.parse_args(argv)
+    jitter = int(args.jitter_ms * 1e6)
+    n = args.loops - args.loops % 2
+
+    ideal, end = _ideal(n)
+    ticks, deadline = run_new(n, jitter)
+    late = [(t - i) / 1e6 for t, i in zip(ticks, ideal)]
+    sched = (deadline - end) / 1e6
+    print(f"deadline runner: {len(ticks)} loops, final boundary scheduled {sched:+.6f} ms off ideal, "
+          f"tick wake latency max {max(late):.2f} ms / last {late[-1]:.2f} ms (not cumulative)")
+
+    lticks, lend = run_legacy(n, jitter)
+    print(f"legacy runner:   {len(lticks)} loops, final boundary {(lend - end) / 1e6:+.1f} ms off ideal")
+
+    tticks = run_tempo_change(jitter)
+    slow = tticks[3] - tticks[2]
+    print(f"tempo 240→120 mid-loop: that loop took {slow / 1e6:.1f} ms "
+          f"(500 ms at 240, 1000 ms at 120; ~750 expected), next loop took "
+          f"{(tticks[4] - tticks[3]) / 1e6:.1f} ms (12 steps at 120 = 1500)")
+
+    ok = abs(sched) < 1.0 and len(ticks) == n and late[-1] <= args.jitter_ms + 1
+    print("PASS: < 1 ms cumulative drift" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
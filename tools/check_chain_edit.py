@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+check_chain_edit.py — edit a live linked chain: hot-swap vs. full re-arm.
+
+Plays a three-slot chain (4 steps each, 240 BPM 1/16 → 62.5 ms steps) on
+rt_standin with a memory sink, then edits slot B mid-loop — once through
+MidiEngine.update_chain (chain_edit ops), once through play_chain (the old
+stop → clear → re-arm → start path). For each run it reports how far any
+note-on interval strays from one step (a clean swap keeps every onset on the
+grid; a restart shows up as an off-grid interval), where B's new notes first
+sound, and the bytes sent. A third run gives B a loop count of "0": armed
+and hot-edited it must play once (like set_chain's clamp), never forever.
+
+Usage:
+  python3 tools/check_chain_edit.py
+"""
+import os, sys, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import gord_wire
+from rt_standin import GordRTStandin, MemorySink
+from state import AppState
+from midi_engine import MidiEngine
+
+SOCK    = "/tmp/gord_chain_edit_check.sock"
+STEP_NS = 62_500_000
+A, B, C = [48, 50, 52, 53], [55, 57, 59, 60], [62, 64, 65, 67]
+B_NEW   = [72, 74, 76, 77]
+
+
+def _slots(b, b_loops=1):
+    return [{"notes": n, "loops": b_loops if n is b else 1, "idx": i} for i, n in enumerate((A, b, C))]
+
+
+def _run(hot, b_loops=1):
+    daemon = GordRTStandin(SOCK, MemorySink()).start()
+    st = AppState()
+    st.bpm, st.subdivision, st.chain_runner = 240.0, 16, None
+    engine = MidiEngine(st, sock=SOCK)
+    time.sleep(0.2)
+
+    sent = []
+    send = engine._rt._send
+    engine._rt._send = lambda obj: (sent.append(len(engine._rt._encode(obj))), send(obj))
+
+    engine.play_chain(_slots(B, b_loops))
+    st.is_running = True
+    engine.start()
+    time.sleep(0.53)                          # mid-loop
+    sent.clear()
+    t_edit = time.monotonic_ns()
+    if hot:
+        ok = engine.update_chain(_slots(B_NEW, b_loops))
+    else:
+        engine.play_chain(_slots(B_NEW), index=0)
+        ok = True
+    payload = sum(sent)
+    time.sleep(1.2)
+    armed_loops = [s["loops"] for s in daemon.shared.chainSlots]
+    engine.stop()
+    daemon.stop()
+
+    ons = [(ts, b[1] - 12) for ts, _, b in daemon.sink.snapshot() if b[0] & 0xF0 == 0x90]
+    gaps = [b[0] - a[0] for a, b in zip(ons, ons[1:])]
+    first_new = next((ts for ts, n in ons if n == B_NEW[0]), None)
+    if b_loops != 1:
+        return ok, armed_loops, ons
+    return ok, max(abs(g - STEP_NS) for g in gaps) / 1e6, payload, (first_new - t_edit) / 1e6 if first_new else None, ons
+
+
+def main():
+    print(f"full chain datagram: {len(gord_wire.encode({'cmd': 'chain', 'slots': _slots(B), 'index': 0}))} bytes")
+    ok_all = True
+    for label, hot in (("re-arm (play_chain)", False), ("hot-swap (update_chain)", True)):
+        ok, worst, payload, first_new, ons = _run(hot)
+        # hot-swap: B's new loop must start on a 4-step boundary of the running grid
+        aligned = None
+        if first_new is not None:
+            t0 = ons[0][0]
+            t_new = next(ts for ts, n in ons if n == B_NEW[0])
+            aligned = (t_new - t0) % (4 * STEP_NS) == 0
+        print(f"{label:<24} sent {payload:4d} B, onsets off the step grid by up to {worst:5.1f} ms, "
+              f"new B first sounds {first_new:6.1f} ms after the edit, "
+              f"on the original loop grid: {aligned}")
+        if hot:
+            ok_all = ok and worst < 0.01 and aligned
+
+    # loops "0": B_NEW plays one loop (4 steps) and hands over to C
+    ok, armed_loops, ons = _run(True, b_loops="0")
+    notes = [n for _, n in ons]
+    at = notes.index(B_NEW[0]) if B_NEW[0] in notes else -1
+    once = at >= 0 and notes[at:at + 5] == B_NEW + [C[0]]
+    print(f"{'loops 0, hot-edited':<24} daemon loops {armed_loops}, B new plays once then C: {once}")
+    ok_all = ok_all and ok and once and armed_loops == [1, 1, 1]
+    print("PASS: hot-swap kept the grid" if ok_all else "FAIL")
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+check_chain_model.py — ChainModel edits vs. the old widget-row list edits.
+
+Replays --ops random add/remove/move/mute/solo/clear edits on a ChainModel
+and, side by side, on a plain list handled the way ChainArpsWindow used to
+(rows appended/hidden at the end, adjacent swaps, mute/solo rules). The
+snapshot lists must stay identical. Then times move + mute on 16- and
+--rows-row chains: model edits cost the same at any length (the window only
+repaints its 16 pooled rows after them). No Tk needed.
+
+Usage:
+  python3 tools/check_chain_model.py [--ops 20000] [--rows 512]
+"""
+import os, sys, argparse, random, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from state import AppState
+from chain_model import ChainModel, make_empty_snapshot
+
+
+class _OldRows:
+    # chain_arps_list edits as the pre-model window made them
+    def __init__(self, snaps):
+        self.snaps = snaps
+        while len(snaps) < 8:
+            snaps.append(None)
+        self.n = 0
+        self.add()
+
+    def add(self):
+        if self.n >= ChainModel.MAX_ROWS:
+            return
+        if self.n >= len(self.snaps):
+            self.snaps.append(None)
+        if self.snaps[self.n] is None:
+            self.snaps[self.n] = make_empty_snapshot()
+        self.snaps[self.n]['hidden'] = False
+        self.n += 1
+
+    def remove(self):
+        if self.n <= 1:
+            return
+        self.n -= 1
+        if self.snaps[self.n] is not None:
+            self.snaps[self.n]['muted'] = True
+            self.snaps[self.n]['hidden'] = True
+
+    def move(self, i, j):
+        if 0 <= i < self.n and 0 <= j < self.n:
+            self.snaps[i], self.snaps[j] = self.snaps[j], self.snaps[i]
+
+    def mute(self, i):
+        snap = self.snaps[i]
+        snap['muted'] = not snap.get('muted', False)
+        if not snap['muted'] and snap.get('solo'):
+            snap['solo'] = False
+
+    def solo(self, i):
+        snap = self.snaps[i]
+        snap['solo'] = not snap.get('solo', False)
+        if snap['solo'] and snap.get('muted'):
+            snap['muted'] = False
+
+    def clear(self, i):
+        self.snaps[i] = make_empty_snapshot()
+
+
+def _replay(n_ops, seed=7):
+    rng = random.Random(seed)
+    st_new, st_old = AppState(), AppState()
+    model, old = ChainModel(st_new), _OldRows(st_old.chain_arps_list)
+    for _ in range(n_ops):
+        op = rng.choice(("add", "add", "remove", "move", "mute", "solo", "clear"))
+        i = rng.randrange(len(model))
+        if op == "add":
+            model.add(); old.add()
+        elif op == "remove":
+            model.remove(); old.remove()
+        elif op == "move":
+            j = i + rng.choice((-1, 1))
+            model.move(i, j); old.move(i, j)
+        elif op == "mute":
+            model.toggle_mute(i); old.mute(i)
+        elif op == "solo":
+            model.toggle_solo(i); old.solo(i)
+        else:
+            model.clear(i); old.clear(i)
+        if len(model) != old.n:
+            return False, len(model)
+    return st_new.chain_arps_list == st_old.chain_arps_list, len(model)
+
+
+def _time_edits(rows, reps=20000):
+    st = AppState()
+    model = ChainModel(st)
+    while len(model) < rows:
+        model.add()
+    t0 = time.perf_counter()
+    for k in range(reps):
+        i = k % (rows - 1)
+        model.move(i, i + 1)
+        model.toggle_mute(i)
+    return (time.perf_counter() - t0) / reps * 1e6
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--ops", type=int, default=20000)
+    ap.add_argument("--rows", type=int, default=ChainModel.MAX_ROWS)
+    args = ap.parse_args(argv)
+
+    same, final = _replay(args.ops)
+    print(f"{args.ops} random edits: snapshot lists identical: {same} ({final} rows at the end)")
+    small, large = _time_edits(16), _time_edits(args.rows)
+    print(f"move + mute per edit: {small:.2f} µs at 16 rows, {large:.2f} µs at {args.rows} rows")
+
+    ok = same and large < small * 3
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+check_chain_upload.py — multi-part chain upload through rt_standin.
+
+Arms a chain of more than --steps steps via GordRTClient.set_chain on a
+scratch rt_standin socket, once per wire format (binary, JSON). The
+client's 'patterns' cap is dropped so set_chain has to use the
+chain_begin → chain_part → chain_commit path. The daemon's armed slots
+must equal the input. Then two uploads that must be rejected: a commit
+whose crc doesn't match, and a part whose notes were altered in transit.
+Either one has to leave the previous chain armed, while the same upload
+sent intact replaces it.
+
+Usage:
+  python3 tools/check_chain_upload.py [--steps 20000]
+"""
+import os, sys, argparse, random, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import gord_wire
+from rt_standin import GordRTStandin, MemorySink
+from midi_engine import GordRTClient
+
+SOCK = "/tmp/gord_chain_upload_check.sock"
+
+
+def _chain(steps, seed=3):
+    rng = random.Random(seed)
+    lens = [steps // 2 + 1, steps // 3, steps - steps // 2 - steps // 3 + 7]
+    return [{"notes": [rng.choice((-1, rng.randint(0, 127))) for _ in range(n)], "loops": loops}
+            for n, loops in zip(lens, (1, 3, None))]        # None = infinite
+
+
+def _expected(slots):
+    # what the daemon arms: set_chain sends infinite loops as -1
+    return [{"notes": s["notes"], "loops": -1 if s["loops"] is None else s["loops"]} for s in slots]
+
+
+def _armed(daemon):
+    with daemon.shared.lock:
+        return [{"notes": list(s["notes"]), "loops": s["loops"]} for s in daemon.shared.chainSlots]
+
+
+def _wait_armed(daemon, want, timeout=3.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if _armed(daemon) == want:
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _run(binary, steps):
+    daemon = GordRTStandin(SOCK, MemorySink()).start()
+    client = GordRTClient(SOCK)
+    client.negotiate()
+    if not binary:
+        client.wire_version = 0
+    client.caps.discard("patterns")            # force the chunked path
+
+    cmds = []
+    send = client._send
+    client._send = lambda obj: (cmds.append(obj.get("cmd")), send(obj))
+
+    slots = _chain(steps)
+    total = sum(len(s["notes"]) for s in slots)
+    client.set_chain(slots, index=1)
+    chunked = cmds[0] == "chain_begin" and cmds[-1] == "chain_commit" and cmds.count("chain_part") > 1
+    want = _expected(slots)
+    intact = _wait_armed(daemon, want)
+    index_ok = daemon.shared.chainIndex == 1
+
+    # a commit with the wrong crc must be dropped
+    other = _chain(steps, seed=4)
+    part = gord_wire.PART_NOTES_BINARY if client.wire_version else gord_wire.PART_NOTES_JSON
+    other = _expected(other)
+    msgs = gord_wire.split_chain(other, 0, 0xBAD, part)
+    msgs[-1] = dict(msgs[-1], crc=(msgs[-1]["crc"] + 1) & 0xFFFFFFFF)
+    for m in msgs:
+        send(m)
+    # ... and so must a part altered in transit (crc of the original slots)
+    msgs = gord_wire.split_chain(other, 0, 0xBAE, part)
+    first = next(m for m in msgs if m["cmd"] == "chain_part")
+    first["notes"] = [(n + 1) % 128 for n in first["notes"]]
+    for m in msgs:
+        send(m)
+    time.sleep(0.3)
+    rejected = _armed(daemon) == want
+    # control: the same upload with nothing tampered does replace the chain
+    for m in gord_wire.split_chain(other, 0, 0xBAF, part):
+        send(m)
+    rejected = rejected and _wait_armed(daemon, other)
+
+    client.close()
+    daemon.stop()
+    label = "binary" if binary else "JSON"
+    print(f"{label:<6} {total} steps in {len(cmds)} datagrams via chain_begin/part/commit: {chunked}, "
+          f"reassembled intact: {intact}, index kept: {index_ok}, bad crc / altered part rejected: {rejected}")
+    return chunked and intact and index_ok and rejected
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--steps", type=int, default=20000)
+    args = ap.parse_args(argv)
+
+    ok = all([_run(True, args.steps + 1), _run(False, args.steps + 1)])
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
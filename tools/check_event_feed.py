@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+check_event_feed.py — Chain Arps ticker vs. what the daemon actually plays.
+
+Starts rt_standin (memory sink) on a scratch socket, links a two-slot chain
+(4 steps ×2 loops, 6 steps ×1) at 240 BPM 1/16 and runs ChainRunner, which
+follows the daemon's loop/slot events. Each UI tick is compared with the
+note-on of the first step of the loop it announces. A second run hot-edits
+slot 0 while the last slot plays, so the edit lands on the wrap back to
+slot 0: that pass must still be counted.
+
+Usage:
+  python3 tools/check_event_feed.py [--passes 3]
+"""
+import os, sys, argparse, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from rt_standin import GordRTStandin, MemorySink
+from state import AppState
+from midi_engine import MidiEngine
+
+SOCK = "/tmp/gord_event_check.sock"
+SNAPS = [{"sequence": [60, 62, 64, 65], "loop_count": 2},
+         {"sequence": [67, 69, 71, 72, 74, 76], "loop_count": 1}]
+LOOP_HEADS = {60 + 12, 67 + 12}       # first note of each slot, as sent (+12)
+
+
+def _slots(first):
+    return [{"notes": s["sequence"], "loops": s["loop_count"], "idx": i}
+            for i, s in enumerate([dict(SNAPS[0], sequence=first)] + SNAPS[1:])]
+
+
+def _run(passes, hot):
+    daemon = GordRTStandin(SOCK, MemorySink()).start()
+    st = AppState()
+    st.bpm, st.subdivision, st.chain_runner = 240.0, 16, None
+    st.chain_arps_list = [dict(s) for s in SNAPS]
+    engine = MidiEngine(st, sock=SOCK)
+    time.sleep(0.2)                   # let the debounced params land
+    if not engine.daemon_events():
+        print("FAIL: daemon did not advertise 'events'")
+        return False
+
+    ticks, done, last_slot = [], [], []
+    engine.play_chain(_slots(SNAPS[0]["sequence"]))
+    runner = engine.make_chain_runner(
+        st, lambda i, c, t, a: a and ticks.append((time.monotonic_ns(), i, c, t)),
+        lambda: done.append(time.monotonic_ns()), global_loops=str(passes))
+    engine.add_event_listener(lambda ev: ev.get("kind") == "slot" and ev.get("slot") == 1
+                              and last_slot.append(ev))
+    st.chain_runner = runner
+    st.is_running = True
+    runner.start()
+    engine.start()
+    edited = None
+    deadline = time.time() + 10
+    while not done and time.time() < deadline:
+        if hot and edited is None and last_slot:
+            # staged for the next loop end = the last slot's wrap to slot 0
+            edited = engine.update_chain(_slots([60, 62, 64, 67]))
+        time.sleep(0.005)
+    runner.stop()
+    engine.stop()
+    daemon.stop()
+
+    heads = [ts for ts, _, b in daemon.sink.snapshot() if b[0] & 0xF0 == 0x90 and b[1] in LOOP_HEADS]
+    worst = 0.0
+    for t, row, cur, total in ticks:
+        off = (t - min(heads, key=lambda h: abs(h - t))) / 1e6
+        worst = max(worst, abs(off))
+        print(f"row {row} loop {cur}/{total}  tick − note-on {off:+6.2f} ms")
+    expect = passes * 3                   # 2 + 1 loops per pass
+    ok = bool(done) and len(ticks) == expect and worst < 10.0
+    if hot:
+        applied = daemon.shared.chainSlots[0]["notes"] == [72, 74, 76, 79]
+        print(f"hot edit at the wrap: sent {bool(edited)}, applied {applied}")
+        ok = ok and bool(edited) and applied
+    print(f"{len(ticks)} ticks (expected {expect}), passes done: {bool(done)}, worst offset {worst:.2f} ms")
+    return ok
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--passes", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    ok = _run(args.passes, hot=False)
+    ok = _run(args.passes, hot=True) and ok
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
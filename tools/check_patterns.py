@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+check_patterns.py — chain uploads through the pattern dictionary.
+
+Arms chains on rt_standin (memory sink) through MidiEngine and counts the
+bytes sent: a short A A B A chain, its re-arm on start(), and a --slots long
+chain cycling through a few patterns (one datagram by reference vs. a
+chunked upload). Each time the daemon's armed slots must match what was
+asked for. Finally the daemon is restarted under the engine: the next re-arm
+finds its patterns missing and has to re-define them.
+
+Usage:
+  python3 tools/check_patterns.py [--slots 300]
+"""
+import os, sys, argparse, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import gord_wire
+from rt_standin import GordRTStandin, MemorySink
+from state import AppState
+from midi_engine import MidiEngine
+
+SOCK = "/tmp/gord_patterns_check.sock"
+CHAIN_CMDS = {"chain", "chain_begin", "chain_part", "chain_commit", "pattern", "chain_ref"}
+
+
+def _pattern(k, steps=64):
+    return [-1 if i % 7 == 3 else 36 + (k * 5 + i * 3) % 48 for i in range(steps)]
+
+
+def _slots(keys):
+    return [{"notes": _pattern(k), "loops": 1 + k % 3, "idx": i} for i, k in enumerate(keys)]
+
+
+def _full_bytes(slots):
+    # what the pre-dictionary path sends: one chain datagram, or begin/parts/commit
+    payload = {"cmd": "chain", "index": 0,
+               "slots": [{"notes": s["notes"], "loops": s["loops"]} for s in slots]}
+    data = gord_wire.encode(payload)
+    if len(data) <= gord_wire.MAX_DGRAM:
+        return len(data), 1
+    msgs = gord_wire.split_chain(payload["slots"], 0, 1, gord_wire.PART_NOTES_BINARY)
+    return sum(len(gord_wire.encode(m)) for m in msgs), len(msgs)
+
+
+def _armed_ok(daemon, slots, tr=12):
+    got = daemon.shared.chainSlots
+    want = [([n + tr if n >= 0 else -1 for n in s["notes"]], s["loops"]) for s in slots]
+    return [(s["notes"], s["loops"]) for s in got] == want
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--slots", type=int, default=300)
+    args = ap.parse_args(argv)
+
+    daemon = GordRTStandin(SOCK, MemorySink()).start()
+    st = AppState()
+    st.chain_runner = None
+    engine = MidiEngine(st, sock=SOCK)
+    time.sleep(0.2)
+    if "patterns" not in engine._rt.caps:
+        print("FAIL: daemon did not advertise 'patterns'")
+        return 1
+
+    sent = []
+    send = engine._rt._send
+    engine._rt._send = lambda obj: (obj.get("cmd") in CHAIN_CMDS and sent.append(len(engine._rt._encode(obj))),
+                                    send(obj))
+
+    def arm(slots):
+        sent.clear()
+        engine.play_chain(slots)
+        time.sleep(0.05)
+        return sum(sent)
+
+    ok = True
+    rows = []
+    abab = _slots([0, 0, 1, 0])
+    rows.append(("A A B A, first arm", _full_bytes(abab), arm(abab), _armed_ok(daemon, abab)))
+    engine.stop()
+    sent.clear()
+    engine.start()
+    time.sleep(0.05)
+    rows.append(("A A B A, start() re-arm", _full_bytes(abab), sum(sent), _armed_ok(daemon, abab)))
+    engine.stop()
+
+    long_ = _slots([k % 6 for k in range(args.slots)])
+    rows.append((f"{args.slots} slots / 6 patterns", _full_bytes(long_),
+                 arm(long_), _armed_ok(daemon, long_)))
+
+    for label, (full, dgrams), ref, armed in rows:
+        print(f"{label:<28} full {full:6d} B in {dgrams:2d} datagram(s) → by reference {ref:6d} B, armed ok: {armed}")
+        ok = ok and armed and ref < full
+    ok = ok and rows[1][2] < 64
+
+    # daemon restart: it forgets every pattern; the "missing" reply triggers re-definition
+    daemon.stop()
+    daemon = GordRTStandin(SOCK, MemorySink()).start()
+    engine.play_chain(abab)
+    deadline = time.time() + 3
+    while not _armed_ok(daemon, abab) and time.time() < deadline:
+        time.sleep(0.05)
+    recovered = _armed_ok(daemon, abab)
+    print(f"after a daemon restart the chain re-armed from re-defined patterns: {recovered}")
+    daemon.stop()
+
+    ok = ok and recovered
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
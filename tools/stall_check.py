@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+stall_check.py — do GUI-thread stalls move Chain Arps loop boundaries?
+
+Plays two 8-step snapshots (240 BPM, 1/16 → one loop every 0.5 s) through
+ChainRunner, in-process and via engine_host, while the main thread holds the
+GIL for --stall-ms just before each boundary (stand-in for a long Tk call).
+Reports how far each boundary lands from t0 + k·loop. No daemon is needed:
+the control socket points at a path nobody binds.
+
+Usage:
+  python3 tools/stall_check.py [--stall-ms 200] [--stalls 6]
+"""
+import os, sys, argparse, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SOCK   = "/tmp/gord_stall_check_nobody.sock"
+LOOP_S = 0.5
+
+
+def _calibrate(ms):
+    # sum(range(n)) runs in C without releasing the GIL
+    n = 200_000
+    while True:
+        t0 = time.perf_counter()
+        sum(range(n))
+        dt = time.perf_counter() - t0
+        if dt > 0.02:
+            return int(n * (ms / 1000.0) / dt)
+        n *= 4
+
+
+def _state():
+    from state import AppState
+    st = AppState()
+    st.bpm = 240.0
+    st.subdivision = 16
+    st.chain_runner = None
+    seq = [60, 62, 64, 65, 67, 69, 71, 72]
+    st.chain_arps_list = [
+        {"root": "C", "sequence": seq, "subdivision": 16, "loop_count": 1},
+        {"root": "G", "sequence": [n + 7 for n in seq], "subdivision": 16, "loop_count": 1},
+    ]
+    return st
+
+
+def _run(mode, n_stall, stalls):
+    st = _state()
+    if mode == "host":
+        from engine_host import EngineProxy
+        engine = EngineProxy(st, sock=SOCK)
+    else:
+        from midi_engine import MidiEngine
+        engine = MidiEngine(st, sock=SOCK)
+
+    ticks = []
+    runner = None
+
+    def on_tick(idx, cur, total, active):
+        if active:
+            at = getattr(runner, "last_tick_at", None)
+            ticks.append(at if at is not None else time.monotonic())
+
+    runner = engine.make_chain_runner(st, on_tick, None, global_loops="x")
+    st.chain_runner = runner
+    if mode == "host":
+        time.sleep(1.0)                # let the host finish importing
+    runner.start()
+    while not ticks:
+        time.sleep(0.005)
+    t0 = ticks[0]
+
+    for k in range(2, 2 + stalls):     # stall straddles boundary k
+        wake = t0 + k * LOOP_S - 0.1
+        while time.monotonic() < wake:
+            time.sleep(0.002)
+        sum(range(n_stall))
+    time.sleep(LOOP_S + 0.2)
+    runner.stop()
+    if hasattr(engine, "close"):
+        engine.close()
+
+    got = ticks[: 2 + stalls + 1]
+    late = [(t - (t0 + k * LOOP_S)) * 1e3 for k, t in enumerate(got)]
+    gaps = [(b - a - LOOP_S) * 1e3 for a, b in zip(got, got[1:])]
+    return late, gaps
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--stall-ms", type=float, default=200.0)
+    ap.add_argument("--stalls", type=int, default=6)
+    args = ap.parse_args(argv)
+
+    n = _calibrate(args.stall_ms)
+    t = time.perf_counter(); sum(range(n))
+    print(f"GUI stall: {(time.perf_counter() - t) * 1e3:.0f} ms held GIL, before each of {args.stalls} boundaries")
+    ok = True
+    for mode in ("in-process", "host"):
+        late, gaps = _run(mode, n, args.stalls)
+        worst = max(abs(g) for g in gaps) if gaps else float("nan")
+        print(f"{mode:<11} boundary drift ms: {' '.join(f'{x:6.1f}' for x in late)}")
+        print(f"{'':<11} worst loop-length error: {worst:.1f} ms")
+        if mode == "host" and not worst < args.stall_ms / 4:
+            ok = False
+    print("PASS: host boundaries unaffected by GUI stalls" if ok else "FAIL: host boundaries moved")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
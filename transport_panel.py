@@ -19,6 +19,9 @@ class TransportPanel(tk.Frame):
         • Gate slider + entry
         • Subdivision buttons 1/4-1/32
         • Direction buttons (⇒, ⇐, ⇄, ⇆) with include_turnaround toggling
+        • More directions (⇥ converge, ⇤ diverge, ⤨ shuffle, ⋮ stride);
+          re-click reseeds shuffle / cycles the stride 2→3→4
+        • Root Bank toggle (live key changes switch pre-uploaded patterns)
         • Icon (double-click toggles slave mode)
         • Folder/Get Arp/Get Chord (ExportPanel)
     """
@@ -160,8 +163,33 @@ class TransportPanel(tk.Frame):
             )
             b.pack(pady=2)
             self.dir_buttons.append(b)
+
+        # Second direction column: ⇥ ⇤ ⤨ ⋮ (modes 4-7)
+        dir2_col = tk.Frame(buttons_row, bg=COLORS['bg'])
+        dir2_col.pack(side='left', padx=2)
+        for i, sym in enumerate(["⇥", "⇤", "⤨", "⋮"], start=4):  # 4=Conv,5=Div,6=Shuffle,7=Stride
+            b = tk.Button(
+                dir2_col,
+                text=sym,
+                width=1,
+                command=lambda m=i: self._set_direction(m)
+            )
+            b.pack(pady=2)
+            self.dir_buttons.append(b)
         self._refresh_dir_buttons()
 
+        # ── Root bank toggle ─────────────────────────────────
+        self.bank_var = tk.BooleanVar(value=getattr(self.state, "root_bank_mode", False))
+        tk.Checkbutton(
+            self,
+            text="Root Bank",
+            variable=self.bank_var,
+            font=('Arial', 8),
+            bg=COLORS['bg'],
+            fg=COLORS['text'],
+            command=lambda: setattr(self.state, "root_bank_mode", bool(self.bank_var.get()))
+        ).pack(pady=(0, 2))
+
         # ── Icon (with slave toggle) ─────────────────────────
         try:
             default_img = Image.open(resource_path("assets/gord_icon.png")).resize((100, 100))
@@ -246,6 +274,10 @@ class TransportPanel(tk.Frame):
                 self.state.include_turnaround = False
             else:
                 self.state.include_turnaround = not self.state.include_turnaround
+        elif mode == 6 and self.state.direction_mode == 6:
+            self.state.shuffle_seed = getattr(self.state, "shuffle_seed", 0) + 1   # reshuffle
+        elif mode == 7 and self.state.direction_mode == 7:
+            self.state.stride_n = 2 + (getattr(self.state, "stride_n", 2) - 1) % 3   # 2→3→4→2
         else:
             self.state.direction_mode = mode
             self.state.include_turnaround = True
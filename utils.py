@@ -3,8 +3,9 @@
 import os
 import sys
 import tkinter as tk
+from functools import lru_cache
 from config import NOTE_NAMES, COLORS, NOTE_TO_COLOR
-from theory import SCALES
+from theory import SCALES, SCALE_DEGREES, SCALE_MASKS, SCALE_PCS, MASK_PCS, POPCOUNT
 
 
 # ── Resource Path (for PyInstaller) ──
@@ -33,20 +34,77 @@ def calc_scale_notes(root_name: str, scale_key: str) -> set[int]:
     if not root_name or not scale_key:
         return set()
     root_pc = NOTE_NAMES.index(root_name)
-    ivs     = SCALES[scale_key]["intervals"]      # list of semitone offsets
-    return {(root_pc + iv) % 12 for iv in ivs}
+    return set(MASK_PCS[SCALE_MASKS[scale_key][root_pc]])
+
+def pcs_mask(pcs) -> int:
+    """12-bit pitch-class mask: bit pc is set for every pc in pcs."""
+    mask = 0
+    for pc in pcs or ():
+        mask |= 1 << (int(pc) % 12)
+    return mask
+
+# ── Scale snapping ──
+# Snapping depends only on the note's pitch class, so every 12-bit scale mask
+# gets one 12-entry delta table and one 128-entry note table. Both are built
+# lazily; the LRU keeps the few masks a session actually uses out of 4096.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+_NP_MIN_LEN = 256    # below this the array round-trip costs more than it saves
+
+@lru_cache(maxsize=128)
+def _snap_deltas(mask: int) -> tuple:
+    """Per pitch class: offset to the nearest in-scale pc (+1,-1,+2,-2,+3,-3; else 0)."""
+    if not mask:
+        return (0,) * 12
+    out = []
+    for pc in range(12):
+        d = 0
+        if not mask & (1 << pc):
+            for delta in (1, -1, 2, -2, 3, -3):
+                if mask & (1 << ((pc + delta) % 12)):
+                    d = delta
+                    break
+        out.append(d)
+    return tuple(out)
+
+@lru_cache(maxsize=128)
+def snap_table(mask: int) -> tuple:
+    """128-entry MIDI note → snapped note table for a 12-bit scale mask."""
+    deltas = _snap_deltas(mask)
+    return tuple(n + deltas[n % 12] for n in range(128))
+
+def snap_note(note: int, mask: int) -> int:
+    """Snap one note against a precomputed scale mask (see pcs_mask)."""
+    if 0 <= note < 128:
+        return snap_table(mask)[note]
+    return note + _snap_deltas(mask)[note % 12]
 
 def snap_to_scale(note: int, allowed_pcs: set[int]) -> int:
     """Return the nearest in-scale MIDI note (search ±3 semitones)."""
-    if not allowed_pcs or note % 12 in allowed_pcs:
+    if not allowed_pcs:
         return note
-    for delta in (1, -1, 2, -2, 3, -3):
-        cand = note + delta
-        if cand % 12 in allowed_pcs:
-            return cand
-    return note  # fallback: unchanged
-
+    return snap_note(note, pcs_mask(allowed_pcs))
 
+def snap_notes(notes, allowed_pcs) -> list:
+    """
+    Snap a whole sequence in one call. allowed_pcs is a pc set or a 12-bit
+    mask; None entries (rests) pass through. Uses NumPy for long rest-free
+    sequences when it is installed.
+    """
+    mask = allowed_pcs if isinstance(allowed_pcs, int) else pcs_mask(allowed_pcs)
+    notes = list(notes or ())
+    if not mask:
+        return notes
+    if _np is not None and len(notes) >= _NP_MIN_LEN and None not in notes:
+        arr = _np.asarray(notes, dtype=_np.int64)
+        return (arr + _np.asarray(_snap_deltas(mask))[arr % 12]).tolist()
+    table = snap_table(mask)
+    deltas = _snap_deltas(mask)
+    return [n if n is None else
+            (table[n] if 0 <= n < 128 else n + deltas[n % 12])
+            for n in notes]
 
 
 
@@ -105,154 +163,168 @@ def lighten_color(color):
     return f"#{(r + 255) // 2:02x}{(g + 255) // 2:02x}{(b + 255) // 2:02x}"
 
 
-def best_scales_for_notes(pcs, root_pc=None):
-    """Return list of best matching scales as [(label string, root_pc)]."""
-    matches = []
-    input_set = set(pcs)
-
-    # Tag MODES by convention — you can refine this list
-    mode_keys = [k for k in SCALES if 'mode' in k.lower() or 'dorian' in k.lower()
-                                          or 'phrygian' in k.lower()
-                                          or 'lydian' in k.lower()
-                                          or 'mixolydian' in k.lower()
-                                          or 'aeolian' in k.lower()
-                                          or 'locrian' in k.lower()]
-
-    # Simple "pro scales" substrings → we boost these slightly in sort
-    pro_scale_keywords = ['harmonic minor', 'melodic minor', 'altered', 'phrygian dom', 'phrygian dominant']
-
-    for key, scale_def in SCALES.items():
-        ivs = scale_def["intervals"]
-        scale_notes = [(root_pc or 0) + iv for iv in ivs]
-        scale_notes_pc = {n % 12 for n in scale_notes}
-
-        covered      = len(input_set & scale_notes_pc)
-        total_scale  = len(scale_notes_pc)
-        coverage_pct = covered / total_scale if total_scale else 0
-
-        # Classify match type
-        if scale_notes_pc.issubset(input_set):
-            match_type = 'EXACT'
-            extra_notes = set()
-        elif input_set.issubset(scale_notes_pc):
-            match_type = 'SUB'
-            extra_notes = scale_notes_pc - input_set
-        else:
-            match_type = 'PART'
-            extra_notes = scale_notes_pc - input_set
-
-        # Check if pro-scale
-        display_name = scale_def.get('display_name', key)
-        is_pro = any(s in display_name.lower() for s in pro_scale_keywords)
-
-        matches.append((
-            match_type, coverage_pct, len(extra_notes), total_scale,
-            covered, display_name,
-            (root_pc or 0) % 12, sorted(extra_notes),
-            key in mode_keys,  # is_mode
-            is_pro             # is_pro
-        ))
-
-    # Sort priority:
-    match_priority = {'EXACT': 0, 'SUB': 1, 'PART': 2}
-
-    # Split into groups for display order
-    exact_sub = []
-    part_non_mode = []
-    part_mode = []
-
-    matches.sort(key=lambda x: (
-        match_priority[x[0]],
-        -x[1],     # coverage_pct DESC
-        -x[9],     # pro scales first when coverage is tied
-        x[2],      # fewest extra notes ASC
-        x[3]       # smallest scale first
-    ))
-
-
-    for m in matches:
-        if m[0] == 'PART' and m[8]:  # PART and is mode
-            part_mode.append(m)
-        elif m[0] == 'PART':
-            part_non_mode.append(m)
-        else:
-            exact_sub.append(m)
-
-    # Build display
+# Tag MODES by convention — you can refine this list
+_MODE_KEYS = frozenset(k for k in SCALES if 'mode' in k.lower() or 'dorian' in k.lower()
+                                               or 'phrygian' in k.lower()
+                                               or 'lydian' in k.lower()
+                                               or 'mixolydian' in k.lower()
+                                               or 'aeolian' in k.lower()
+                                               or 'locrian' in k.lower())
+
+# Simple "pro scales" substrings → we boost these slightly in sort
+_PRO_SCALE_KEYWORDS = ['harmonic minor', 'melodic minor', 'altered', 'phrygian dom', 'phrygian dominant']
+_PRO_SCALE_KEYS = frozenset(k for k, d in SCALES.items()
+                            if any(s in d.get('display_name', k).lower() for s in _PRO_SCALE_KEYWORDS))
+
+# (scale × 12 roots) matrix, scale-major: row = scale_idx * 12 + root
+_SCALE_KEYS     = tuple(SCALE_MASKS)
+_SCALE_ROW_MASK = tuple(SCALE_MASKS[k][r] for k in _SCALE_KEYS for r in range(12))
+_SCALE_ROW_PRO  = tuple(k in _PRO_SCALE_KEYS for k in _SCALE_KEYS for _ in range(12))
+_SCALE_ROW_MODE = tuple(k in _MODE_KEYS for k in _SCALE_KEYS for _ in range(12))
+if _np is not None:
+    _NP_ROW_MASK = _np.array(_SCALE_ROW_MASK, dtype=_np.int64)
+    _NP_ROW_PRO  = _np.array(_SCALE_ROW_PRO, dtype=_np.int64)
+    _NP_POPCOUNT = _np.array(POPCOUNT, dtype=_np.int64)
+
+_MATCH_TYPES = ('EXACT', 'SUB', 'PART')
+
+# Sort key packed into one int so ranking is a C-level sort of ints:
+#   type | coverage rank (DESC) | not-pro | extra count | scale size | row
+_COV_VALUES = sorted({(c / t if t else 0) for t in range(13) for c in range(t + 1)}, reverse=True)
+_COV_RANK   = tuple(tuple(_COV_VALUES.index(c / t if t else 0) for c in range(t + 1)) for t in range(13))
+# Field widths follow the tables, so a growing scales.json can't overlap fields.
+_ROW_BITS   = max(1, (len(_SCALE_ROW_MASK) - 1).bit_length())
+_KEY_ROW    = (1 << _ROW_BITS) - 1
+_TOT_SHIFT  = _ROW_BITS                                   # scale size 0..12: 4 bits
+_EXTRA_SHIFT = _TOT_SHIFT + 4                             # extra count 0..12: 4 bits
+_PRO_SHIFT  = _EXTRA_SHIFT + 4                            # not-pro: 1 bit
+_COV_SHIFT  = _PRO_SHIFT + 1
+_TYPE_SHIFT = _COV_SHIFT + max(1, (len(_COV_VALUES) - 1).bit_length())
+
+# Modes are rotations of each other, so the 12-root matrix holds far fewer
+# distinct masks than rows; the per-mask part of the key is computed once.
+_UNIQUE_MASKS = tuple(dict.fromkeys(_SCALE_ROW_MASK))
+_ROW_UID      = tuple(_UNIQUE_MASKS.index(m) for m in _SCALE_ROW_MASK)
+_ROW_CONST    = tuple(((not pro) << _PRO_SHIFT) | row for row, pro in enumerate(_SCALE_ROW_PRO))
+
+if _np is not None:
+    _NP_COV_RANK = _np.zeros((13, 13), dtype=_np.int64)
+    for _t in range(13):
+        for _c in range(_t + 1):
+            _NP_COV_RANK[_t, _c] = _COV_RANK[_t][_c]
+
+
+
+def _rank_scale_rows(in_mask, rows):
+    """
+    Rank matrix rows against the input mask in display priority:
+    EXACT < SUB < PART, coverage DESC, pro first, fewest extra, smallest
+    scale, then row order. Returns the sorted packed int keys.
+    """
+    if _np is not None and len(rows) > 24:
+        idx   = _np.asarray(rows, dtype=_np.int64)
+        masks = _NP_ROW_MASK[idx]
+        cov   = _NP_POPCOUNT[masks & in_mask]
+        tot   = _NP_POPCOUNT[masks]
+        extra = masks & ~in_mask & 0xFFF
+        typ   = _np.where(extra == 0, 0, _np.where((in_mask & ~masks & 0xFFF) == 0, 1, 2))
+        keys  = ((typ << _TYPE_SHIFT) | (_NP_COV_RANK[tot, cov] << _COV_SHIFT)
+                 | ((1 - _NP_ROW_PRO[idx]) << _PRO_SHIFT) | (_NP_POPCOUNT[extra] << _EXTRA_SHIFT)
+                 | (tot << _TOT_SHIFT) | idx)
+        return _np.sort(keys).tolist()
+
+    pop, cov_rank = POPCOUNT, _COV_RANK
+    base = {}
+    for uid in {_ROW_UID[row] for row in rows}:
+        s_mask = _UNIQUE_MASKS[uid]
+        total  = pop[s_mask]
+        extra  = s_mask & ~in_mask
+        typ    = 0 if not extra else (1 if not in_mask & ~s_mask else 2)
+        base[uid] = ((typ << _TYPE_SHIFT) | (cov_rank[total][pop[in_mask & s_mask]] << _COV_SHIFT)
+                     | (pop[extra] << _EXTRA_SHIFT) | (total << _TOT_SHIFT))
+    row_uid, row_const = _ROW_UID, _ROW_CONST
+    keys = [base[row_uid[row]] | row_const[row] for row in rows]
+    keys.sort()
+    return keys
+
+
+def _scale_labels(in_mask, keys, limit=6):
+    # display order: EXACT/SUB, then PART non-modes, then PART modes
+    part = [k for k in keys if k >> _TYPE_SHIFT == 2]
+    groups = ([k for k in keys if k >> _TYPE_SHIFT != 2],
+              [k for k in part if not _SCALE_ROW_MODE[k & _KEY_ROW]],
+              [k for k in part if _SCALE_ROW_MODE[k & _KEY_ROW]])
     result = []
-
-    def add_to_result(group):
-        for match_type, coverage_pct, num_extra, total_scale, covered, display_name, scale_root_pc, extra_notes, _, _ in group:
+    for group in groups:
+        for k in group:
+            if len(result) >= limit:
+                return result
+            row = k & _KEY_ROW
+            s_mask = _SCALE_ROW_MASK[row]
+            key = _SCALE_KEYS[row // 12]
+            display_name = SCALES[key].get('display_name', key)
+            extra_notes = sorted(MASK_PCS[s_mask & ~in_mask])
             if extra_notes:
                 extra_str = " + " + " ".join(NOTE_NAMES[n] for n in extra_notes)
             else:
                 extra_str = ""
+            tag = _MATCH_TYPES[k >> _TYPE_SHIFT]
+            label = f"{display_name} [{tag}]{extra_str}  {POPCOUNT[in_mask & s_mask]}/{POPCOUNT[s_mask]}"
+            result.append((label, row % 12))
+    return result
 
-            match_tag = f"[{match_type}]"
-            label = f"{display_name} {match_tag}{extra_str}  {covered}/{total_scale}"
-            result.append((label, scale_root_pc))
 
-            if len(result) >= 6:
-                break
+@lru_cache(maxsize=512)
+def _best_scales(in_mask, root, limit):
+    # root None = all 12 roots; results depend only on (mask, root, limit)
+    if root is None:
+        rows = range(len(_SCALE_ROW_MASK))
+    else:
+        rows = range(root, len(_SCALE_ROW_MASK), 12)
+    return tuple(_scale_labels(in_mask, _rank_scale_rows(in_mask, rows), limit))
 
-    # Add in proper order
-    add_to_result(exact_sub)
-    if len(result) < 6:
-        add_to_result(part_non_mode)
-    if len(result) < 6:
-        add_to_result(part_mode)
 
-    return result
+def best_scales_for_notes(pcs, root_pc=None):
+    """Return list of best matching scales as [(label string, root_pc)]."""
+    return list(_best_scales(pcs_mask(pcs), (root_pc or 0) % 12, 6))
+
+
+def best_scales_any_root(pcs, limit=6):
+    """
+    Like best_scales_for_notes, but searches every scale in all 12 keys:
+    "what scales in any key contain these notes". Same EXACT/SUB/PART
+    labels and ordering; ties keep scale order, then root order.
+    """
+    return list(_best_scales(pcs_mask(pcs), None, limit))
 
 
 # ── Implied Chord Helper ──
 def find_implied_chord(sel_mask, bass_pc, state):
     """Return name of implied chord (first best match), or None."""
-    from theory import NOTE_NAMES, CHORDS
+    from theory import NOTE_NAMES
+    from chord_index import get_index
 
-    pcs       = [i for i in range(12) if sel_mask & (1 << i)]
-    sel_set   = set(pcs)
-    N         = len(sel_set)
+    sel_mask  &= 0xFFF
     user_root = getattr(state, "original_root", None)
 
-    def pc_set(r, ivs):
-        return {(r + iv) % 12 for iv in ivs}
-
     best = None
     best_score = -1
 
-    for key, meta in CHORDS.items():
-        if "alias_of" in meta or meta["length"] > N:
-            continue
-        ivs = meta["intervals"]
-
-        for root in range(12):
-            pcs_ch = pc_set(root, ivs)
-
-            if not (pcs_ch.issubset(sel_set) or sel_set.issubset(pcs_ch)):
-                continue
-
-            matches = len(pcs_ch & sel_set)
-            is_exact = (matches == len(pcs_ch) and matches == N)
-
-            disp = (meta.get("display_name", key)
-                       .replace("Diminished", "dim")
-                       .replace("Augmented",  "aug")
-                       .replace("Major",      "maj")
-                       .replace("Minor",      "min"))
-
-            name = NOTE_NAMES[root] + disp
+    # chord ⊆ selection or selection ⊆ chord, in CHORDS × root order
+    for m in get_index().matches(sel_mask):
+        matches = POPCOUNT[m.mask & sel_mask]
+        is_exact = m.mask == sel_mask
 
-            # Prefer EXACT > 7/7 > 6/7 > ... > 3/7 etc
-            score = (10 if is_exact else 0) + matches
+        # Prefer EXACT > 7/7 > 6/7 > ... > 3/7 etc
+        score = (10 if is_exact else 0) + matches
 
-            # Bias toward user-selected root (if applicable)
-            if NOTE_NAMES[root] == user_root:
-                score += 3  # ← small but strong enough bias
+        # Bias toward user-selected root (if applicable)
+        if NOTE_NAMES[m.root] == user_root:
+            score += 3  # ← small but strong enough bias
 
-            if score > best_score:
-                best_score = score
-                best = name
+        if score > best_score:
+            best_score = score
+            best = NOTE_NAMES[m.root] + m.disp
 
     return best
 
@@ -322,6 +394,9 @@ class FancyTooltip:
         self.wraplength = 300  # pixels
         self.id = None
         self.tw = None
+        self._pool_tw = None
+        self._pool_frame = None
+        self._rows = []            # [[row frame, [[label, (text, fg), packed], ...], packed]]
         widget.bind("<Enter>", self._enter)
         widget.bind("<Leave>", self._leave)
         widget.bind("<ButtonPress>", self._leave)
@@ -382,54 +457,73 @@ class FancyTooltip:
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 20
 
-        self.tw = tk.Toplevel(self.widget)
-        self.tw.wm_overrideredirect(True)
+        # One Toplevel + pooled row/label widgets, reconfigured per show
+        if self._pool_tw is None or not self._pool_tw.winfo_exists():
+            self._rows = []
+            self._pool_tw = tk.Toplevel(self.widget)
+            self._pool_tw.wm_overrideredirect(True)
+            self._pool_frame = tk.Frame(self._pool_tw, bg="black", bd=0)
+            self._pool_frame.pack()
+        self.tw = self._pool_tw
         self.tw.wm_geometry(f"+{x}+{y}")
-        frame = tk.Frame(self.tw, bg="black", bd=0)
-        frame.pack()
-
-        for line, color in text_lines:
-            # Split label at last space → "Name 3/7"
-            if ' ' in line:
-                prefix, counter = line.rsplit(' ', 1)
-            else:
-                prefix, counter = line, ""
-
-            row = tk.Frame(frame, bg="black")
-            row.pack(anchor='w')
-
-            # If prefix contains ' + ' → this is a best_scales_for_notes style label
-            if ' + ' in prefix:
-                main_label, plus_part = prefix.split(' + ', 1)
-
-                # Main label
-                tk.Label(row, text=main_label + " ", justify='left',
-                         font=("Fixedsys", 10), bg="black", fg=color,
-                         anchor='w', padx=0, pady=0).pack(side='left')
-
-                # Notes after +
-                for note_str in plus_part.split():
-                    note_color = NOTE_TO_COLOR.get(note_str, 'white')
-                    tk.Label(row, text=note_str + " ", justify='left',
-                             font=("Fixedsys", 10), bg="black", fg=note_color,
-                             anchor='w', padx=0, pady=0).pack(side='left')
-
-            else:
-                # NORMAL LABEL → show as before (for interval nickname lists, etc.)
-                tk.Label(row, text=prefix + " ", justify='left',
-                         font=("Fixedsys", 10), bg="black", fg=color,
-                         anchor='w', padx=0, pady=0).pack(side='left')
-
-            if counter:
-                tk.Label(row, text=counter, justify='left',
-                         font=("Fixedsys", 10), bg="black", fg="white",
-                         anchor='w', padx=0, pady=0).pack(side='left')
 
+        lines = [self._segments(line, color) for line, color in text_lines]
+        for i, segs in enumerate(lines):
+            if i == len(self._rows):
+                self._rows.append([tk.Frame(self._pool_frame, bg="black"), [], False])
+            row, labels, _ = self._rows[i]
+            for j, (text, fg) in enumerate(segs):
+                if j == len(labels):
+                    labels.append([tk.Label(row, justify='left', font=("Fixedsys", 10), bg="black",
+                                            anchor='w', padx=0, pady=0), None, False])
+                slot = labels[j]
+                if slot[1] != (text, fg):
+                    slot[0].config(text=text, fg=fg)
+                    slot[1] = (text, fg)
+                if not slot[2]:
+                    slot[0].pack(side='left')     # visible labels stay a prefix → order kept
+                    slot[2] = True
+            for slot in labels[len(segs):]:
+                if slot[2]:
+                    slot[0].pack_forget()
+                    slot[2] = False
+            if not self._rows[i][2]:
+                row.pack(anchor='w')
+                self._rows[i][2] = True
+        for r in self._rows[len(lines):]:
+            if r[2]:
+                r[0].pack_forget()
+                r[2] = False
+        self.tw.deiconify()
+
+    @staticmethod
+    def _segments(line, color):
+        """(text, fg) label pieces for one tooltip line."""
+        # Split label at last space → "Name 3/7"
+        if ' ' in line:
+            prefix, counter = line.rsplit(' ', 1)
+        else:
+            prefix, counter = line, ""
+
+        segs = []
+        # If prefix contains ' + ' → this is a best_scales_for_notes style label
+        if ' + ' in prefix:
+            main_label, plus_part = prefix.split(' + ', 1)
+            segs.append((main_label + " ", color))
+            # Notes after +
+            for note_str in plus_part.split():
+                segs.append((note_str + " ", NOTE_TO_COLOR.get(note_str, 'white')))
+        else:
+            # NORMAL LABEL → show as before (for interval nickname lists, etc.)
+            segs.append((prefix + " ", color))
 
+        if counter:
+            segs.append((counter, "white"))
+        return segs
 
     def _hide(self):
         if self.tw:
-            self.tw.destroy()
+            self.tw.withdraw()          # kept for the next show
             self.tw = None
             
 
@@ -460,8 +554,8 @@ class KeyMapper:
 
         key_pc   = NOTE_NAMES.index(state.key_anchor)          # locked tonic
         root_pc  = NOTE_NAMES.index(state.original_root)       # live root
-        ivs_key  = SCALES[state.scale]["intervals"]            # e.g. [0,2,4,5,7,9,11]
-        key_pcs  = [(key_pc + iv) % 12 for iv in ivs_key]
+        key_pcs  = SCALE_PCS[state.scale][key_pc]              # degree-ordered pcs
+        key_mask = SCALE_MASKS[state.scale][key_pc]
 
         try:
             root_deg = key_pcs.index(root_pc)                  # degree of root
@@ -474,7 +568,7 @@ class KeyMapper:
                 continue
 
             note_pc = (root_pc + iv) % 12
-            if note_pc not in key_pcs:
+            if not key_mask & (1 << note_pc):
                 continue                                        # out-of-key
 
             deg_off = (key_pcs.index(note_pc) - root_deg) % len(key_pcs)
@@ -486,22 +580,23 @@ class KeyMapper:
     # ----------------------------------------------------------------
     def transpose(self, new_root_name: str) -> list[int]:
         new_root_pc = NOTE_NAMES.index(new_root_name)
-        ivs_key     = SCALES[self.scale]["intervals"]
-        key_pcs     = [(self.key_pc + iv) % 12 for iv in ivs_key]
+        key_pcs     = SCALE_PCS[self.scale][self.key_pc]   # degree-ordered pcs
+        key_mask    = SCALE_MASKS[self.scale][self.key_pc]
 
         # snap new root up to nearest in-key pc
-        if new_root_pc in key_pcs:
+        if key_mask & (1 << new_root_pc):
             root_deg, oct_shift = key_pcs.index(new_root_pc), 0
         else:
             delta = 1
-            while (new_root_pc + delta) % 12 not in key_pcs:
+            while not key_mask & (1 << ((new_root_pc + delta) % 12)):
                 delta += 1
             root_deg  = key_pcs.index((new_root_pc + delta) % 12)
             oct_shift = 1 if new_root_pc + delta >= 12 else 0
 
         notes = []
+        n_deg = len(key_pcs)
         for off, octv in self.pattern:
-            pc = (self.key_pc + ivs_key[(root_deg + off) % len(ivs_key)]) % 12
+            pc = key_pcs[(root_deg + off) % n_deg]
             notes.append(((octv + oct_shift + 1) * 12) + pc)
 
         return notes
@@ -514,8 +609,4 @@ def interval_to_degree(iv: int, scale_key: str) -> int | None:
     """
     if not scale_key:
         return None
-    iv_mod = iv % 12
-    for idx, scale_iv in enumerate(SCALES[scale_key]['intervals']):
-        if scale_iv % 12 == iv_mod:
-            return idx
-    return None
+    return SCALE_DEGREES[scale_key].get(iv % 12)